@@ -0,0 +1,91 @@
+"""Compare the default and FAST_SERIALIZATION paths of the entity list endpoints.
+
+Runs on synthetic programmer rows shaped like the repository output, so no
+database is needed:
+
+  PYTHONPATH=src/staffing_graphrag uv run scripts/benchmark_serialization.py
+
+The default path mirrors what the endpoint does today: validate every row into
+ProgrammerRead, let FastAPI dump, re-validate against response_model and encode
+with the stdlib json module. The fast path builds models with model_construct and
+encodes them with orjson.
+"""
+
+import json
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import TypeAdapter
+from shared_types.programmer_types import ProgrammerRead
+
+from core.config import config
+from core.serialization import build_model, dumps
+
+SIZES = (100, 1_000, 10_000)
+REPEATS = 7
+
+LEVELS = ("Expert", "Advanced", "Intermediate", "Beginner")
+
+
+def make_rows(count: int) -> list[dict[str, Any]]:
+  return [
+    {
+      "id": f"Programmer {i:06d}",
+      "name": f"Programmer {i:06d}",
+      "location": "Berlin",
+      "skills": {
+        level: [f"Skill {(i + n) % 200}" for n in range(j, 12, 4)]
+        for j, level in enumerate(LEVELS)
+      },
+      "is_assigned": i % 3 == 0,
+      "current_project": f"Project {i % 50}" if i % 3 == 0 else None,
+      "implied_skills": [f"Skill {(i * 7) % 200}", f"Skill {(i * 11) % 200}"],
+    }
+    for i in range(count)
+  ]
+
+
+adapter = TypeAdapter(list[ProgrammerRead])
+
+
+def default_path(rows: list[dict[str, Any]]) -> bytes:
+  config.FAST_SERIALIZATION = False
+  models = [build_model(ProgrammerRead, row) for row in rows]
+  # FastAPI: dump returned models, validate against response_model, serialize
+  content = adapter.validate_python([model.model_dump() for model in models])
+  jsonable = adapter.dump_python(content, mode="json")
+  return json.dumps(
+    jsonable, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+  ).encode("utf-8")
+
+
+def fast_path(rows: list[dict[str, Any]]) -> bytes:
+  config.FAST_SERIALIZATION = True
+  return dumps([build_model(ProgrammerRead, row) for row in rows])
+
+
+def measure(path: Callable[[list[dict[str, Any]]], bytes], rows: list[dict]) -> float:
+  timings = []
+  for _ in range(REPEATS):
+    start = time.perf_counter()
+    path(rows)
+    timings.append((time.perf_counter() - start) * 1000)
+  return statistics.median(timings)
+
+
+def main() -> None:
+  print(f"{'rows':>8} {'default ms':>12} {'fast ms':>10} {'speedup':>8}")
+  for size in SIZES:
+    rows = make_rows(size)
+    assert json.loads(default_path(rows)) == json.loads(fast_path(rows))  # noqa: S101
+
+    default_ms = measure(default_path, rows)
+    fast_ms = measure(fast_path, rows)
+    speedup = default_ms / fast_ms
+    print(f"{size:>8} {default_ms:>12.1f} {fast_ms:>10.1f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,191 @@
+"""Replay the recorded /query traffic against the current build.
+
+Run from backend/ with the app modules importable, e.g.
+
+  PYTHONPATH=src/staffing_graphrag uv run scripts/replay_query_log.py --llm stub
+
+With ``--llm stub`` a deterministic model returns the logged Cypher and a fixed
+answer, isolating pipeline and database latency from the LLM. ``--llm openai``
+uses the configured model. The Cypher caches are bypassed unless ``--keep-caches``
+is given, so generation is measured on every question.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import re
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from core.config import config
+from services import query_service
+from services.cypher_cache import normalize_question
+from services.query_log import get_query_log
+from services.token_budget import estimate_tokens
+
+STAGES = ("generation", "execution", "qa", "total")
+
+
+class ReplayChatModel(BaseChatModel):
+  """Deterministic stand-in LLM: answers generation prompts with the logged Cypher."""
+
+  cypher_by_question: dict[str, str]
+
+  @property
+  def _llm_type(self) -> str:
+    return "replay-stub"
+
+  def _generate(
+    self,
+    messages: list[BaseMessage],
+    stop: list[str] | None = None,
+    run_manager: CallbackManagerForLLMRun | None = None,
+    **kwargs: object,
+  ) -> ChatResult:
+    prompt = str(messages[-1].content)
+    if "The question is:" in prompt:
+      question = prompt.rsplit("The question is:", 1)[1]
+      text = self.cypher_by_question.get(normalize_question(question), "")
+    else:
+      text = "Replayed answer."
+
+    message = AIMessage(
+      content=text,
+      response_metadata={"model_name": self._llm_type},
+      usage_metadata={
+        "input_tokens": estimate_tokens(prompt),
+        "output_tokens": estimate_tokens(text),
+        "total_tokens": estimate_tokens(prompt) + estimate_tokens(text),
+      },
+    )
+    return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+  """Nearest-rank percentile."""
+  if not values:
+    return None
+  ordered = sorted(values)
+  return round(ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)], 2)
+
+
+def summarize(samples: dict[str, list[float]]) -> dict[str, dict[str, Any]]:
+  return {
+    stage: {
+      "count": len(samples[stage]),
+      "p50": percentile(samples[stage], 50),
+      "p95": percentile(samples[stage], 95),
+      "p99": percentile(samples[stage], 99),
+    }
+    for stage in STAGES
+  }
+
+
+def same_cypher(a: str | None, b: str | None) -> bool:
+  return re.sub(r"\s+", " ", a or "").strip() == re.sub(r"\s+", " ", b or "").strip()
+
+
+async def replay(args: argparse.Namespace) -> dict[str, Any]:
+  entries = [entry for entry in get_query_log().entries(args.limit) if entry["success"]]
+  if not entries:
+    raise SystemExit("The query log is empty; nothing to replay.")
+
+  config.QUERY_LOG_ENABLED = False
+  if not args.keep_caches:
+    config.QUERY_CYPHER_CACHE_ENABLED = False
+    config.QUERY_SEMANTIC_CACHE_ENABLED = False
+
+  llm = None
+  if args.llm == "stub":
+    llm = ReplayChatModel(
+      cypher_by_question={
+        normalize_question(entry["question"]): entry["cypher"] or ""
+        for entry in entries
+      }
+    )
+  query_service.init_qa_chain(llm)
+
+  logged: dict[str, list[float]] = defaultdict(list)
+  for entry in entries:
+    for stage in STAGES:
+      if entry[f"{stage}_ms"] is not None:
+        logged[stage].append(entry[f"{stage}_ms"])
+
+  replayed: dict[str, list[float]] = defaultdict(list)
+  cypher_runs: dict[int, list[str | None]] = defaultdict(list)
+  failures = 0
+  tokens = {"input_tokens": 0, "output_tokens": 0}
+
+  for run in range(args.runs):
+    for entry in entries:
+      result = await query_service.process_query(entry["question"])
+      if not result["success"]:
+        failures += 1
+        continue
+
+      cypher_runs[entry["id"]].append(result.get("cypher_query"))
+      for stage, value in (result.get("timings") or {}).items():
+        if value is not None:
+          replayed[stage].append(value)
+      for key in tokens:
+        tokens[key] += (result.get("usage") or {}).get(key, 0)
+    print(f"Run {run + 1}/{args.runs} done")
+
+  by_id = {entry["id"]: entry for entry in entries}
+  changed_vs_log = sum(
+    not same_cypher(cypher, by_id[entry_id]["cypher"])
+    for entry_id, cyphers in cypher_runs.items()
+    for cypher in cyphers
+  )
+  unstable = sum(
+    any(not same_cypher(cypher, cyphers[0]) for cypher in cyphers[1:])
+    for cyphers in cypher_runs.values()
+  )
+  replays = sum(len(cyphers) for cyphers in cypher_runs.values())
+
+  return {
+    "metadata": {
+      "run_at": datetime.now().isoformat(),
+      "llm": args.llm,
+      "runs": args.runs,
+      "questions": len(entries),
+      "caches": args.keep_caches,
+    },
+    "latency_ms": {"logged": summarize(logged), "replayed": summarize(replayed)},
+    "cypher_change_rate": {
+      "vs_log": round(changed_vs_log / replays, 3) if replays else None,
+      "between_runs": round(unstable / len(cypher_runs), 3)
+      if args.runs > 1 and cypher_runs
+      else None,
+    },
+    "failures": failures,
+    "tokens": tokens,
+  }
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument("--llm", choices=["stub", "openai"], default="stub")
+  parser.add_argument("--runs", type=int, default=1)
+  parser.add_argument("--limit", type=int, default=None)
+  parser.add_argument("--keep-caches", action="store_true")
+  parser.add_argument("--output", type=Path, default=Path("query_replay_report.json"))
+  args = parser.parse_args()
+
+  report = asyncio.run(replay(args))
+  args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+  print("Replay complete.")
+  print(json.dumps({k: v for k, v in report.items() if k != "metadata"}, indent=2))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,46 @@
+from collections.abc import Callable
+
+from fastapi import HTTPException, Query, Request, Response
+from pydantic import BaseModel
+
+from services.data_version import data_etag
+
+
+def not_modified(request: Request, response: Response) -> None:
+  """Tag the response with the graph data version; 304 if the client has it already.
+
+  Runs before the endpoint, so a matching If-None-Match never reaches Neo4j.
+  """
+  etag = data_etag()
+  if_none_match = request.headers.get("if-none-match", "")
+  if etag in {tag.strip() for tag in if_none_match.split(",")} or if_none_match == "*":
+    raise HTTPException(status_code=304, headers={"ETag": etag})
+  response.headers["ETag"] = etag
+
+
+def field_selector(
+  model: type[BaseModel], *always: str
+) -> Callable[[str | None], set[str] | None]:
+  """Build a dependency parsing a comma-separated ``fields`` sparse fieldset.
+
+  Unknown names are rejected with 400; the ``always`` fields are added to any
+  selection (e.g. the id that pagination relies on).
+  """
+
+  def select_fields(
+    fields: str | None = Query(
+      None,
+      description=f"Comma-separated {model.__name__} fields to return; all if omitted",
+    ),
+  ) -> set[str] | None:
+    if fields is None:
+      return None
+    selected = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = selected - model.model_fields.keys()
+    if unknown:
+      raise HTTPException(
+        status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+      )
+    return selected | set(always)
+
+  return select_fields
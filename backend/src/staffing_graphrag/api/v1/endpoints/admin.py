@@ -1,8 +1,12 @@
 import logging
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 
+from repositories.location_repository import geocode_locations
 from services.admin_service import reset_database
+from services.experience_service import recompute_proven_experience
+from services.skill_similarity_service import rebuild_skill_similarity
+from services.skill_taxonomy_service import sync_skill_taxonomy
 
 router = APIRouter(prefix="/admin")
 logger = logging.getLogger(__name__)
@@ -23,3 +27,43 @@ async def reset_db_endpoint() -> dict:
       status_code=500,
       detail="Failed to reset database",
     ) from None
+
+
+@router.post("/locations/geocode", status_code=status.HTTP_200_OK)
+async def geocode_locations_endpoint() -> dict:
+  """Geocode all Location nodes without coordinates using the bundled gazetteer."""
+  try:
+    return geocode_locations()
+  except Exception:
+    logger.exception("Location geocoding failed")
+    raise HTTPException(
+      status_code=500,
+      detail="Failed to geocode locations",
+    ) from None
+
+
+@router.post("/experience/recompute", status_code=status.HTTP_202_ACCEPTED)
+async def recompute_experience_endpoint(background_tasks: BackgroundTasks) -> dict:
+  """Schedule a full rebuild of the proven experience scores of all people."""
+  background_tasks.add_task(recompute_proven_experience)
+  return {"status": "accepted", "message": "Proven experience recomputation scheduled"}
+
+
+@router.post("/skills/similarity/rebuild", status_code=status.HTTP_202_ACCEPTED)
+async def rebuild_skill_similarity_endpoint(background_tasks: BackgroundTasks) -> dict:
+  """Schedule a rebuild of the skill similarity matrix from graph co-occurrence."""
+  background_tasks.add_task(rebuild_skill_similarity)
+  return {"status": "accepted", "message": "Skill similarity rebuild scheduled"}
+
+
+@router.post("/skills/taxonomy/sync", status_code=status.HTTP_200_OK)
+async def sync_skill_taxonomy_endpoint() -> dict:
+  """Reload the skill taxonomy file into IMPLIES relationships."""
+  try:
+    return sync_skill_taxonomy()
+  except Exception:
+    logger.exception("Skill taxonomy sync failed")
+    raise HTTPException(
+      status_code=500,
+      detail="Failed to sync skill taxonomy",
+    ) from None
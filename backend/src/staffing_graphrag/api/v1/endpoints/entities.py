@@ -1,41 +1,175 @@
-from typing import Literal
+from collections.abc import Sequence
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from shared_types.programmer_types import ProgrammerRead
 from shared_types.project_types import ProjectRead
 from shared_types.rfp_types import RFPRead
+from shared_types.search_types import EntityType, SearchResults
 
-from repositories import programmer_repository, project_repository, rfp_repository
+from api.v1.dependencies import field_selector, not_modified
+from api.v1.responses import list_response
+from core.config import config
+from core.models.cv_models import ProficiencyLevel
+from core.models.project_models import ProjectStatus
+from repositories import (
+  programmer_repository,
+  project_repository,
+  rfp_repository,
+  search_repository,
+)
 
-router = APIRouter(prefix="/entities")
+router = APIRouter(prefix="/entities", dependencies=[Depends(not_modified)])
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+Cursor = Annotated[
+  str | None, Query(description="Return entities whose id sorts after this one")
+]
+Limit = Annotated[int, Query(ge=1, le=config.ENTITIES_MAX_PAGE_SIZE)]
+
+
+def _set_next_cursor(
+  response: Response,
+  page: Sequence[ProgrammerRead | ProjectRead | RFPRead],
+  limit: int,
+) -> None:
+  """Advertise the cursor of the next page when this one came back full."""
+  if len(page) == limit:
+    response.headers[NEXT_CURSOR_HEADER] = page[-1].id
 
 
 @router.get("/programmers", response_model=list[ProgrammerRead])
-async def get_programmers(
-  status: Literal["available", "assigned"] | None = Query(
-    None, description="Filter by assignment status"
-  ),
-) -> list[ProgrammerRead]:
-  """Get all programmers based on status."""
+async def get_programmers(  # noqa: PLR0913
+  response: Response,
+  fields: Annotated[set[str] | None, Depends(field_selector(ProgrammerRead, "id"))],
+  *,
+  status: Annotated[
+    Literal["available", "assigned"] | None,
+    Query(description="Filter by assignment status"),
+  ] = None,
+  skill: Annotated[str | None, Query(description="Only people with this skill")] = None,
+  proficiency: Annotated[
+    ProficiencyLevel | None,
+    Query(description="Required proficiency (of `skill` when given)"),
+  ] = None,
+  location: Annotated[
+    str | None, Query(description="Only people in this location")
+  ] = None,
+  cursor: Cursor = None,
+  limit: Limit = config.ENTITIES_PAGE_SIZE,
+) -> list[ProgrammerRead] | Response:
+  """Get a page of programmers, filtered in the database and ordered by id.
+
+  The id to pass as `cursor` for the next page is returned in the X-Next-Cursor
+  header; it is absent on the last page.
+  """
   try:
-    return programmer_repository.get_programmers(status)
+    page = programmer_repository.get_programmers(
+      status,
+      skill=skill,
+      proficiency=proficiency,
+      location=location,
+      cursor=cursor,
+      limit=limit,
+      fields=fields,
+    )
   except Exception as e:
     raise HTTPException(status_code=500, detail=str(e)) from None
 
+  _set_next_cursor(response, page, limit)
+  return list_response(page, response, fields)
+
 
 @router.get("/projects", response_model=list[ProjectRead])
-async def get_projects() -> list[ProjectRead]:
-  """Get all projects (historical and active) with their team and tech stack."""
+async def get_projects(  # noqa: PLR0913
+  response: Response,
+  fields: Annotated[set[str] | None, Depends(field_selector(ProjectRead, "id"))],
+  *,
+  status: Annotated[
+    ProjectStatus | None, Query(description="Filter by project status")
+  ] = None,
+  skill: Annotated[
+    str | None, Query(description="Only projects requiring this skill")
+  ] = None,
+  cursor: Cursor = None,
+  limit: Limit = config.ENTITIES_PAGE_SIZE,
+) -> list[ProjectRead] | Response:
+  """Get a page of projects (historical and active) with their team and tech stack."""
+  try:
+    page = project_repository.get_projects(
+      status, skill=skill, cursor=cursor, limit=limit, fields=fields
+    )
+  except Exception as e:
+    raise HTTPException(status_code=500, detail=str(e)) from None
+
+  _set_next_cursor(response, page, limit)
+  return list_response(page, response, fields)
+
+
+@router.get("/projects/{project_id}", response_model=ProjectRead)
+async def get_project(project_id: str) -> ProjectRead:
+  """Get a single project with its team and tech stack."""
   try:
-    return project_repository.get_projects()
+    project = project_repository.get_project(project_id)
   except Exception as e:
     raise HTTPException(status_code=500, detail=str(e)) from None
 
+  if project is None:
+    raise HTTPException(status_code=404, detail=f"Project '{project_id}' not found")
+  return project
+
 
 @router.get("/rfps", response_model=list[RFPRead])
-async def get_rfps() -> list[RFPRead]:
-  """Get all active RFPs and their specific skill requirements."""
+async def get_rfps(  # noqa: PLR0913
+  response: Response,
+  fields: Annotated[set[str] | None, Depends(field_selector(RFPRead, "id"))],
+  *,
+  skill: Annotated[
+    str | None, Query(description="Only RFPs needing this skill")
+  ] = None,
+  proficiency: Annotated[
+    ProficiencyLevel | None,
+    Query(description="Needed proficiency (of `skill` when given)"),
+  ] = None,
+  location: Annotated[
+    str | None, Query(description="Only RFPs in this location")
+  ] = None,
+  cursor: Cursor = None,
+  limit: Limit = config.ENTITIES_PAGE_SIZE,
+) -> list[RFPRead] | Response:
+  """Get a page of RFPs and their specific skill requirements."""
+  try:
+    page = rfp_repository.get_rfps(
+      skill=skill,
+      proficiency=proficiency,
+      location=location,
+      cursor=cursor,
+      limit=limit,
+      fields=fields,
+    )
+  except Exception as e:
+    raise HTTPException(status_code=500, detail=str(e)) from None
+
+  _set_next_cursor(response, page, limit)
+  return list_response(page, response, fields)
+
+
+@router.get("/search", response_model=SearchResults)
+async def search_entities(
+  q: Annotated[str, Query(min_length=1, description="Free-text query")],
+  types: Annotated[
+    list[EntityType] | None, Query(description="Restrict hits to these entity types")
+  ] = None,
+  offset: Annotated[int, Query(ge=0, le=10_000)] = 0,
+  limit: Limit = config.ENTITIES_PAGE_SIZE,
+) -> SearchResults:
+  """Full-text search over people, skills, projects and RFPs, best hits first."""
   try:
-    return rfp_repository.get_rfps()
+    hits = search_repository.search_entities(q, types, offset, limit)
   except Exception as e:
     raise HTTPException(status_code=500, detail=str(e)) from None
+
+  return SearchResults(
+    query=q, hits=hits, next_offset=offset + limit if len(hits) == limit else None
+  )
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from services.data_version import get_data_version
+from services.export_service import ExportEntity, export_entities
+
+router = APIRouter(prefix="/export")
+
+DATA_VERSION_HEADER = "X-Data-Version"
+
+
+@router.get("/{entity}.ndjson", response_class=StreamingResponse)
+def export_entity(
+  entity: ExportEntity,
+  since_version: int | None = Query(
+    None, ge=0, description="Only entities written after this data version"
+  ),
+  gzip: bool = Query(False, description="Gzip the stream"),
+) -> StreamingResponse:
+  """Stream all programmers, projects or RFPs as newline-delimited JSON.
+
+  Rows are read from a Neo4j cursor and flushed in chunks, so memory stays bounded
+  however large the graph is. Store the X-Data-Version header and pass it back as
+  `since_version` to fetch only what changed; deletions are not included.
+  """
+  headers = {DATA_VERSION_HEADER: str(get_data_version())}
+  if gzip:
+    headers["Content-Encoding"] = "gzip"
+  return StreamingResponse(
+    export_entities(entity, since_version, compress=gzip),
+    media_type="application/x-ndjson",
+    headers=headers,
+  )
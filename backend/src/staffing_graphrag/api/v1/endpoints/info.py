@@ -1,24 +1,48 @@
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
+from api.v1.dependencies import not_modified
+from core.config import config
 from repositories import system_repository
+from services.data_version import data_etag
 
 router = APIRouter(prefix="/info")
 
 
-@router.get("/stats", response_model=dict[str, Any])
-async def get_graph_statistics() -> dict[str, Any]:
+@router.get(
+  "/stats", response_model=dict[str, Any], dependencies=[Depends(not_modified)]
+)
+async def get_graph_statistics(response: Response) -> dict[str, Any]:
   """Retrieve statistics, schema information, and health status of the Knowledge Graph."""
-  data = system_repository.get_graph_metadata()
+  version, data = system_repository.get_graph_metadata()
   if "error" in data:
     raise HTTPException(status_code=500, detail=data["error"])
+  # A snapshot still being refreshed keeps the tag of the version it describes
+  response.headers["ETag"] = data_etag(version)
   return data
 
 
 @router.get("/sample", response_model=list[dict[str, Any]])
 async def get_node_samples(
   label: str = Query(..., description="The node label to sample, e.g., 'Person'"),
+  limit: int = Query(5, ge=1, le=config.SAMPLE_MAX_SIZE),
+  fields: Annotated[
+    list[str] | None,
+    Query(description="Properties to return, e.g. 'name'; all when omitted"),
+  ] = None,
+  stratify_by: str | None = Query(
+    None,
+    description="Relationship type, e.g. 'HAS_SKILL': sample `limit` nodes both "
+    "with and without it",
+  ),
+  seed: int | None = Query(
+    None,
+    description="Seed for a reproducible sample of labels up to SAMPLE_MAX_CANDIDATES "
+    "nodes; larger labels are pre-filtered at random in Neo4j",
+  ),
 ) -> list[dict[str, Any]]:
-  """Get a few raw records for a specific node label to inspect data quality."""
-  return system_repository.get_node_sample(label)
+  """Get a uniform random sample of records for a node label to inspect data quality."""
+  return system_repository.get_node_sample(
+    label, limit, fields=fields, stratify_by=stratify_by, seed=seed
+  )
@@ -3,9 +3,10 @@ import tempfile
 from pathlib import Path
 from typing import Annotated, Any
 
-from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, File, HTTPException, UploadFile, status
 from pydantic import BaseModel
 
+from services.experience_service import recompute_proven_experience
 from services.ingest_cv import ingest_cv
 from services.ingest_projects import process_projects_json
 from services.ingest_rfp import ingest_rfp
@@ -57,13 +58,20 @@ async def ingest_rfp_endpoint(request: IngestRequest) -> dict:
 
 
 @router.post("/projects")
-async def ingest_projects_endpoint(request: IngestRequest) -> dict:
+async def ingest_projects_endpoint(
+  request: IngestRequest, background_tasks: BackgroundTasks
+) -> dict:
   """Trigger the ingestion of the projects file into Neo4j.
 
   This parses the file and creates Project nodes, Requirement links, and Assignments.
+  Proven experience of the projects' teams is recomputed in the background.
   """
   try:
-    return await process_projects_json(Path(request.file_path))
+    result = await process_projects_json(Path(request.file_path))
+    background_tasks.add_task(
+      recompute_proven_experience, project_ids=result["affected_projects"]
+    )
+    return result
   except FileNotFoundError:
     raise HTTPException(status_code=404, detail="File not found") from None
   except Exception as e:
@@ -142,6 +150,7 @@ async def ingest_rfp_upload(
 @router.post("/projects/upload")
 async def ingest_projects_upload(
   file: Annotated[UploadFile, File(...)],
+  background_tasks: BackgroundTasks,
 ) -> dict[str, Any]:
   """Upload and ingest a projects JSON file."""
   if not (file.filename and file.filename.lower().endswith(".json")):
@@ -154,7 +163,11 @@ async def ingest_projects_upload(
       tmp.write(content)
       tmp_path = tmp.name
 
-    return await process_projects_json(Path(tmp_path))
+    result = await process_projects_json(Path(tmp_path))
+    background_tasks.add_task(
+      recompute_proven_experience, project_ids=result["affected_projects"]
+    )
+    return result
   except ValueError as e:
     raise HTTPException(status_code=400, detail=str(e)) from None
   except Exception as e:
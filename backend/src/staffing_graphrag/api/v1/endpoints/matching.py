@@ -1,10 +1,14 @@
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException, Query
-from shared_types.matching_types import MatchResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from shared_types.matching_types import CandidateMatch, MatchResponse
 from shared_types.project_types import ProjectAssignmentRequest
 
+from api.v1.dependencies import field_selector
+from api.v1.responses import FastJSONResponse, sparse
+from core.config import config
 from repositories.matching_repository import MatchingRepository
+from services.experience_service import recompute_proven_experience
 
 router = APIRouter(prefix="/match")
 repo = MatchingRepository()
@@ -13,24 +17,50 @@ repo = MatchingRepository()
 @router.get("/{rfp_id}", response_model=MatchResponse)
 async def find_matches(
   rfp_id: str,
+  fields: Annotated[
+    set[str] | None, Depends(field_selector(CandidateMatch, "programmer_id"))
+  ],
   threshold_months: int = Query(1, description="Months to consider 'Available Soon'"),
-) -> MatchResponse:
+  max_distance_km: float | None = Query(
+    None, gt=0, description="Only keep candidates located within this radius"
+  ),
+  use_similar_skills: bool = Query(
+    config.MATCH_USE_SIMILAR_SKILLS,
+    description="Award partial credit for skills similar to the required ones",
+  ),
+) -> MatchResponse | Response:
   """Run the matching algorithm for a specific RFP.
 
   Returns candidates categorized by:
   1. Perfect Matches (Skills + Available Now)
   2. Future Matches (Skills + Available within X months)
   3. Partial Matches (Available but missing mandatory skills)
+
+  On-site RFPs boost candidates located close to the RFP location. `fields`
+  limits each candidate to the selected CandidateMatch fields.
   """
   try:
-    return repo.find_candidates(rfp_id, threshold_months)
+    matches = repo.find_candidates(
+      rfp_id, threshold_months, max_distance_km, use_similar_skills, fields
+    )
   except Exception as e:
     raise HTTPException(status_code=500, detail=str(e)) from None
 
+  if fields is None:
+    return matches
+  return FastJSONResponse(
+    {
+      "rfp_id": matches.rfp_id,
+      "perfect_matches": [sparse(c, fields) for c in matches.perfect_matches],
+      "future_matches": [sparse(c, fields) for c in matches.future_matches],
+      "partial_matches": [sparse(c, fields) for c in matches.partial_matches],
+    }
+  )
+
 
 @router.post("/{rfp_id}/confirm")
 async def confirm_assignment(
-  rfp_id: str, request: ProjectAssignmentRequest
+  rfp_id: str, request: ProjectAssignmentRequest, background_tasks: BackgroundTasks
 ) -> dict[str, Any]:
   """Finalize the RFP.
 
@@ -40,6 +70,9 @@ async def confirm_assignment(
   """
   try:
     new_project_id = repo.convert_rfp_to_project(rfp_id, request.programmer_ids)
+    background_tasks.add_task(
+      recompute_proven_experience, request.programmer_ids, [new_project_id]
+    )
     return {
       "status": "success",
       "message": "Project created successfully",
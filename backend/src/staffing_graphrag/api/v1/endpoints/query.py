@@ -1,8 +1,12 @@
+import json
+from collections.abc import AsyncIterator
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 
+from core.config import config
 from services import query_service
 
 router = APIRouter(prefix="/query")
@@ -12,10 +16,22 @@ class QueryRequest(BaseModel):
   question: str
 
 
+class BatchQueryRequest(BaseModel):
+  questions: list[str] = Field(min_length=1, max_length=config.QUERY_BATCH_MAX_SIZE)
+
+
 class QueryResponse(BaseModel):
   question: str
   answer: str
   cypher_query: str = ""
+  cache_hit: bool = False
+  matched_question: str | None = None
+  intent: str | None = None
+  direct_answer: bool = False
+  row_count: int = 0
+  rows: list[dict[str, Any]] = Field(default_factory=list)
+  timings: dict[str, float | None] | None = None
+  usage: dict[str, int] | None = None
   success: bool
   error: str | None = None
 
@@ -29,7 +45,53 @@ async def query_knowledge_graph(request: QueryRequest) -> dict[str, Any]:
   return await query_service.process_query(request.question)
 
 
+@router.post("/batch", response_model=list[QueryResponse])
+async def query_knowledge_graph_batch(
+  request: BatchQueryRequest,
+) -> list[dict[str, Any]]:
+  """Ask several questions at once; results are returned in the input order."""
+  if any(not question.strip() for question in request.questions):
+    raise HTTPException(status_code=400, detail="Questions cannot be empty")
+
+  return await query_service.process_batch(request.questions)
+
+
+@router.post("/stream")
+async def stream_knowledge_graph_query(request: QueryRequest) -> StreamingResponse:
+  """Ask a question and receive server-sent events as each stage completes.
+
+  Emits "cypher", "row_count", "rows", then "answer" or a stream of "token"
+  events, and finally "done" (or "error").
+  """
+  if not request.question.strip():
+    raise HTTPException(status_code=400, detail="Question cannot be empty")
+
+  async def event_stream() -> AsyncIterator[str]:
+    async for event in query_service.stream_query(request.question):
+      kind = event.pop("event")
+      yield f"event: {kind}\ndata: {json.dumps(event)}\n\n"
+
+  return StreamingResponse(
+    event_stream(),
+    media_type="text/event-stream",
+    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+  )
+
+
 @router.get("/examples", response_model=dict[str, list[str]])
 async def get_example_queries() -> dict[str, list[str]]:
   """Get a list of suggested queries to help the user."""
   return query_service.get_example_queries_list()
+
+
+@router.get("/cache/stats", response_model=dict[str, Any])
+async def get_query_cache_stats() -> dict[str, Any]:
+  """Report Cypher cache hit rates and the generation latency saved."""
+  return query_service.get_cache_stats()
+
+
+@router.delete("/cache")
+async def clear_query_cache() -> dict[str, str]:
+  """Drop all cached Cypher statements."""
+  query_service.clear_cache()
+  return {"status": "success", "message": "Query cache cleared"}
@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from api.v1.endpoints.admin import router as admin_router
 from api.v1.endpoints.entities import router as entities_router
+from api.v1.endpoints.export import router as export_router
 from api.v1.endpoints.info import router as info_router
 from api.v1.endpoints.ingest import router as ingest_router
 from api.v1.endpoints.matching import router as matching_router
@@ -15,4 +16,5 @@ router.include_router(info_router, tags=["Info Operations"])
 router.include_router(ingest_router, tags=["Ingest Operations"])
 router.include_router(matching_router, tags=["Matching Operations"])
 router.include_router(query_router, tags=["Query Operations"])
+router.include_router(export_router, tags=["Export Operations"])
 router.include_router(admin_router, tags=["Admin Operations"])
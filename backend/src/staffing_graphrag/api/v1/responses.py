@@ -0,0 +1,41 @@
+from typing import Any, TypeVar
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from core.config import config
+from core.serialization import dumps
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class FastJSONResponse(JSONResponse):
+  """JSON response rendered by orjson, without FastAPI's response_model pass."""
+
+  def render(self, content: object) -> bytes:
+    return dumps(content)
+
+
+def sparse(item: BaseModel, fields: set[str]) -> dict[str, Any]:
+  """Keep only the selected fields of a model, in declaration order."""
+  return {
+    name: getattr(item, name) for name in type(item).model_fields if name in fields
+  }
+
+
+def list_response(
+  content: list[M], response: Response, fields: set[str] | None = None
+) -> list[M] | Response:
+  """Return the content as is, or pre-rendered when sparse or FAST_SERIALIZATION.
+
+  A returned Response bypasses response_model validation, so the headers set on
+  the injected ``response`` (ETag, cursor) are copied over explicitly.
+  """
+  headers = dict(response.headers)
+  if fields is not None:
+    rows = [sparse(item, fields) for item in content]
+    return FastJSONResponse(rows, headers=headers)
+  if not config.FAST_SERIALIZATION:
+    return content
+  return FastJSONResponse(content, headers=headers)
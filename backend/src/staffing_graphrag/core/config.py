@@ -16,14 +16,53 @@ class Config(BaseSettings):
   NEO4J_URI: str = "bolt://localhost:7687"
   NEO4J_USERNAME: str = "neo4j"
   NEO4J_PASSWORD: SecretStr | None = None
+  NEO4J_DATABASE: str = "neo4j"
+
+  ENTITIES_PAGE_SIZE: int = 50
+  ENTITIES_MAX_PAGE_SIZE: int = 500
+  FAST_SERIALIZATION: bool = False
+  EXPORT_FETCH_SIZE: int = 1000
+  EXPORT_CHUNK_BYTES: int = 64 * 1024
+  STATS_CACHE_TTL_SECONDS: float = 30
+  SAMPLE_MAX_SIZE: int = 50
+  SAMPLE_MAX_CANDIDATES: int = 5000
 
   OPENAI_API_KEY: SecretStr | None = None
   OPENAI_DEFAULT_MODEL: str = "gpt-4o-mini"
   OPENAI_DEFAULT_TEMPERATURE: float = 0
   OPENAI_GRAPH_QUERY_MODEL: str = "gpt-4o"
+  OPENAI_MAX_CONCURRENCY: int = 8
+
+  QUERY_LOG_ENABLED: bool = True
+  QUERY_CYPHER_CACHE_ENABLED: bool = True
+  QUERY_TEMPLATE_ROUTER_ENABLED: bool = True
+  QUERY_DIRECT_ANSWER_ENABLED: bool = True
+  QUERY_SEMANTIC_CACHE_ENABLED: bool = True
+  QUERY_SEMANTIC_CACHE_THRESHOLD: float = 0.72
+  QUERY_FEW_SHOT_EXAMPLES: int = 3
+  QUERY_SCHEMA_PRUNING_ENABLED: bool = True
+
+  QUERY_GUARD_ENABLED: bool = True
+  QUERY_MAX_ESTIMATED_ROWS: int = 100_000
+  QUERY_ROW_LIMIT: int = 1000
+  QUERY_TIMEOUT_SECONDS: float = 10
+  QUERY_QA_TOKEN_BUDGET: int = 2000
+  QUERY_BATCH_MAX_SIZE: int = 100
 
   USE_LANGCHAIN_LLM_GRAPH_TRANSFORMER: bool = False
 
+  MATCH_ONSITE_RADIUS_KM: float = 100
+  MATCH_LOCATION_BONUS: float = 5
+  MATCH_CERTIFICATION_BONUS: float = 3
+  MATCH_EXPERIENCE_WEIGHT: float = 2
+  MATCH_USE_SIMILAR_SKILLS: bool = True
+  MATCH_SIMILAR_SKILL_CREDIT: float = 0.5
+
+  EXPERIENCE_HALF_LIFE_YEARS: float = 2
+
+  SKILL_SIMILARITY_TOP_N: int = 5
+  SKILL_SIMILARITY_MIN_SCORE: float = 0.2
+
   model_config: ClassVar[SettingsConfigDict] = SettingsConfigDict(
     env_file=".env", extra="ignore"
   )
@@ -3,6 +3,16 @@ from pathlib import Path
 RFP_STORAGE_DIR = Path("data/RFP")
 RFP_JSON_FILE = RFP_STORAGE_DIR / "rfps.json"
 
+DATA_VERSION_FILE = Path("data/graph_version")
+
+QUERY_STORAGE_DIR = Path("data/query")
+CYPHER_CACHE_FILE = QUERY_STORAGE_DIR / "cypher_cache.sqlite3"
+QUERY_LOG_FILE = QUERY_STORAGE_DIR / "query_log.sqlite3"
+
+GAZETTEER_FILE = Path(__file__).parent / "data" / "gazetteer.csv"
+SKILL_TAXONOMY_FILE = Path(__file__).parent / "data" / "skill_taxonomy.json"
+CYPHER_EXAMPLES_FILE = Path(__file__).parent / "data" / "cypher_examples.json"
+
 ALLOWED_NODES = [
   "Person",
   "Company",
@@ -25,6 +35,7 @@ ALLOWED_RELATIONSHIPS = [
   ("Person", "ASSIGNED_TO", "Project"),
   ("RFP", "NEEDS", "Skill"),
   ("RFP", "LOCATED_IN", "Location"),
+  ("RFP", "PREFERS", "Certification"),
 ]
 
 NODE_PROPERTIES = ["start_date", "end_date", "proficiency"]
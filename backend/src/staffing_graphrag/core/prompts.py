@@ -19,20 +19,7 @@ CYPHER_GENERATION_TEMPLATE = textwrap.dedent("""
 
   Examples: Here are a few examples of generated Cypher statements for particular questions:
 
-  # How many Python programmers do we have?
-  MATCH (p:Person)-[:HAS_SKILL]->(s:Skill)
-  WHERE toLower(s.id) = toLower("Python")
-  RETURN count(p) AS pythonProgrammers
-
-  # Who has React skills?
-  MATCH (p:Person)-[:HAS_SKILL]->(s:Skill)
-  WHERE toLower(s.id) = toLower("React")
-  RETURN p.id AS name
-
-  # Find people with both Python and Django skills
-  MATCH (p:Person)-[:HAS_SKILL]->(s1:Skill), (p)-[:HAS_SKILL]->(s2:Skill)
-  WHERE toLower(s1.id) = toLower("Python") AND toLower(s2.id) = toLower("Django")
-  RETURN p.id AS name
+  {examples}
 
   The question is:
   {question}
@@ -56,7 +43,8 @@ CYPHER_QA_TEMPLATE = textwrap.dedent("""
 """)
 
 cypher_generation_prompt = PromptTemplate(
-  input_variables=["schema", "question"], template=CYPHER_GENERATION_TEMPLATE
+  input_variables=["schema", "examples", "question"],
+  template=CYPHER_GENERATION_TEMPLATE,
 )
 
 cypher_qa_prompt = PromptTemplate(
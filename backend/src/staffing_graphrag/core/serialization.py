@@ -0,0 +1,30 @@
+from typing import Any, TypeVar
+
+import orjson
+from pydantic import BaseModel
+
+from core.config import config
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def build_model(model: type[M], data: dict[str, Any]) -> M:
+  """Build a model from repository output.
+
+  With FAST_SERIALIZATION the data is trusted and ``model_construct`` skips
+  validation; nested models stay plain dicts, which ``dumps`` handles as is.
+  """
+  if config.FAST_SERIALIZATION:
+    return model.model_construct(**data)
+  return model(**data)
+
+
+def _default(obj: object) -> dict[str, Any]:
+  if isinstance(obj, BaseModel):
+    return obj.__dict__
+  raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: object) -> bytes:
+  """Serialize with orjson, encoding models from their field dicts directly."""
+  return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -1,12 +1,45 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from api.v1.master_router import router
 from core.config import config
+from repositories.programmer_repository import refresh_programmer_summaries
+from repositories.schema_repository import ensure_indexes
+from services import query_service
+from services.skill_taxonomy_service import sync_skill_taxonomy
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+  try:
+    ensure_indexes()
+  except Exception:
+    logger.exception("Failed to ensure Neo4j indexes.")
+  try:
+    refresh_programmer_summaries()
+  except Exception:
+    logger.exception("Failed to backfill the programmer summaries.")
+  try:
+    sync_skill_taxonomy()
+  except Exception:
+    logger.exception("Failed to sync the skill taxonomy.")
+  try:
+    query_service.init_qa_chain()
+  except Exception:
+    logger.exception("Failed to build the QA chain; it will be built on first query.")
+  yield
+
 
 app = FastAPI(
   title=config.PROJECT_NAME,
   version=config.API_VERSION,
   openapi_url=f"{config.API_V1_STR}/openapi.json",
+  lifespan=lifespan,
 )
 
 app.include_router(router)
@@ -1,16 +1,22 @@
 from core.models.cv_models import CVStructure
+from repositories.location_repository import set_location_point
+from repositories.programmer_repository import summary_update
+from services.data_version import reserve_data_version
 from services.neo4j_service import get_neo4j_graph
+from services.schema_service import notify_graph_write
 
 
 def upsert_cv(cv: CVStructure) -> None:
   graph = get_neo4j_graph()
 
-  def merge_person() -> None:
-    cypher = """
-      MERGE (p:Person {id: $full_name})
+  def merge_person(data_version: int) -> None:
+    cypher = f"""
+      MERGE (p:Person {{id: $full_name}})
       SET p.name = $full_name,
           p.email = $email,
-          p.bio = $summary
+          p.bio = $summary,
+          p.data_version = $data_version
+      {summary_update("p")}
     """
     graph.query(
       cypher,
@@ -18,17 +24,19 @@ def upsert_cv(cv: CVStructure) -> None:
         "full_name": cv.full_name,
         "email": cv.email,
         "summary": cv.summary,
+        "data_version": data_version,
       },
     )
 
   def merge_skills() -> None:
-    cypher = """
-      MATCH (p:Person {id: $person_name})
-      MERGE (s:Skill {id: $skill_name})
+    cypher = f"""
+      MATCH (p:Person {{id: $person_name}})
+      MERGE (s:Skill {{id: $skill_name}})
       ON CREATE SET s.name = $skill_name
 
       MERGE (p)-[r:HAS_SKILL]->(s)
       SET r.proficiency = $proficiency
+      {summary_update("p")}
     """
     for skill in cv.skills:
       graph.query(
@@ -97,24 +105,31 @@ def upsert_cv(cv: CVStructure) -> None:
     if not cv.location:
       return
 
+    location_name = cv.location.strip().title()
     cypher = """
       MATCH (p:Person {id: $person_name})
+      SET p.location = $location_name
       MERGE (l:Location {id: $location_name})
       ON CREATE SET l.name = $location_name
 
       MERGE (p)-[:LOCATED_IN]->(l)
+      RETURN l.point IS NULL AS needs_point
     """
-    graph.query(
+    result = graph.query(
       cypher,
       params={
         "person_name": cv.full_name,
-        "location_name": cv.location.strip().title(),
+        "location_name": location_name,
       },
     )
-
-  merge_person()
-  merge_skills()
-  merge_work_history()
-  merge_education()
-  merge_certifications()
-  merge_location()
+    if result and result[0]["needs_point"]:
+      set_location_point(location_name)
+
+  with reserve_data_version() as data_version:
+    merge_person(data_version)
+    merge_skills()
+    merge_work_history()
+    merge_education()
+    merge_certifications()
+    merge_location()
+  notify_graph_write()
@@ -0,0 +1,64 @@
+import logging
+from typing import Any
+
+from services.geocoding_service import geocode
+from services.neo4j_service import get_neo4j_graph
+from services.schema_service import notify_graph_write
+
+logger = logging.getLogger(__name__)
+
+
+def set_location_point(location_id: str) -> bool:
+  """Geocode a Location node and store its coordinates as a spatial point.
+
+  Returns False when the location is not present in the gazetteer.
+  """
+  coords = geocode(location_id)
+  if coords is None:
+    logger.info("Location '%s' not found in gazetteer.", location_id)
+    return False
+
+  cypher = """
+    MATCH (l:Location {id: $location_id})
+    SET l.point = point({latitude: $latitude, longitude: $longitude})
+  """
+  get_neo4j_graph().query(
+    cypher,
+    params={"location_id": location_id, "latitude": coords[0], "longitude": coords[1]},
+  )
+  return True
+
+
+def geocode_locations() -> dict[str, Any]:
+  """Backfill spatial points for every Location node that does not have one yet."""
+  rows = get_neo4j_graph().query(
+    "MATCH (l:Location) WHERE l.point IS NULL RETURN l.id AS id"
+  )
+
+  unresolved = [row["id"] for row in rows if not set_location_point(row["id"])]
+  notify_graph_write()
+
+  return {
+    "status": "success",
+    "geocoded": len(rows) - len(unresolved),
+    "unresolved": unresolved,
+  }
+
+
+def find_locations_within(location_id: str, radius_km: float) -> dict[str, float]:
+  """Return ids of Location nodes within the radius, mapped to their distance in km.
+
+  The distance predicate is served by the `location_point` point index, so the cost
+  depends on the number of nearby locations, not on the number of people.
+  """
+  cypher = """
+    MATCH (origin:Location {id: $location_id})
+    WHERE origin.point IS NOT NULL
+    MATCH (l:Location)
+    WHERE point.distance(l.point, origin.point) <= $radius_m
+    RETURN l.id AS id, point.distance(l.point, origin.point) / 1000.0 AS distance_km
+  """
+  rows = get_neo4j_graph().query(
+    cypher, params={"location_id": location_id, "radius_m": radius_km * 1000}
+  )
+  return {row["id"]: row["distance_km"] for row in rows}
@@ -3,19 +3,164 @@ from typing import Any
 
 from shared_types.matching_types import CandidateMatch, MatchResponse
 
+from core.config import config
+from repositories.location_repository import find_locations_within
+from repositories.programmer_repository import summary_update
+from repositories.projection import map_projection
+from services.certification_index import get_certification_index
+from services.data_version import reserve_data_version
+from services.experience_service import proven_experience_score
 from services.neo4j_service import get_neo4j_graph
+from services.schema_service import notify_graph_write
+from services.skill_similarity_service import get_skill_similarity_index
+from services.skill_taxonomy_service import get_skill_taxonomy
 
 logger = logging.getLogger(__name__)
 
 
+_CANDIDATE_FIELDS = {
+  "id": "p.id",
+  "name": "coalesce(p.name, p.id)",
+  "role": "'Developer'",
+  "total_score": "total_score",
+  "skill_match_percent": """
+    CASE
+      WHEN max_score = 0 THEN 0
+      ELSE (toFloat(total_score) / toFloat(max_score)) * 100
+    END""",
+  "missing_mandatory": "missing_mandatory",
+  "missing_optional": "missing_optional",
+  "delay_days": "delay_days",
+  "last_end_date": "toString(last_project_end)",
+  "last_project_title": "last_project_title",
+  "location": "person_location",
+  "distance_km": "$nearby[person_location]",
+  "proven_skills": "p.proven_skills",
+  "proven_scores": "p.proven_scores",
+}
+# Needed to score, classify and sort candidates whatever fields were requested
+_SCORING_KEYS = frozenset(
+  {
+    "id",
+    "total_score",
+    "skill_match_percent",
+    "missing_mandatory",
+    "delay_days",
+    "distance_km",
+    "proven_skills",
+    "proven_scores",
+  }
+)
+# CandidateMatch fields backed by display-only projection keys
+_DISPLAY_KEYS = {
+  "programmer_name": "name",
+  "role": "role",
+  "missing_optional_skills": "missing_optional",
+  "current_project_end_date": "last_end_date",
+  "current_project_name": "last_project_title",
+  "location": "location",
+}
+
+
+def _display_keys(fields: set[str]) -> set[str]:
+  return {_DISPLAY_KEYS[field] for field in fields if field in _DISPLAY_KEYS}
+
+
 class MatchingRepository:
   def __init__(self) -> None:
     self.graph = get_neo4j_graph()
 
-  def find_candidates(self, rfp_id: str, max_delay_months: int = 1) -> MatchResponse:
-    query = """
+  def _get_rfp_context(self, rfp_id: str) -> dict[str, Any]:
+    """Fetch the RFP attributes used outside of the skill scoring query."""
+    cypher = """
+      MATCH (r:RFP {id: $rfp_id})
+      OPTIONAL MATCH (r)-[:LOCATED_IN]->(l:Location)
+      RETURN coalesce(r.remote_allowed, true) AS remote_allowed,
+             l.id AS location,
+             l.point IS NOT NULL AS geocoded,
+             COLLECT {
+               MATCH (r)-[:PREFERS]->(c:Certification) RETURN DISTINCT c.id
+             } AS preferred_certifications,
+             COLLECT { MATCH (r)-[:NEEDS]->(s:Skill) RETURN s.id } AS required_skills
+      LIMIT 1
+    """
+    rows = self.graph.query(cypher, params={"rfp_id": rfp_id})
+    if not rows:
+      return {
+        "remote_allowed": True,
+        "location": None,
+        "geocoded": False,
+        "preferred_certifications": [],
+        "required_skills": [],
+      }
+    return rows[0]
+
+  def _get_nearby_locations(
+    self, rfp_context: dict[str, Any], max_distance_km: float | None
+  ) -> tuple[bool, float, dict[str, float] | None]:
+    """Resolve the RFP location into nearby Location ids via the point index.
+
+    Returns (on_site, radius_km, nearby) where `nearby` maps Location ids to their
+    distance from the RFP location, or None when the RFP has no geocoded location.
+    """
+    on_site = not rfp_context["remote_allowed"]
+    radius_km = max_distance_km or config.MATCH_ONSITE_RADIUS_KM
+
+    if not (rfp_context["geocoded"] and (on_site or max_distance_km is not None)):
+      return on_site, radius_km, None
+
+    return (
+      on_site,
+      radius_km,
+      find_locations_within(rfp_context["location"], radius_km),
+    )
+
+  def find_candidates(
+    self,
+    rfp_id: str,
+    max_delay_months: int = 1,
+    max_distance_km: float | None = None,
+    use_similar_skills: bool = config.MATCH_USE_SIMILAR_SKILLS,
+    fields: set[str] | None = None,
+  ) -> MatchResponse:
+    """Score and classify candidates for an RFP.
+
+    With ``fields`` (CandidateMatch field names), display-only values outside the
+    selection are left out of the Cypher projection; scoring inputs always load.
+    """
+    rfp_context = self._get_rfp_context(rfp_id)
+    on_site, radius_km, nearby = self._get_nearby_locations(
+      rfp_context, max_distance_km
+    )
+    within_radius_only = nearby is not None and max_distance_km is not None
+
+    certifications = get_certification_index().snapshot()
+    certification_mask = certifications.mask_for(
+      rfp_context["preferred_certifications"]
+    )
+
+    implied_by = get_skill_taxonomy().implied_by_map(rfp_context["required_skills"])
+
+    similar = (
+      get_skill_similarity_index().neighbours_for(rfp_context["required_skills"])
+      if use_similar_skills
+      else {}
+    )
+
+    if within_radius_only:
+      # Start from the nearby locations so only their residents are scored
+      query = """
+      MATCH (r:RFP {id: $rfp_id})
+      MATCH (l:Location) WHERE l.id IN keys($nearby)
+      MATCH (p:Person)-[:LOCATED_IN]->(l)
+      WITH DISTINCT r, p
+      """
+    else:
+      query = """
       MATCH (r:RFP {id: $rfp_id})
       MATCH (p:Person)
+      """
+    query += """
 
       // COLLECT RFP REQUIREMENTS
       OPTIONAL MATCH (r)-[req:NEEDS]->(s:Skill)
@@ -48,6 +193,22 @@ class MatchingRepository:
                END
            }) AS person_skills
 
+      // EXPAND IMPLIED SKILLS (e.g. Django -> Python) via the taxonomy closure
+      WITH r, p, requirements,
+           person_skills + [req IN requirements
+             WHERE NOT any(ps IN person_skills WHERE ps.id = req.id)
+               AND any(ps IN person_skills WHERE ps.id IN coalesce($implied_by[req.id], []))
+             | {
+                 id: req.id,
+                 person_level: reduce(level = 0, ps IN person_skills |
+                   CASE
+                     WHEN ps.id IN coalesce($implied_by[req.id], []) AND ps.person_level > level
+                     THEN ps.person_level
+                     ELSE level
+                   END
+                 )
+               }] AS person_skills
+
       // SCORE CALCULATION
       WITH r, p, requirements, person_skills,
 
@@ -70,7 +231,15 @@ class MatchingRepository:
                   ELSE 1
                 END
             END
-          ELSE 0
+          // Partial credit for the closest similar skill the person has
+          ELSE
+            reduce(best = 0.0, ps IN person_skills |
+              CASE
+                WHEN coalesce($similar[req.id][ps.id], 0.0) > best
+                THEN $similar[req.id][ps.id]
+                ELSE best
+              END
+            ) * CASE WHEN req.mandatory THEN 10 ELSE 5 END * $similar_credit
         END
       ) AS total_score,
 
@@ -108,33 +277,39 @@ class MatchingRepository:
            CASE
              WHEN last_project_end IS NULL THEN -999
              ELSE duration.inDays(rfp_start, last_project_end).days
-           END AS delay_days
-
-      RETURN {
-        id: p.id,
-        name: coalesce(p.name, p.id),
-        role: 'Developer',
-
-        total_score: total_score,
-        skill_match_percent:
-          CASE
-            WHEN max_score = 0 THEN 0
-            ELSE (toFloat(total_score) / toFloat(max_score)) * 100
-          END,
-
-        missing_mandatory: missing_mandatory,
-        missing_optional: missing_optional,
-
-        delay_days: delay_days,
-        last_end_date: toString(last_project_end),
-        last_project_title: last_project_title
-      } AS candidate
+           END AS delay_days,
+           // Read through LOCATED_IN: people ingested by the graph transformer
+           // have no Person.location property, only the edge
+           head(COLLECT {
+             MATCH (p)-[:LOCATED_IN]->(pl:Location) RETURN pl.id
+           }) AS person_location
+
+    """
+    projection = map_projection(
+      _CANDIDATE_FIELDS,
+      None if fields is None else _SCORING_KEYS | _display_keys(fields),
+    )
+    query += f"""
+      RETURN {projection} AS candidate
       ORDER BY total_score DESC
     """
 
-    results = self.graph.query(query, params={"rfp_id": rfp_id})
+    results = self.graph.query(
+      query,
+      params={
+        "rfp_id": rfp_id,
+        "nearby": nearby or {},
+        "implied_by": implied_by,
+        "similar": similar,
+        "similar_credit": config.MATCH_SIMILAR_SKILL_CREDIT,
+      },
+    )
 
     response = MatchResponse(rfp_id=rfp_id)
+    # Partial rows lack required display fields, so skip validation for them
+    build_candidate = (
+      CandidateMatch if fields is None else CandidateMatch.model_construct
+    )
 
     for row in results:
       data = row["candidate"]
@@ -147,18 +322,42 @@ class MatchingRepository:
       else:
         status = "unavailable"
 
-      candidate = CandidateMatch(
+      total_score = data["total_score"]
+      distance_km = data.get("distance_km")
+      if on_site and distance_km is not None:
+        # Linear boost for on-site RFPs: full bonus on site, none at the radius edge
+        total_score += round(
+          config.MATCH_LOCATION_BONUS * (1 - distance_km / radius_km), 2
+        )
+
+      matched_certifications = certifications.matching(
+        str(data["id"]), certification_mask
+      )
+      total_score += config.MATCH_CERTIFICATION_BONUS * len(matched_certifications)
+
+      experience_score = proven_experience_score(
+        data.get("proven_skills"),
+        data.get("proven_scores"),
+        rfp_context["required_skills"],
+      )
+      total_score += round(config.MATCH_EXPERIENCE_WEIGHT * experience_score, 2)
+
+      candidate = build_candidate(
         programmer_id=str(data["id"]),
-        programmer_name=data["name"],
+        programmer_name=data.get("name"),
         role=data.get("role"),
-        total_score=data["total_score"],
+        total_score=total_score,
         skill_match_percent=round(data["skill_match_percent"], 1),
         missing_mandatory_skills=data["missing_mandatory"],
-        missing_optional_skills=data["missing_optional"],
+        missing_optional_skills=data.get("missing_optional", []),
         status=status,
         days_until_available=max(delay, 0),
-        current_project_end_date=data["last_end_date"],
+        current_project_end_date=data.get("last_end_date"),
         current_project_name=data.get("last_project_title"),
+        matched_certifications=matched_certifications,
+        experience_score=round(experience_score, 2),
+        location=data.get("location"),
+        distance_km=round(distance_km, 1) if distance_km is not None else None,
       )
 
       skill_fit_ok = (
@@ -194,11 +393,11 @@ class MatchingRepository:
     2. Assign Programmers
     3. Delete RFP
     """
-    cypher = """
-        MATCH (r:RFP {id: $rfp_id})
+    cypher = f"""
+        MATCH (r:RFP {{id: $rfp_id}})
 
         // Create Project Node
-        CREATE (p:Project {
+        CREATE (p:Project {{
             id: 'PROJ-' + r.id,  // Generate a new ID TODO
             title: r.title,
             description: r.description,
@@ -206,10 +405,11 @@ class MatchingRepository:
             budget: r.budget,
             start_date: r.start_date,
             // Calculate end date approximately
-            end_date: toString(date(r.start_date) + duration({months: coalesce(r.duration_months, 6)})),
+            end_date: toString(date(r.start_date) + duration({{months: coalesce(r.duration_months, 6)}})),
             status: 'active',
-            team_size: r.team_size
-        })
+            team_size: r.team_size,
+            data_version: $data_version
+        }})
 
         // Copy Requirements (RFP)-[:NEEDS]->(Skill) ==> (Project)-[:REQUIRES]->(Skill)
         WITH r, p
@@ -226,7 +426,15 @@ class MatchingRepository:
         CREATE (u)-[assign:ASSIGNED_TO]->(p)
         SET assign.start_date = p.start_date,
             assign.end_date = p.end_date,
-            assign.allocation_percentage = 100
+            assign.allocation_percentage = 100,
+            u.data_version = $data_version
+
+        // Refresh the summary of each newly assigned programmer
+        WITH r, p, u
+        CALL {{
+          WITH u
+          {summary_update("u")}
+        }}
 
         // Delete the RFP
         DETACH DELETE r
@@ -234,11 +442,19 @@ class MatchingRepository:
         RETURN p.id as new_project_id
         """
 
-    result: list[dict[str, Any]] = self.graph.query(
-      cypher, params={"rfp_id": rfp_id, "programmer_ids": programmer_ids}
-    )
+    with reserve_data_version() as data_version:
+      result: list[dict[str, Any]] = self.graph.query(
+        cypher,
+        params={
+          "rfp_id": rfp_id,
+          "programmer_ids": programmer_ids,
+          "data_version": data_version,
+        },
+      )
 
     if not result:
       raise ValueError(f"Failed to convert RFP {rfp_id}. It might not exist.")
 
+    notify_graph_write()
+
     return result[0]["new_project_id"]
@@ -1,46 +1,179 @@
+import logging
+from collections.abc import Iterator
+from typing import Any
+
 from shared_types.programmer_types import ProgrammerRead
 
-from services.neo4j_service import get_neo4j_graph
+from core.config import config
+from core.serialization import build_model
+from repositories.projection import map_projection, wants
+from services.neo4j_service import get_neo4j_graph, iter_query
+from services.skill_taxonomy_service import get_skill_taxonomy
+
+logger = logging.getLogger(__name__)
+
+# Denormalized summary kept on each Person by ``summary_update``
+_SKILL_BUCKETS = {
+  "Expert": "skills_expert",
+  "Advanced": "skills_advanced",
+  "Intermediate": "skills_intermediate",
+  "Beginner": "skills_beginner",
+}
+
+_PROGRAMMER_FIELDS = {
+  "id": "p.id",
+  "name": "p.name",
+  "location": "p.location",
+  "skills": "{"
+  + ", ".join(
+    f"{level}: coalesce(p.{bucket}, [])" for level, bucket in _SKILL_BUCKETS.items()
+  )
+  + "}",
+  "is_assigned": "coalesce(p.is_assigned, false)",
+  "current_project": "p.current_project",
+}
+
+
+def summary_update(var: str) -> str:
+  """Cypher recomputing the skill buckets and assignment of the Person ``var``.
+
+  Appended to every statement that changes a person's skills or assignments, so
+  the summary commits in the same transaction as the relationships it mirrors.
+  """
+  buckets = ",\n        ".join(
+    f"{var}.{bucket} = [x IN raw_skills WHERE x.proficiency = '{level}' | x.skill]"
+    for level, bucket in _SKILL_BUCKETS.items()
+  )
+  return f"""
+    WITH {var},
+         COLLECT {{
+           MATCH ({var})-[hs:HAS_SKILL]->(s:Skill)
+           RETURN {{skill: s.id, proficiency: hs.proficiency}}
+         }} AS raw_skills,
+         COLLECT {{
+           MATCH ({var})-[:ASSIGNED_TO]->(proj:Project)
+           WHERE proj.status IN ['active', 'planned']
+           RETURN DISTINCT proj.title
+         }} AS active_projects
+    SET {buckets},
+        {var}.current_project = head(active_projects),
+        {var}.is_assigned = size(active_projects) > 0
+  """
+
+
+def refresh_programmer_summaries() -> None:
+  """Backfill the summary on people written before it was maintained."""
+  cypher = f"""
+    MATCH (u:Person)
+    WHERE u.is_assigned IS NULL
+    {summary_update("u")}
+    RETURN count(u) AS refreshed
+  """
+  refreshed = get_neo4j_graph().query(cypher)[0]["refreshed"]
+  if refreshed:
+    logger.info("Backfilled the summary of %s programmers", refreshed)
+
+
+def update_programmer_summaries(person_ids: list[str], data_version: int) -> None:
+  """Recompute the summary of people written without ``summary_update``.
+
+  Used after LLMGraphTransformer ingestion, which writes the graph documents as is.
+  """
+  cypher = f"""
+    MATCH (u:Person)
+    WHERE u.id IN $person_ids
+    SET u.data_version = $data_version
+    {summary_update("u")}
+  """
+  get_neo4j_graph().query(
+    cypher, params={"person_ids": person_ids, "data_version": data_version}
+  )
+
+
+def _skill_names(proficiency: str | None) -> str:
+  """Cypher list of the person's skills, restricted to one proficiency if given."""
+  levels = [proficiency] if proficiency is not None else list(_SKILL_BUCKETS)
+  return " + ".join(f"coalesce(p.{_SKILL_BUCKETS[level]}, [])" for level in levels)
+
+
+def get_programmers(  # noqa: PLR0913
+  status: str | None = None,
+  *,
+  skill: str | None = None,
+  proficiency: str | None = None,
+  location: str | None = None,
+  cursor: str | None = None,
+  limit: int = config.ENTITIES_PAGE_SIZE,
+  fields: set[str] | None = None,
+) -> list[ProgrammerRead]:
+  """Fetch one page of programmers ordered by id, starting after ``cursor``.
+
+  Filters and fields are read from the summary maintained on the Person node, so
+  listing is a single label scan with no relationship traversals. With ``fields``,
+  only the selected keys are projected.
+  """
+  conditions = ["p.id > $cursor"]
+  if status is not None:
+    conditions.append(
+      "p.is_assigned = true"
+      if status == "assigned"
+      else "NOT coalesce(p.is_assigned, false)"
+    )
+  if skill is not None:
+    conditions.append(
+      f"any(name IN {_skill_names(proficiency)} WHERE toLower(name) = toLower($skill))"
+    )
+  elif proficiency is not None:
+    conditions.append(f"size({_skill_names(proficiency)}) > 0")
+  if location is not None:
+    conditions.append("toLower(p.location) = toLower($location)")
 
+  with_skills = wants(fields, "skills", "implied_skills")
+  selected = fields
+  if fields is not None and with_skills:
+    selected = {*fields, "skills"}  # implied skills are derived from declared ones
 
-def get_programmers(status: str | None = None) -> list[ProgrammerRead]:
-  cypher = """
+  cypher = f"""
     MATCH (p:Person)
+    WHERE {" AND ".join(conditions)}
+    WITH p ORDER BY p.id LIMIT $limit
+    RETURN {map_projection(_PROGRAMMER_FIELDS, selected)} AS data
+    ORDER BY p.id
+  """
+
+  results = get_neo4j_graph().query(
+    cypher,
+    params={
+      "cursor": cursor or "",
+      "limit": limit,
+      "skill": skill,
+      "location": location,
+    },
+  )
+  parsed_results = [build_model(ProgrammerRead, row["data"]) for row in results]
+  if not with_skills:
+    return parsed_results
 
-    OPTIONAL MATCH (p)-[hs:HAS_SKILL]->(s:Skill)
-    WITH p, collect({
-      skill: s.id,
-      proficiency: hs.proficiency
-    }) AS raw_skills
-
-    OPTIONAL MATCH (p)-[:ASSIGNED_TO]->(proj:Project)
-    WHERE proj.status IN ['active', 'planned']
-    WITH
-      p,
-      raw_skills,
-      collect(DISTINCT proj.title) AS active_projects
-
-    RETURN {
-      id: p.id,
-      name: p.name,
-      location: p.location,
-      skills: {
-        Expert: [x IN raw_skills WHERE x.proficiency = 'Expert' | x.skill],
-        Advanced: [x IN raw_skills WHERE x.proficiency = 'Advanced' | x.skill],
-        Intermediate: [x IN raw_skills WHERE x.proficiency = 'Intermediate' | x.skill],
-        Beginner: [x IN raw_skills WHERE x.proficiency = 'Beginner' | x.skill]
-      },
-      is_assigned: size(active_projects) > 0,
-      current_project: head(active_projects)
-    } AS data
-  """
-
-  results = get_neo4j_graph().query(cypher)
-  parsed_results = [ProgrammerRead(**row["data"]) for row in results]
-
-  if status == "available":
-    return [p for p in parsed_results if not p.is_assigned]
-  if status == "assigned":
-    return [p for p in parsed_results if p.is_assigned]
+  taxonomy = get_skill_taxonomy()
+  for programmer in parsed_results:
+    declared = [name for names in programmer.skills.values() for name in names]
+    programmer.implied_skills = sorted(taxonomy.implied_skills(declared))
 
   return parsed_results
+
+
+def iter_programmers(since_version: int | None = None) -> Iterator[dict[str, Any]]:
+  """Stream every programmer, or those written after ``since_version``, by id."""
+  cypher = f"""
+    MATCH (p:Person)
+    WHERE $since IS NULL OR p.data_version > $since
+    RETURN {map_projection(_PROGRAMMER_FIELDS, None)} AS data
+    ORDER BY p.id
+  """
+
+  taxonomy = get_skill_taxonomy()
+  for row in iter_query(cypher, {"since": since_version}):
+    data = row["data"]
+    declared = [name for names in data["skills"].values() for name in names]
+    data["implied_skills"] = sorted(taxonomy.implied_skills(declared))
+    yield data
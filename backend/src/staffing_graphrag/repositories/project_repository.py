@@ -1,16 +1,47 @@
+from collections.abc import Iterator
+from typing import Any
+
 from shared_types.project_types import ProjectRead
 
+from core.config import config
 from core.models.project_models import ProjectStatus, ProjectStructure
-from services.neo4j_service import get_neo4j_graph
+from core.serialization import build_model
+from repositories.programmer_repository import summary_update
+from repositories.projection import map_projection
+from services.data_version import reserve_data_version
+from services.neo4j_service import get_neo4j_graph, iter_query
+from services.schema_service import notify_graph_write
+
+_PROJECT_FIELDS = {
+  "id": "p.id",
+  "title": "p.title",
+  "client": "p.client",
+  "status": "p.status",
+  "description": "p.description",
+  # Independent subqueries: skills and team are never multiplied against each other
+  "required_skills": """COLLECT {
+    MATCH (p)-[:REQUIRES]->(s:Skill) RETURN DISTINCT s.id
+  }""",
+  "assigned_team": """COLLECT {
+    MATCH (person:Person)-[r:ASSIGNED_TO|WORKED_ON]->(p)
+    RETURN DISTINCT {name: person.name, id: person.id, role: r.role}
+  }""",
+}
 
 
 def upsert_project(project: ProjectStructure) -> None:
   """Upsert a Project node and its relationships (Skills, People)."""
+  with reserve_data_version() as data_version:
+    _merge_project(project, data_version)
+  notify_graph_write()
+
+
+def _merge_project(project: ProjectStructure, data_version: int) -> None:
   graph = get_neo4j_graph()
 
-  # Merge Project Node
-  cypher = """
-    MERGE (p:Project {id: $id})
+  # Merge Project Node; a status change can (un)assign its current team
+  cypher = f"""
+    MERGE (p:Project {{id: $id}})
     SET p.title = $name,
         p.description = $description,
         p.client = $client,
@@ -18,9 +49,14 @@ def upsert_project(project: ProjectStructure) -> None:
         p.end_date = $end_date,
         p.budget = $budget,
         p.status = $status,
-        p.team_size = $team_size
+        p.team_size = $team_size,
+        p.data_version = $data_version
+    WITH p
+    MATCH (u:Person)-[:ASSIGNED_TO]->(p)
+    SET u.data_version = $data_version
+    {summary_update("u")}
     """
-  graph.query(cypher, params=project.model_dump())
+  graph.query(cypher, params={**project.model_dump(), "data_version": data_version})
 
   # Merge Skill Requirements
   cypher = """
@@ -55,7 +91,9 @@ def upsert_project(project: ProjectStructure) -> None:
 
     MERGE (u)-[r:{rel_type}]->(p)
     SET r.start_date = $start_date,
-        r.end_date = $end_date
+        r.end_date = $end_date,
+        u.data_version = $data_version
+    {summary_update("u")}
     """
 
   for person in project.assigned_programmers:
@@ -66,38 +104,65 @@ def upsert_project(project: ProjectStructure) -> None:
         "programmer_name": person.programmer_name,
         "start_date": person.assignment_start_date,
         "end_date": person.assignment_end_date,
+        "data_version": data_version,
       },
     )
 
 
-def get_projects() -> list[ProjectRead]:
-  """Fetch projects with requirements and team members."""
-  cypher = """
+def get_projects(
+  status: str | None = None,
+  *,
+  skill: str | None = None,
+  cursor: str | None = None,
+  limit: int = config.ENTITIES_PAGE_SIZE,
+  fields: set[str] | None = None,
+) -> list[ProjectRead]:
+  """Fetch one page of projects, ordered by id, with requirements and team members.
+
+  The page is cut before anything is expanded. With ``fields``, only the selected
+  keys are projected and unselected subqueries are not run.
+  """
+  conditions = ["p.id > $cursor"]
+  if status is not None:
+    conditions.append("p.status = $status")
+  if skill is not None:
+    conditions.append(
+      "EXISTS { MATCH (p)-[:REQUIRES]->(fs:Skill)"
+      " WHERE toLower(fs.id) = toLower($skill) }"
+    )
+
+  cypher = f"""
     MATCH (p:Project)
+    WHERE {" AND ".join(conditions)}
+    WITH p ORDER BY p.id LIMIT $limit
+    RETURN {map_projection(_PROJECT_FIELDS, fields)} AS data
+    ORDER BY p.id
+  """
+
+  results = get_neo4j_graph().query(
+    cypher,
+    params={"cursor": cursor or "", "limit": limit, "status": status, "skill": skill},
+  )
+  return [build_model(ProjectRead, row["data"]) for row in results]
+
+
+def get_project(project_id: str) -> ProjectRead | None:
+  """Fetch a single project by id through the project_id index."""
+  cypher = f"""
+    MATCH (p:Project {{id: $id}})
+    RETURN {map_projection(_PROJECT_FIELDS, None)} AS data
+  """
+  results = get_neo4j_graph().query(cypher, params={"id": project_id})
+  return build_model(ProjectRead, results[0]["data"]) if results else None
 
-    OPTIONAL MATCH (p)-[:REQUIRES]->(s:Skill)
-
-    OPTIONAL MATCH (person:Person)-[r]->(p)
-    WHERE type(r) IN ['ASSIGNED_TO', 'WORKED_ON']
-
-    WITH p, collect(distinct s.id) as req_skills,
-         collect(distinct {
-            name: person.name,
-            id: person.id,
-            role: r.role
-         }) as team
-
-    RETURN {
-        id: p.id,
-        title: p.title,
-        client: p.client,
-        status: p.status,
-        description: p.description,
-        required_skills: req_skills,
-        assigned_team: team
-    } as data
-    ORDER BY p.start_date DESC
-    """
 
-  results = get_neo4j_graph().query(cypher)
-  return [ProjectRead(**row["data"]) for row in results]
+def iter_projects(since_version: int | None = None) -> Iterator[dict[str, Any]]:
+  """Stream every project, or those written after ``since_version``, by id."""
+  cypher = f"""
+    MATCH (p:Project)
+    WHERE $since IS NULL OR p.data_version > $since
+    RETURN {map_projection(_PROJECT_FIELDS, None)} AS data
+    ORDER BY p.id
+  """
+  for row in iter_query(cypher, {"since": since_version}):
+    yield row["data"]
@@ -0,0 +1,19 @@
+from collections.abc import Collection
+
+
+def map_projection(expressions: dict[str, str], fields: Collection[str] | None) -> str:
+  """Render a Cypher map of the selected keys; all keys when ``fields`` is None."""
+  return (
+    "{"
+    + ", ".join(
+      f"{key}: {expression}"
+      for key, expression in expressions.items()
+      if fields is None or key in fields
+    )
+    + "}"
+  )
+
+
+def wants(fields: Collection[str] | None, *names: str) -> bool:
+  """Whether any of the named fields is selected; all are when ``fields`` is None."""
+  return fields is None or any(name in fields for name in names)
@@ -1,18 +1,63 @@
 import logging
+from collections.abc import Iterator
+from typing import Any
 
 from shared_types.rfp_types import RFPRead
 
+from core.config import config
 from core.models.rfp_models import RFPStructure
-from services.neo4j_service import get_neo4j_graph
+from core.serialization import build_model
+from repositories.location_repository import set_location_point
+from repositories.projection import map_projection, wants
+from services.data_version import reserve_data_version
+from services.neo4j_service import get_neo4j_graph, iter_query
+from services.schema_service import notify_graph_write
 
 logger = logging.getLogger(__name__)
 
+_RFP_FIELDS = {
+  "id": "r.id",
+  "title": "r.title",
+  "client": "r.client",
+  "budget": "r.budget",
+  "location": "r.location",
+  "remote_allowed": "r.remote_allowed",
+  "needed_skills": "skills",
+}
+
+
+def get_rfps(  # noqa: PLR0913
+  *,
+  skill: str | None = None,
+  proficiency: str | None = None,
+  location: str | None = None,
+  cursor: str | None = None,
+  limit: int = config.ENTITIES_PAGE_SIZE,
+  fields: set[str] | None = None,
+) -> list[RFPRead]:
+  """Fetch one page of RFPs, ordered by id, with needed skills.
+
+  With ``fields``, only the selected keys are projected.
+  """
+  conditions = ["r.id > $cursor"]
+  if skill is not None:
+    conditions.append(
+      "EXISTS { MATCH (r)-[f:NEEDS]->(fs:Skill)"
+      " WHERE toLower(fs.id) = toLower($skill)"
+      " AND ($proficiency IS NULL OR f.proficiency = $proficiency) }"
+    )
+  elif proficiency is not None:
+    conditions.append("EXISTS { (r)-[:NEEDS {proficiency: $proficiency}]->() }")
+  if location is not None:
+    conditions.append("toLower(r.location) = toLower($location)")
 
-def get_rfps() -> list[RFPRead]:
-  """Fetch RFPs with needed skills."""
-  cypher = """
+  cypher = f"""
     MATCH (r:RFP)
-
+    WHERE {" AND ".join(conditions)}
+    WITH r ORDER BY r.id LIMIT $limit
+  """
+  if wants(fields, "needed_skills"):
+    cypher += """
     OPTIONAL MATCH (r)-[rel:NEEDS]->(s:Skill)
 
     WITH r, collect({
@@ -20,19 +65,40 @@ def get_rfps() -> list[RFPRead]:
       level: rel.proficiency, // TODO: change level to proficiency
       mandatory: rel.mandatory
       }) as skills
-
-    RETURN {
-      id: r.id,
-      title: r.title,
-      client: r.client,
-      budget: r.budget,
-      needed_skills: skills
-      } as data
+    """
+  cypher += f"""
+    RETURN {map_projection(_RFP_FIELDS, fields)} as data
     ORDER BY r.id
   """
 
-  results = get_neo4j_graph().query(cypher)
-  return [RFPRead(**row["data"]) for row in results]
+  results = get_neo4j_graph().query(
+    cypher,
+    params={
+      "cursor": cursor or "",
+      "limit": limit,
+      "skill": skill,
+      "proficiency": proficiency,
+      "location": location,
+    },
+  )
+  return [build_model(RFPRead, row["data"]) for row in results]
+
+
+def iter_rfps(since_version: int | None = None) -> Iterator[dict[str, Any]]:
+  """Stream every RFP, or those written after ``since_version``, by id."""
+  cypher = f"""
+    MATCH (r:RFP)
+    WHERE $since IS NULL OR r.data_version > $since
+    WITH r,
+         COLLECT {{
+           MATCH (r)-[rel:NEEDS]->(s:Skill)
+           RETURN {{name: s.id, level: rel.proficiency, mandatory: rel.mandatory}}
+         }} AS skills
+    RETURN {map_projection(_RFP_FIELDS, None)} AS data
+    ORDER BY r.id
+  """
+  for row in iter_query(cypher, {"since": since_version}):
+    yield row["data"]
 
 
 def get_next_rfp_id() -> str:
@@ -68,6 +134,20 @@ def save_rfp(rfp_data: RFPStructure) -> None:
     raise ValueError(f"RFP with id '{rfp_data.id}' already exists.")
     # TODO: provide a nice message
 
+  with reserve_data_version() as data_version:
+    _merge_rfp(rfp_data, data_version)
+  notify_graph_write()
+
+  logger.info(
+    "Saved RFP %s to Neo4j with %s skill requirements",
+    rfp_data.id,
+    len(rfp_data.requirements),
+  )
+
+
+def _merge_rfp(rfp_data: RFPStructure, data_version: int) -> None:
+  graph = get_neo4j_graph()
+
   rfp_cypher = """
     MERGE (r:RFP {id: $id})
     SET r.title = $title,
@@ -76,10 +156,33 @@ def save_rfp(rfp_data: RFPStructure) -> None:
         r.budget = $budget_range,
         r.deadline = $start_date,
         r.location = $location,
-        r.team_size = $team_size
+        r.remote_allowed = $remote_allowed,
+        r.team_size = $team_size,
+        r.data_version = $data_version
   """
 
-  graph.query(rfp_cypher, params=rfp_data.model_dump())
+  graph.query(
+    rfp_cypher,
+    params={**rfp_data.model_dump(), "data_version": data_version},
+  )
+
+  # Create LOCATED_IN relationship to the (geocoded) Location
+  location_name = rfp_data.location.strip().title()
+  if location_name:
+    location_cypher = """
+      MATCH (r:RFP {id: $rfp_id})
+      MERGE (l:Location {id: $location_name})
+      ON CREATE SET l.name = $location_name
+
+      MERGE (r)-[:LOCATED_IN]->(l)
+      RETURN l.point IS NULL AS needs_point
+    """
+    result = graph.query(
+      location_cypher,
+      params={"rfp_id": rfp_data.id, "location_name": location_name},
+    )
+    if result and result[0]["needs_point"]:
+      set_location_point(location_name)
 
   # Create NEEDS relationships to Skills
   skill_cypher = """
@@ -103,8 +206,23 @@ def save_rfp(rfp_data: RFPStructure) -> None:
       },
     )
 
-  logger.info(
-    "Saved RFP %s to Neo4j with %s skill requirements",
-    rfp_data.id,
-    len(rfp_data.requirements),
-  )
+  # Create PREFERS relationships to Certifications
+  certification_cypher = """
+    MATCH (r:RFP {id: $rfp_id})
+    MERGE (c:Certification {id: $cert_name})
+    ON CREATE SET c.name = $cert_name
+
+    MERGE (r)-[rel:PREFERS]->(c)
+    SET rel.skill = $skill_name
+    """
+
+  for req in rfp_data.requirements:
+    for cert_name in req.preferred_certifications:
+      graph.query(
+        certification_cypher,
+        params={
+          "rfp_id": rfp_data.id,
+          "cert_name": cert_name.strip().title(),
+          "skill_name": req.skill_name.strip().title(),
+        },
+      )
@@ -0,0 +1,38 @@
+import logging
+
+from services.neo4j_service import get_neo4j_graph
+
+logger = logging.getLogger(__name__)
+
+INDEXES = [
+  "CREATE POINT INDEX location_point IF NOT EXISTS FOR (l:Location) ON (l.point)",
+  # Radius-filtered matching starts from the nearby Location ids
+  "CREATE INDEX location_id IF NOT EXISTS FOR (l:Location) ON (l.id)",
+  "CREATE INDEX person_location IF NOT EXISTS FOR (p:Person) ON (p.location)",
+  # Keyset pagination of the entity lists orders and seeks on id
+  "CREATE INDEX person_id IF NOT EXISTS FOR (p:Person) ON (p.id)",
+  "CREATE INDEX project_id IF NOT EXISTS FOR (p:Project) ON (p.id)",
+  "CREATE INDEX rfp_id IF NOT EXISTS FOR (r:RFP) ON (r.id)",
+  # Assignments and experience recomputes look people up by id or name
+  "CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.name)",
+  # Incremental exports filter on the data version a node was last written at
+  "CREATE INDEX person_data_version IF NOT EXISTS FOR (p:Person) ON (p.data_version)",
+  "CREATE INDEX project_data_version IF NOT EXISTS FOR (p:Project) ON (p.data_version)",
+  "CREATE INDEX rfp_data_version IF NOT EXISTS FOR (r:RFP) ON (r.data_version)",
+  # Full-text indexes behind /entities/search
+  "CREATE FULLTEXT INDEX person_search IF NOT EXISTS "
+  "FOR (n:Person) ON EACH [n.name, n.bio]",
+  "CREATE FULLTEXT INDEX skill_search IF NOT EXISTS FOR (n:Skill) ON EACH [n.id]",
+  "CREATE FULLTEXT INDEX project_search IF NOT EXISTS "
+  "FOR (n:Project) ON EACH [n.title, n.description]",
+  "CREATE FULLTEXT INDEX rfp_search IF NOT EXISTS "
+  "FOR (n:RFP) ON EACH [n.title, n.description]",
+]
+
+
+def ensure_indexes() -> None:
+  """Create the indexes the application relies on. Idempotent."""
+  graph = get_neo4j_graph()
+  for statement in INDEXES:
+    graph.query(statement)
+  logger.info("Ensured %s Neo4j indexes", len(INDEXES))
@@ -0,0 +1,63 @@
+import re
+
+from shared_types.search_types import EntityType, SearchHit
+
+from core.config import config
+from services.neo4j_service import get_neo4j_graph
+
+# Entity type -> (full-text index, title expression, snippet expression)
+SEARCH_INDEXES: dict[EntityType, tuple[str, str, str]] = {
+  "person": ("person_search", "coalesce(node.name, node.id)", "node.bio"),
+  "skill": ("skill_search", "node.id", "null"),
+  "project": ("project_search", "node.title", "node.description"),
+  "rfp": ("rfp_search", "node.title", "node.description"),
+}
+
+_LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+
+
+def to_lucene_query(text: str) -> str:
+  """Turn free text into a Lucene query matching every term, exactly or as a prefix."""
+  terms = [_LUCENE_SPECIAL.sub(r"\\\1", term) for term in text.lower().split()]
+  return " AND ".join(f"({term} OR {term}*)" for term in terms)
+
+
+def search_entities(
+  text: str,
+  types: list[EntityType] | None = None,
+  offset: int = 0,
+  limit: int = config.ENTITIES_PAGE_SIZE,
+) -> list[SearchHit]:
+  """Rank nodes of the selected types by full-text relevance to the text.
+
+  Each index contributes at most ``offset + limit`` hits before the merged ranking
+  is paged, so the cost is bounded by the page depth, not by the graph size.
+  """
+  query = to_lucene_query(text)
+  if not query:
+    return []
+
+  branches = [
+    f"""
+      CALL db.index.fulltext.queryNodes('{index}', $query, {{limit: $depth}})
+      YIELD node, score
+      RETURN '{entity_type}' AS type, node.id AS id, {title} AS title,
+             left({snippet}, 160) AS snippet, score
+    """
+    for entity_type, (index, title, snippet) in SEARCH_INDEXES.items()
+    if types is None or entity_type in types
+  ]
+  cypher = f"""
+    CALL {{
+      {"UNION ALL".join(branches)}
+    }}
+    RETURN type, id, title, snippet, score
+    ORDER BY score DESC, id
+    SKIP $offset LIMIT $limit
+  """
+
+  results = get_neo4j_graph().query(
+    cypher,
+    params={"query": query, "depth": offset + limit, "offset": offset, "limit": limit},
+  )
+  return [SearchHit(**row) for row in results]
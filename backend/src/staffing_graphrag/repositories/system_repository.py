@@ -1,71 +1,112 @@
 import logging
-from typing import Any
+import random
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, TypeVar
 
+from langchain_neo4j import Neo4jGraph
+
+from core.config import config
+from services.data_version import get_data_version
 from services.neo4j_service import get_neo4j_graph
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-def get_graph_metadata() -> dict[str, Any]:
-  """Retrieve graph metadata.
+# One labelled end and a typed relationship: answered from the count store
+_KEY_PATTERNS = {
+  "Person -> Skill": "MATCH (:Person)-[r:HAS_SKILL]->() RETURN count(r) AS count",
+  "Person -> Company": "MATCH (:Person)-[r:WORKED_AT]->() RETURN count(r) AS count",
+  "Person -> Project": "MATCH (:Person)-[r:WORKED_ON]->() RETURN count(r) AS count",
+}
 
-  Returns comprehensive statistics, schema details, and validation warnings
-  about the current state of the Knowledge Graph.
+
+def _quote(name: str) -> str:
+  return "`" + name.replace("`", "``") + "`"
+
+
+def _totals(graph: Neo4jGraph) -> tuple[int, int]:
+  query = """
+    CALL { MATCH (n) RETURN count(n) AS nodes }
+    CALL { MATCH ()-[r]->() RETURN count(r) AS relationships }
+    RETURN nodes, relationships
   """
-  graph = get_neo4j_graph()
+  row = graph.query(query)[0]
+  return row["nodes"], row["relationships"]
 
-  try:
-    total_nodes = graph.query("MATCH (n) RETURN count(n) as count")[0]["count"]
-    total_relationships = graph.query("MATCH ()-[r]->() RETURN count(r) as count")[0][
-      "count"
-    ]
-  except Exception:
-    logger.exception("Failed to get basic counts.")
-    return {"error": "Could not connect to database"}
 
-  node_breakdown = {}
-  try:
-    query = """
-      MATCH (n)
-      UNWIND labels(n) as label
-      WITH label, count(n) as count
-      WHERE label <> '__Entity__'
-      RETURN label, count ORDER BY label
-    """
-    results = graph.query(query)
-    node_breakdown = {row["label"]: row["count"] for row in results}
-  except Exception:
-    logger.exception("Failed to get node breakdown.")
+def _label_counts(graph: Neo4jGraph) -> dict[str, int]:
+  """Per-label node counts, one count-store lookup per label."""
+  rows = graph.query("CALL db.labels() YIELD label RETURN label")
+  labels = sorted(row["label"] for row in rows if row["label"] != "__Entity__")
+  if not labels:
+    return {}
+  query = "\nUNION ALL\n".join(
+    f"MATCH (n:{_quote(label)}) RETURN $names[{i}] AS name, count(n) AS count"
+    for i, label in enumerate(labels)
+  )
+  results = graph.query(query, params={"names": labels})
+  return {row["name"]: row["count"] for row in results if row["count"] > 0}
+
+
+def _relationship_type_counts(graph: Neo4jGraph) -> dict[str, int]:
+  """Per-type relationship counts, most frequent first, from the count store."""
+  rows = graph.query(
+    "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType"
+  )
+  types = [row["relationshipType"] for row in rows]
+  if not types:
+    return {}
+  query = "\nUNION ALL\n".join(
+    f"MATCH ()-[r:{_quote(rel_type)}]->() RETURN $names[{i}] AS name, count(r) AS count"
+    for i, rel_type in enumerate(types)
+  )
+  results = graph.query(query, params={"names": types})
+  ordered = sorted(results, key=lambda row: row["count"], reverse=True)
+  return {row["name"]: row["count"] for row in ordered if row["count"] > 0}
 
-  relationship_type_breakdown = {}
+
+def _result(future: Future[T], default: T, message: str) -> T:
   try:
-    query = """
-      MATCH ()-[r]->()
-      RETURN type(r) as type, count(r) as count
-      ORDER BY count DESC
-    """
-    results = graph.query(query)
-    relationship_type_breakdown = {row["type"]: row["count"] for row in results}
+    return future.result()
   except Exception:
-    logger.exception("Failed to get relationship breakdown.")
+    logger.exception(message)
+    return default
 
-  # Checks if the specific connections we care about actually exist
-  key_patterns = {
-    "Person -> Skill": "MATCH (p:Person)-[:HAS_SKILL]->(s:Skill) RETURN count(*) as count",
-    "Person -> Company": "MATCH (p:Person)-[:WORKED_AT]->(c:Company) RETURN count(*) as count",
-    "Person -> Project": "MATCH (p:Person)-[:WORKED_ON]->(pr:Project) RETURN count(*) as count",
-  }
 
-  domain_stats = {}
-  for name, query in key_patterns.items():
+def _collect_metadata() -> dict[str, Any]:
+  """Run the statistics queries concurrently and assemble the metadata."""
+  graph = get_neo4j_graph()
+  with ThreadPoolExecutor(max_workers=3 + len(_KEY_PATTERNS)) as pool:
+    totals = pool.submit(_totals, graph)
+    labels = pool.submit(_label_counts, graph)
+    rel_types = pool.submit(_relationship_type_counts, graph)
+    patterns = {
+      name: pool.submit(graph.query, query) for name, query in _KEY_PATTERNS.items()
+    }
+
     try:
-      res = graph.query(query)
+      total_nodes, total_relationships = totals.result()
+    except Exception:
+      logger.exception("Failed to get basic counts.")
+      return {"error": "Could not connect to database"}
+
+    node_breakdown = _result(labels, {}, "Failed to get node breakdown.")
+    relationship_type_breakdown = _result(
+      rel_types, {}, "Failed to get relationship breakdown."
+    )
+
+    # Checks if the specific connections we care about actually exist
+    domain_stats = {}
+    for name, future in patterns.items():
+      res = _result(future, [], "Failed to get a count result for domain stats.")
       count = res[0]["count"] if res else 0
       if count > 0:
         domain_stats[name] = count
-    except Exception:
-      logger.error("Failed to get a count result from for domain stats.")
-      pass
 
   warnings = []
   if total_nodes == 0:
@@ -88,23 +129,152 @@ def get_graph_metadata() -> dict[str, Any]:
   }
 
 
-def get_node_sample(label: str, limit: int = 5) -> list[dict[str, Any]]:
-  """Fetch a few sample nodes of a specific type to verify content."""
+class GraphStatsCache:
+  """Graph metadata cached per data version, refreshed in the background once old.
+
+  Only the very first call computes synchronously; afterwards the last snapshot
+  is served while a refresh runs, whether it expired or the data version moved.
+  """
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._cached: tuple[int, float, dict[str, Any]] | None = None  # version, time
+    self._refreshing = False
+
+  def _refresh(
+    self, version: int, *, background: bool = False
+  ) -> tuple[int, dict[str, Any]]:
+    try:
+      metadata = _collect_metadata()
+      if "error" not in metadata:
+        with self._lock:
+          self._cached = (version, time.monotonic(), metadata)
+      return version, metadata
+    finally:
+      if background:
+        with self._lock:
+          self._refreshing = False
+
+  def get(self) -> tuple[int, dict[str, Any]]:
+    """Return the metadata and the data version it was computed at."""
+    version = get_data_version()
+    with self._lock:
+      cached = self._cached
+      if (
+        cached is not None
+        and not self._refreshing
+        and (
+          cached[0] != version
+          or time.monotonic() - cached[1] >= config.STATS_CACHE_TTL_SECONDS
+        )
+      ):
+        self._refreshing = True
+        threading.Thread(
+          target=self._refresh,
+          args=(version,),
+          kwargs={"background": True},
+          daemon=True,
+        ).start()
+
+    if cached is None:
+      return self._refresh(version)
+    return cached[0], cached[2]
+
+
+@lru_cache(maxsize=1)
+def get_stats_cache() -> GraphStatsCache:
+  return GraphStatsCache()
+
+
+def get_graph_metadata() -> tuple[int, dict[str, Any]]:
+  """Retrieve graph metadata and the data version it describes.
+
+  Returns comprehensive statistics, schema details, and validation warnings
+  about the current state of the Knowledge Graph. Counts come from the count
+  store and are cached per data version: once STATS_CACHE_TTL_SECONDS pass or a
+  write moves the data version, the cached copy is still served while a
+  background refresh runs, so the version may lag behind the current one.
+  """
+  return get_stats_cache().get()
+
+
+_NAME = re.compile(r"[A-Za-z_]\w*")
+
+
+def _sample_query(label: str, stratify_by: str | None, fields: list[str] | None) -> str:
+  """Projected nodes of the label, each kept with probability ``$rate``."""
+  projection = (
+    "n {" + ", ".join(f".{_quote(field)}" for field in fields) + "}"
+    if fields
+    else "properties(n)"
+  )
+  stratum = f"EXISTS {{ (n)-[:{_quote(stratify_by)}]-() }}" if stratify_by else "null"
+  return f"""
+    MATCH (n:{_quote(label)})
+    WHERE $rate >= 1 OR rand() < $rate
+    WITH n LIMIT $max_candidates
+    RETURN {projection} AS n, {stratum} AS stratum
+  """
+
+
+def get_node_sample(
+  label: str,
+  limit: int = 5,
+  *,
+  fields: list[str] | None = None,
+  stratify_by: str | None = None,
+  seed: int | None = None,
+) -> list[dict[str, Any]]:
+  """Fetch a uniform random sample of nodes of a specific type to verify content.
+
+  Only the ``fields`` properties are returned, or all of them when omitted. Labels
+  with at most SAMPLE_MAX_CANDIDATES nodes are read whole and sampled in Python.
+  Larger labels are thinned in a single label scan that keeps each node with the
+  same probability, sized from the count-store label count to yield about half
+  of SAMPLE_MAX_CANDIDATES nodes and capped at SAMPLE_MAX_CANDIDATES, so the cost
+  is one scan whatever the label size. That pre-filter uses Cypher's ``rand()``,
+  so ``seed`` only makes samples of the smaller labels reproducible.
+
+  With ``stratify_by`` (a relationship type), up to ``limit`` nodes are sampled
+  both with and without such a relationship, tagged in a ``_stratum`` key.
+  """
   graph = get_neo4j_graph()
   try:
-    # Sanitize label
+    # Sanitize label, relationship type and property names
     if not label.isalnum():
       return []
+    names = [stratify_by] if stratify_by is not None else []
+    if not all(_NAME.fullmatch(name) for name in [*names, *(fields or [])]):
+      return []
+
+    count_query = f"MATCH (n:{_quote(label)}) RETURN count(n) AS count"
+    label_count = graph.query(count_query)[0]["count"]
+    if label_count == 0:
+      return []
 
-    query = f"MATCH (n:{label}) RETURN n LIMIT $limit"
-    result = graph.query(query, params={"limit": limit})
+    # Labels over the cap are thinned to about half of it during the scan
+    rate = (
+      1
+      if label_count <= config.SAMPLE_MAX_CANDIDATES
+      else config.SAMPLE_MAX_CANDIDATES / (2 * label_count)
+    )
+    rows = graph.query(
+      _sample_query(label, stratify_by, fields),
+      params={"rate": rate, "max_candidates": config.SAMPLE_MAX_CANDIDATES},
+    )
+    random.Random(seed).shuffle(rows)
 
-    # Unwrap the Neo4j Node object to a python dict
-    samples = []
-    for row in result:
-      node = row.get("n")
-      if node:
-        samples.append(dict(node))
+    strata = [True, False] if stratify_by else [None]
+    quotas = dict.fromkeys(strata, limit)
+    samples: list[dict[str, Any]] = []
+    for row in rows:
+      if quotas.get(row["stratum"], 0) > 0:
+        quotas[row["stratum"]] -= 1
+        sample = dict(row["n"])
+        if stratify_by:
+          prefix = "with" if row["stratum"] else "without"
+          sample["_stratum"] = f"{prefix} {stratify_by}"
+        samples.append(sample)
     return samples
   except Exception:
     logger.exception("Failed to get sample for %s.", label)
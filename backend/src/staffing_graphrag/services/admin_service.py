@@ -1,6 +1,11 @@
 import logging
 
+from repositories.schema_repository import ensure_indexes
+from services.certification_index import get_certification_index
 from services.neo4j_service import get_neo4j_graph
+from services.schema_service import notify_graph_write
+from services.skill_similarity_service import get_skill_similarity_index
+from services.skill_taxonomy_service import get_skill_taxonomy
 
 logger = logging.getLogger(__name__)
 
@@ -11,12 +16,16 @@ def reset_database() -> dict:
   1. Deletes all nodes and relationships.
   2. Drops all constraints.
   3. Drops all indexes (except system indexes).
+  4. Recreates the indexes the application relies on (ids, full-text, points).
   """
   graph = get_neo4j_graph()
 
   try:
     logger.info("Deleting all nodes and relationships...")
     graph.query("MATCH (n) DETACH DELETE n")
+    get_certification_index().clear()
+    get_skill_similarity_index().invalidate()
+    get_skill_taxonomy().invalidate()
 
     logger.info("Dropping all constraints...")
     constraints = graph.query("SHOW CONSTRAINTS")
@@ -38,6 +47,11 @@ def reset_database() -> dict:
         except Exception:
           logger.exception("Could not drop index: %s.", name)
 
+    logger.info("Recreating application indexes...")
+    ensure_indexes()
+
+    notify_graph_write()
+
     # Verification
     node_count = graph.query("MATCH (n) RETURN count(n) as count")[0]["count"]
     rel_count = graph.query("MATCH ()-[r]->() RETURN count(r) as count")[0]["count"]
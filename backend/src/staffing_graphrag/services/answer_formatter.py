@@ -0,0 +1,75 @@
+import re
+from typing import Any
+
+_MAX_COLUMNS = 4
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+def _label(column: str) -> str:
+  """Turn a Cypher column alias ("pythonProgrammers", "p.name") into readable text."""
+  column = column.rsplit(".", 1)[-1]
+  words = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", " ", column).replace("_", " ")
+  return words.strip().capitalize()
+
+
+def _format_value(value: object) -> str:
+  if isinstance(value, float):
+    return f"{value:,.2f}".rstrip("0").rstrip(".")
+  if isinstance(value, list):
+    return ", ".join(_format_value(v) for v in value)
+  return str(value)
+
+
+def _is_flat(value: object) -> bool:
+  return (
+    value is None
+    or isinstance(value, _SCALAR_TYPES)
+    or (isinstance(value, list) and all(isinstance(v, _SCALAR_TYPES) for v in value))
+  )
+
+
+def to_jsonable(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+  """Make Cypher result rows JSON-safe (temporal and spatial values become strings)."""
+
+  def convert(value: object) -> object:
+    if value is None or isinstance(value, _SCALAR_TYPES):
+      return value
+    if isinstance(value, list):
+      return [convert(v) for v in value]
+    if isinstance(value, dict):
+      return {k: convert(v) for k, v in value.items()}
+    return str(value)
+
+  return [{k: convert(v) for k, v in row.items()} for row in rows]
+
+
+def format_direct_answer(rows: list[dict[str, Any]]) -> str | None:
+  """Phrase scalar, single-column and small tabular results without an LLM.
+
+  Returns None for shapes that need the QA model, e.g. whole nodes, nested maps
+  or wide tables.
+  """
+  if not rows:
+    return "I don't know the answer based on the current database."
+
+  columns = list(rows[0])
+  if len(columns) > _MAX_COLUMNS or not all(
+    _is_flat(value) for row in rows for value in row.values()
+  ):
+    return None
+
+  if len(columns) == 1:
+    column = columns[0]
+    values = [row[column] for row in rows if row[column] is not None]
+    if not values:
+      return "I don't know the answer based on the current database."
+    if len(rows) == 1:
+      return f"{_label(column)}: {_format_value(values[0])}."
+    return f"{_label(column)} ({len(values)}): {_format_value(values)}."
+
+  lines = [
+    "- "
+    + ", ".join(f"{_label(column)}: {_format_value(row[column])}" for column in columns)
+    for row in rows
+  ]
+  return "\n".join(lines)
@@ -0,0 +1,95 @@
+import logging
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from services.neo4j_service import get_neo4j_graph
+from services.schema_service import on_graph_write
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CertificationSnapshot:
+  """Person -> certification bitset at one point in time; never mutated."""
+
+  bits: dict[str, int]
+  names: list[str]
+  person_masks: dict[str, int]
+
+  def mask_for(self, cert_ids: Iterable[str]) -> int:
+    """Build the mask of the given certifications, skipping ones nobody has earned."""
+    mask = 0
+    for cert_id in cert_ids:
+      if cert_id in self.bits:
+        mask |= 1 << self.bits[cert_id]
+    return mask
+
+  def matching(self, person_id: str, mask: int) -> list[str]:
+    """Return the certifications from `mask` that the person has earned."""
+    if not mask:
+      return []
+    common = self.person_masks.get(person_id, 0) & mask
+    matched = []
+    while common:
+      lowest = common & -common
+      matched.append(self.names[lowest.bit_length() - 1])
+      common ^= lowest
+    return matched
+
+
+class CertificationIndex:
+  """In-memory person -> certification bitset built from EARNED relationships.
+
+  Every certification gets a bit position, every person an integer mask, so checking
+  which preferred certifications a candidate holds is a single AND + popcount. Any
+  graph write invalidates it; the next reader rebuilds it.
+  """
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._snapshot: CertificationSnapshot | None = None
+
+  def _load(self) -> CertificationSnapshot:
+    rows = get_neo4j_graph().query("""
+      MATCH (p:Person)-[:EARNED]->(c:Certification)
+      RETURN p.id AS person_id, collect(c.id) AS certifications
+    """)
+    bits: dict[str, int] = {}
+    names: list[str] = []
+    person_masks: dict[str, int] = {}
+    for row in rows:
+      mask = 0
+      for cert_id in row["certifications"]:
+        if cert_id not in bits:
+          bits[cert_id] = len(names)
+          names.append(cert_id)
+        mask |= 1 << bits[cert_id]
+      person_masks[str(row["person_id"])] = mask
+
+    logger.info(
+      "Built certification index: %s people, %s certifications",
+      len(person_masks),
+      len(names),
+    )
+    return CertificationSnapshot(bits, names, person_masks)
+
+  def snapshot(self) -> CertificationSnapshot:
+    """Return the current bitset, building it first if a write invalidated it."""
+    with self._lock:
+      if self._snapshot is None:
+        self._snapshot = self._load()
+      return self._snapshot
+
+  def clear(self) -> None:
+    with self._lock:
+      self._snapshot = None
+
+
+@lru_cache(maxsize=1)
+def get_certification_index() -> CertificationIndex:
+  return CertificationIndex()
+
+
+on_graph_write(get_certification_index().clear)
@@ -0,0 +1,124 @@
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any
+
+from core.constants import CYPHER_CACHE_FILE
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_question(question: str) -> str:
+  """Lowercase, collapse whitespace and drop trailing punctuation."""
+  return re.sub(r"\s+", " ", question.strip().lower()).rstrip("?!. ")
+
+
+def schema_fingerprint(schema: str) -> str:
+  return hashlib.sha256(schema.encode("utf-8")).hexdigest()[:16]
+
+
+class CypherCache:
+  """Persistent cache of validated Cypher keyed by (normalized question, schema).
+
+  Entries are only stored after the Cypher executed successfully. A schema change
+  yields a different fingerprint, so stale statements are never reused.
+  """
+
+  def __init__(self) -> None:
+    CYPHER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    self._lock = threading.Lock()
+    self._conn = sqlite3.connect(CYPHER_CACHE_FILE, check_same_thread=False)
+    self._conn.execute("""
+      CREATE TABLE IF NOT EXISTS cypher_cache (
+        question TEXT NOT NULL,
+        schema_fingerprint TEXT NOT NULL,
+        cypher TEXT NOT NULL,
+        generation_ms REAL NOT NULL,
+        hits INTEGER NOT NULL DEFAULT 0,
+        created_at REAL NOT NULL,
+        last_hit_at REAL,
+        PRIMARY KEY (question, schema_fingerprint)
+      )
+    """)
+    self._conn.commit()
+
+    self.hits = 0
+    self.misses = 0
+    self.saved_ms = 0.0
+
+  def get(self, question: str, fingerprint: str) -> str | None:
+    key = normalize_question(question)
+    with self._lock:
+      row = self._conn.execute(
+        "SELECT cypher, generation_ms FROM cypher_cache "
+        "WHERE question = ? AND schema_fingerprint = ?",
+        (key, fingerprint),
+      ).fetchone()
+
+      if row is None:
+        self.misses += 1
+        return None
+
+      self._conn.execute(
+        "UPDATE cypher_cache SET hits = hits + 1, last_hit_at = ? "
+        "WHERE question = ? AND schema_fingerprint = ?",
+        (time.time(), key, fingerprint),
+      )
+      self._conn.commit()
+      self.hits += 1
+      self.saved_ms += row[1]
+      return row[0]
+
+  def put(
+    self, question: str, fingerprint: str, cypher: str, generation_ms: float
+  ) -> None:
+    with self._lock:
+      self._conn.execute(
+        "INSERT OR REPLACE INTO cypher_cache "
+        "(question, schema_fingerprint, cypher, generation_ms, created_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (normalize_question(question), fingerprint, cypher, generation_ms, time.time()),
+      )
+      self._conn.commit()
+
+  def entries(self, fingerprint: str) -> list[tuple[str, str, float]]:
+    """Return (question, cypher, generation_ms) of every entry for the schema."""
+    with self._lock:
+      return self._conn.execute(
+        "SELECT question, cypher, generation_ms FROM cypher_cache "
+        "WHERE schema_fingerprint = ?",
+        (fingerprint,),
+      ).fetchall()
+
+  def clear(self) -> None:
+    with self._lock:
+      self._conn.execute("DELETE FROM cypher_cache")
+      self._conn.commit()
+      self.hits = 0
+      self.misses = 0
+      self.saved_ms = 0.0
+
+  def stats(self) -> dict[str, Any]:
+    with self._lock:
+      entries, total_hits = self._conn.execute(
+        "SELECT count(*), coalesce(sum(hits), 0) FROM cypher_cache"
+      ).fetchone()
+
+    lookups = self.hits + self.misses
+    return {
+      "entries": entries,
+      "lifetime_hits": total_hits,
+      "hits": self.hits,
+      "misses": self.misses,
+      "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+      "latency_saved_ms": round(self.saved_ms, 1),
+    }
+
+
+@lru_cache(maxsize=1)
+def get_cypher_cache() -> CypherCache:
+  return CypherCache()
@@ -0,0 +1,95 @@
+import logging
+import re
+from typing import Any
+
+from neo4j import READ_ACCESS, Query
+
+from core.config import config
+from services.neo4j_service import get_neo4j_driver
+
+logger = logging.getLogger(__name__)
+
+_TRAILING_LIMIT = re.compile(r"\bLIMIT\s+(\d+)\s*;?\s*$", re.IGNORECASE)
+_UNION = re.compile(r"\bUNION\b", re.IGNORECASE)
+
+
+class CypherGuardError(ValueError):
+  """Raised when generated Cypher is rejected by the cost guard."""
+
+
+def _walk_plan(plan: dict[str, Any]) -> list[dict[str, Any]]:
+  operators = [plan]
+  for child in plan.get("children", []):
+    operators.extend(_walk_plan(child))
+  return operators
+
+
+def check_plan(cypher: str) -> None:
+  """Pre-flight a statement with EXPLAIN before it is allowed to run.
+
+  Expects the statement already capped by `enforce_limit`. Rejects plans that are
+  not read-only, contain a cartesian product or an all-nodes scan no LIMIT stops
+  early, or still estimate more than QUERY_MAX_ESTIMATED_ROWS result rows after
+  the LIMIT. Estimates below the LIMIT are not checked: a large scan feeding it
+  is cut off once enough rows are produced.
+  """
+  with get_neo4j_driver().session(database=config.NEO4J_DATABASE) as session:
+    summary = session.run(Query(f"EXPLAIN {cypher}")).consume()
+
+  if summary.query_type != "r":
+    raise CypherGuardError("Only read queries are allowed.")
+
+  if not summary.plan:
+    return
+
+  operator_types = [
+    operator.get("operatorType", "") for operator in _walk_plan(summary.plan)
+  ]
+  if any("CartesianProduct" in operator_type for operator_type in operator_types):
+    raise CypherGuardError(
+      "The query plan contains a cartesian product; please ask a narrower question."
+    )
+  if any("AllNodesScan" in operator_type for operator_type in operator_types) and (
+    not any("Limit" in operator_type for operator_type in operator_types)
+  ):
+    raise CypherGuardError(
+      "The query scans every node in the graph; please ask a narrower question."
+    )
+
+  estimated_rows = summary.plan.get("args", {}).get("EstimatedRows", 0)
+  if estimated_rows > config.QUERY_MAX_ESTIMATED_ROWS:
+    raise CypherGuardError(
+      f"The query is estimated to produce {estimated_rows:,.0f} rows "
+      f"(limit {config.QUERY_MAX_ESTIMATED_ROWS:,}); please ask a narrower question."
+    )
+
+
+def enforce_limit(cypher: str, limit: int = config.QUERY_ROW_LIMIT) -> str:
+  """Make sure the statement returns at most `limit` rows."""
+  cypher = cypher.strip().rstrip(";")
+
+  if _UNION.search(cypher):
+    return f"CALL {{\n{cypher}\n}}\nRETURN *\nLIMIT {limit}"
+
+  existing = _TRAILING_LIMIT.search(cypher)
+  if existing is None:
+    return f"{cypher}\nLIMIT {limit}"
+  if int(existing.group(1)) > limit:
+    return f"{cypher[: existing.start()]}LIMIT {limit}"
+  return cypher
+
+
+def run_guarded(cypher: str) -> list[dict[str, Any]]:
+  """Execute LLM-generated Cypher behind the cost guard.
+
+  The statement is capped with a LIMIT, pre-flighted and run in a read-only
+  transaction with a timeout.
+  """
+  limited = enforce_limit(cypher)
+  check_plan(limited)
+
+  with get_neo4j_driver().session(
+    database=config.NEO4J_DATABASE, default_access_mode=READ_ACCESS
+  ) as session:
+    result = session.run(Query(limited, timeout=config.QUERY_TIMEOUT_SECONDS))
+    return [record.data() for record in result]
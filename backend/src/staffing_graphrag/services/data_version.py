@@ -0,0 +1,76 @@
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from core.config import config
+from core.constants import DATA_VERSION_FILE
+from services.schema_service import on_graph_write
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+# Versions reserved by writes that have not finished yet
+_pending: set[int] = set()
+
+
+def _read_version() -> int:
+  try:
+    return int(DATA_VERSION_FILE.read_text(encoding="utf-8"))
+  except (FileNotFoundError, ValueError):
+    return 0
+
+
+def _advance() -> int:
+  """Persist and return the next version; the caller holds ``_lock``."""
+  version = _read_version() + 1
+  DATA_VERSION_FILE.parent.mkdir(parents=True, exist_ok=True)
+  tmp_file = DATA_VERSION_FILE.with_suffix(".tmp")
+  tmp_file.write_text(str(version), encoding="utf-8")
+  tmp_file.replace(DATA_VERSION_FILE)
+  return version
+
+
+def get_data_version() -> int:
+  """Return the graph data version; read from a local file, never from Neo4j.
+
+  While writes are in flight this is the version just below the oldest of them,
+  so every node stamped at or below it is already written.
+  """
+  with _lock:
+    return min(_pending) - 1 if _pending else _read_version()
+
+
+def bump_data_version() -> int:
+  """Advance the data version. Persisted, so it keeps increasing across restarts."""
+  with _lock:
+    version = _advance()
+  logger.debug("Graph data version is now %s", version)
+  return version
+
+
+@contextmanager
+def reserve_data_version() -> Iterator[int]:
+  """Reserve a unique version to stamp on the nodes of one write.
+
+  The version is advanced atomically, so concurrent writes never share a stamp, and
+  it is only published by ``get_data_version`` once the write has finished.
+  """
+  with _lock:
+    version = _advance()
+    _pending.add(version)
+  try:
+    yield version
+  finally:
+    with _lock:
+      _pending.discard(version)
+
+
+def data_etag(version: int | None = None) -> str:
+  """Weak ETag for responses derived from the graph at a (default: current) version."""
+  if version is None:
+    version = get_data_version()
+  return f'W/"{config.API_VERSION}-{version}"'
+
+
+on_graph_write(bump_data_version)
@@ -0,0 +1,145 @@
+import logging
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import date
+
+from core.config import config
+from core.models.project_models import ProjectStatus
+from services.neo4j_service import get_neo4j_graph
+from services.schema_service import notify_graph_write
+
+logger = logging.getLogger(__name__)
+
+_WRITE_BATCH_SIZE = 500
+
+
+def _parse_date(value: object) -> date | None:
+  if not value:
+    return None
+  try:
+    return date.fromisoformat(str(value)[:10])
+  except ValueError:
+    return None
+
+
+def _recency_weight(end_date: date | None, today: date) -> float:
+  """Exponential decay by project age. Projects without an end date weigh 1."""
+  if end_date is None or end_date >= today:
+    return 1.0
+  years_ago = (today - end_date).days / 365.25
+  return 0.5 ** (years_ago / config.EXPERIENCE_HALF_LIFE_YEARS)
+
+
+def _affected_people_query(
+  person_keys: Sequence[str] | None, project_ids: Sequence[str] | None
+) -> str | None:
+  """Return the subquery yielding the people to recompute, seeking on indexed ids."""
+  if person_keys is None and project_ids is None:
+    return "MATCH (u:Person) RETURN u"
+
+  branches = []
+  if person_keys:
+    branches += [
+      "UNWIND $person_keys AS key MATCH (u:Person {id: key}) RETURN u",
+      "UNWIND $person_keys AS key MATCH (u:Person {name: key}) RETURN u",
+    ]
+  if project_ids:
+    branches.append(
+      "UNWIND $project_ids AS project_id "
+      "MATCH (u:Person)-[:WORKED_ON|ASSIGNED_TO]->(:Project {id: project_id}) "
+      "RETURN u"
+    )
+  return " UNION ".join(branches) or None
+
+
+def _is_proven(status: object, end_date: date | None, today: date) -> bool:
+  """Only completed or already finished work counts; planned assignments do not."""
+  return status == ProjectStatus.COMPLETED or (
+    end_date is not None and end_date < today
+  )
+
+
+def recompute_proven_experience(
+  person_keys: Sequence[str] | None = None, project_ids: Sequence[str] | None = None
+) -> int:
+  """Materialize per-skill "proven experience" scores on Person nodes.
+
+  Scores are derived from completed or already ended WORKED_ON and ASSIGNED_TO
+  projects and the skills they REQUIRE, weighted by how recently each project
+  ended. They are stored as the parallel `proven_skills` / `proven_scores` list
+  properties, so matching reads them without any traversal.
+
+  When `person_keys` (ids or names) or `project_ids` are given, only those people
+  and everyone who worked on or is assigned to those projects are recomputed, so
+  a change in a project's requirements reaches its whole team.
+  Returns the number of people updated.
+  """
+  people = _affected_people_query(person_keys, project_ids)
+  if people is None:
+    return 0
+
+  graph = get_neo4j_graph()
+  cypher = f"""
+    CALL {{ {people} }}
+    WITH DISTINCT u
+    OPTIONAL MATCH (u)-[w:WORKED_ON|ASSIGNED_TO]->(proj:Project)-[:REQUIRES]->(s:Skill)
+    RETURN u.id AS person_id,
+           collect({{
+             skill: s.id,
+             status: proj.status,
+             end_date: coalesce(w.end_date, proj.end_date)
+           }}) AS history
+  """
+  rows = graph.query(
+    cypher,
+    params={
+      "person_keys": list(person_keys or []),
+      "project_ids": list(project_ids or []),
+    },
+  )
+
+  today = date.today()
+  updates = []
+  for row in rows:
+    scores: dict[str, float] = defaultdict(float)
+    for item in row["history"]:
+      end_date = _parse_date(item["end_date"])
+      if item["skill"] is None or not _is_proven(item["status"], end_date, today):
+        continue
+      scores[item["skill"]] += _recency_weight(end_date, today)
+
+    skills = sorted(scores)
+    updates.append(
+      {
+        "person_id": row["person_id"],
+        "skills": skills,
+        "scores": [round(scores[skill], 4) for skill in skills],
+      }
+    )
+
+  write_cypher = """
+    UNWIND $updates AS row
+    MATCH (u:Person {id: row.person_id})
+    SET u.proven_skills = row.skills,
+        u.proven_scores = row.scores,
+        u.proven_computed_at = toString(date())
+  """
+  for i in range(0, len(updates), _WRITE_BATCH_SIZE):
+    graph.query(write_cypher, params={"updates": updates[i : i + _WRITE_BATCH_SIZE]})
+
+  notify_graph_write()
+  logger.info("Recomputed proven experience for %s people", len(updates))
+  return len(updates)
+
+
+def proven_experience_score(
+  proven_skills: list[str] | None,
+  proven_scores: list[float] | None,
+  required_skills: list[str],
+) -> float:
+  """Sum the proven experience of the required skills, each capped at 1."""
+  if not (proven_skills and proven_scores):
+    return 0.0
+
+  proven = dict(zip(proven_skills, proven_scores, strict=False))
+  return sum(min(proven.get(skill, 0.0), 1.0) for skill in required_skills)
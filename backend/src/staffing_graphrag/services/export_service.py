@@ -0,0 +1,53 @@
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Literal
+
+import orjson
+
+from core.config import config
+from repositories.programmer_repository import iter_programmers
+from repositories.project_repository import iter_projects
+from repositories.rfp_repository import iter_rfps
+
+ExportEntity = Literal["programmers", "projects", "rfps"]
+
+EXPORTERS: dict[str, Callable[[int | None], Iterator[dict[str, Any]]]] = {
+  "programmers": iter_programmers,
+  "projects": iter_projects,
+  "rfps": iter_rfps,
+}
+
+
+def ndjson_chunks(
+  rows: Iterable[dict[str, Any]], chunk_bytes: int = config.EXPORT_CHUNK_BYTES
+) -> Iterator[bytes]:
+  """Encode rows as NDJSON, yielding roughly ``chunk_bytes`` at a time."""
+  buffer = bytearray()
+  for row in rows:
+    buffer += orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+    if len(buffer) >= chunk_bytes:
+      yield bytes(buffer)
+      buffer.clear()
+  if buffer:
+    yield bytes(buffer)
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+  """Gzip a byte stream incrementally, without holding the whole body."""
+  compressor = zlib.compressobj(wbits=31)  # 16 + 15: gzip header and trailer
+  for chunk in chunks:
+    if compressed := compressor.compress(chunk):
+      yield compressed
+  yield compressor.flush()
+
+
+def export_entities(
+  entity: ExportEntity, since_version: int | None = None, *, compress: bool = False
+) -> Iterator[bytes]:
+  """Stream one entity type as NDJSON, optionally gzipped.
+
+  With ``since_version``, only entities written after that data version are
+  included. Deletions are not tracked, so incremental exports never remove rows.
+  """
+  chunks = ndjson_chunks(EXPORTERS[entity](since_version))
+  return gzip_chunks(chunks) if compress else chunks
@@ -0,0 +1,42 @@
+import csv
+import logging
+from functools import lru_cache
+
+from core.constants import GAZETTEER_FILE
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(name: str) -> str:
+  return " ".join(name.strip().lower().split())
+
+
+@lru_cache(maxsize=1)
+def _load_gazetteer() -> dict[str, tuple[float, float]]:
+  """Load the bundled gazetteer into a name -> (latitude, longitude) lookup."""
+  entries: dict[str, tuple[float, float]] = {}
+  with GAZETTEER_FILE.open("r", encoding="utf-8", newline="") as f:
+    for row in csv.DictReader(f):
+      coords = (float(row["latitude"]), float(row["longitude"]))
+      entries.setdefault(_normalize(row["name"]), coords)
+      entries.setdefault(_normalize(f"{row['name']}, {row['country']}"), coords)
+
+  logger.info("Loaded %s gazetteer entries from %s", len(entries), GAZETTEER_FILE)
+  return entries
+
+
+def geocode(location: str | None) -> tuple[float, float] | None:
+  """Resolve a free-text location to (latitude, longitude) via the offline gazetteer.
+
+  Falls back to the leading comma-separated part, so "Berlin, DE" resolves as "Berlin".
+  Returns None for unknown places.
+  """
+  if not location:
+    return None
+
+  gazetteer = _load_gazetteer()
+  normalized = _normalize(location)
+  if normalized in gazetteer:
+    return gazetteer[normalized]
+
+  return gazetteer.get(_normalize(normalized.split(",")[0]))
@@ -12,8 +12,11 @@ from core.config import config
 from core.models.cv_models import CVStructure
 from core.utils import extract_text_from_pdf
 from repositories.cv_repository import upsert_cv
+from repositories.programmer_repository import update_programmer_summaries
+from services.data_version import reserve_data_version
 from services.neo4j_service import get_neo4j_graph
 from services.openai_service import get_openai_chat
+from services.schema_service import notify_graph_write
 
 logger = logging.getLogger(__name__)
 
@@ -113,12 +116,23 @@ async def _ingest_via_transformer(pdf_path: Path, text: str) -> dict[str, Any]:
     if not graph_documents:
       return {"status": "warning", "message": "LLM failed to extract graph data"}
 
-    graph = get_neo4j_graph()
-    graph.add_graph_documents(
-      graph_documents,  # type: ignore[arg-type]
-      baseEntityLabel=False,
-      include_source=False,
+    person_ids = sorted(
+      {
+        str(node.id)
+        for graph_document in graph_documents
+        for node in graph_document.nodes
+        if node.type == "Person"
+      }
     )
+    graph = get_neo4j_graph()
+    with reserve_data_version() as data_version:
+      graph.add_graph_documents(
+        graph_documents,  # type: ignore[arg-type]
+        baseEntityLabel=False,
+        include_source=False,
+      )
+      update_programmer_summaries(person_ids, data_version)
+    notify_graph_write()
 
     return {
       "status": "success",
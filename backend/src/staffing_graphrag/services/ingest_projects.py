@@ -25,6 +25,7 @@ async def process_projects_json(path: Path) -> dict[str, Any]:
 
     processed_count = 0
     errors = []
+    affected_projects: set[str] = set()
 
     for item in raw_data:
       try:
@@ -32,6 +33,7 @@ async def process_projects_json(path: Path) -> dict[str, Any]:
 
         upsert_project(project)
         processed_count += 1
+        affected_projects.add(project.id)
 
       except Exception as e:
         logger.exception("Failed to process project - %s", item.get("id", "unknown"))
@@ -42,6 +44,7 @@ async def process_projects_json(path: Path) -> dict[str, Any]:
       "processed": processed_count,
       "total_in_file": len(raw_data),
       "errors": errors,
+      "affected_projects": sorted(affected_projects),
     }
 
   except Exception as e:
@@ -1,14 +1,53 @@
+from collections.abc import Iterator
 from functools import lru_cache
+from typing import Any
 
 from langchain_neo4j import Neo4jGraph
+from neo4j import READ_ACCESS, Driver, GraphDatabase
 
 from core.config import config
 
 
+def _password() -> str | None:
+  return config.NEO4J_PASSWORD.get_secret_value() if config.NEO4J_PASSWORD else None
+
+
 @lru_cache(maxsize=1)
 def get_neo4j_graph() -> Neo4jGraph:
-  password = config.NEO4J_PASSWORD.get_secret_value() if config.NEO4J_PASSWORD else None
-
+  # The schema is introspected on demand by the schema service, not on connect
   return Neo4jGraph(
-    url=config.NEO4J_URI, username=config.NEO4J_USERNAME, password=password
+    url=config.NEO4J_URI,
+    username=config.NEO4J_USERNAME,
+    password=_password(),
+    database=config.NEO4J_DATABASE,
+    refresh_schema=False,
   )
+
+
+@lru_cache(maxsize=1)
+def get_neo4j_driver() -> Driver:
+  """Shared driver for code that needs sessions beyond ``Neo4jGraph.query``.
+
+  Sessions must pass ``database=config.NEO4J_DATABASE`` explicitly.
+  """
+  return GraphDatabase.driver(
+    config.NEO4J_URI, auth=(config.NEO4J_USERNAME, _password() or "")
+  )
+
+
+def iter_query(
+  cypher: str,
+  params: dict[str, Any] | None = None,
+  fetch_size: int = config.EXPORT_FETCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+  """Yield records lazily from a read session, ``fetch_size`` rows per round trip.
+
+  Unlike ``Neo4jGraph.query``, the result is never materialized in full.
+  """
+  with get_neo4j_driver().session(
+    database=config.NEO4J_DATABASE,
+    default_access_mode=READ_ACCESS,
+    fetch_size=fetch_size,
+  ) as session:
+    for record in session.run(cypher, params or {}):
+      yield record.data()
@@ -1,3 +1,4 @@
+import asyncio
 from functools import lru_cache
 
 from langchain_openai import ChatOpenAI
@@ -19,6 +20,13 @@ def get_openai_chat(
     ChatOpenAI(
       model=model_name,
       temperature=temperature,
+      stream_usage=True,
       api_key=SecretStr(config.OPENAI_API_KEY.get_secret_value()),
     )
   )
+
+
+@lru_cache(maxsize=1)
+def get_llm_semaphore() -> asyncio.Semaphore:
+  """Shared cap on in-flight LLM calls, so batches do not exhaust the rate limit."""
+  return asyncio.Semaphore(config.OPENAI_MAX_CONCURRENCY)
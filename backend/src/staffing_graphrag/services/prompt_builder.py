@@ -0,0 +1,128 @@
+import json
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from core.config import config
+from core.constants import CYPHER_EXAMPLES_FILE
+from services.query_router import get_entity_index
+from services.question_features import keyword_labels
+from services.semantic_cache import HashingVectorizer
+from services.token_budget import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CypherExample:
+  question: str
+  cypher: str
+
+  def render(self) -> str:
+    return f"# {self.question}\n{self.cypher}"
+
+
+class ExampleBank:
+  """Few-shot Cypher examples ranked by lexical similarity to the question."""
+
+  def __init__(self, examples: list[CypherExample]) -> None:
+    self._vectorizer = HashingVectorizer()
+    self.examples = examples
+    self._matrix = (
+      np.vstack([self._vectorizer.transform(example.question) for example in examples])
+      if examples
+      else np.zeros((0, self._vectorizer.n_features), dtype=np.float32)
+    )
+
+  def select(self, question: str, k: int) -> list[CypherExample]:
+    if not self.examples or k <= 0:
+      return []
+    similarities = self._matrix @ self._vectorizer.transform(question)
+    best = np.argsort(-similarities, kind="stable")[:k]
+    return [self.examples[i] for i in best]
+
+
+@lru_cache(maxsize=1)
+def get_example_bank() -> ExampleBank:
+  with CYPHER_EXAMPLES_FILE.open(encoding="utf-8") as f:
+    examples = [CypherExample(**entry) for entry in json.load(f)]
+  logger.info("Loaded %s Cypher examples", len(examples))
+  return ExampleBank(examples)
+
+
+def mentioned_labels(question: str) -> set[str]:
+  """Labels named in the question by keyword or through a known entity id."""
+  return keyword_labels(question) | get_entity_index().mentioned_labels(question)
+
+
+def prune_schema(structured_schema: dict[str, Any], labels: set[str]) -> str:
+  """Render the schema restricted to the labels and their one-hop neighbourhood."""
+  relationships = [
+    rel
+    for rel in structured_schema.get("relationships", [])
+    if rel["start"] in labels or rel["end"] in labels
+  ]
+  reachable = labels | {rel["start"] for rel in relationships}
+  reachable |= {rel["end"] for rel in relationships}
+  rel_types = {rel["type"] for rel in relationships}
+
+  def props(entries: list[dict[str, Any]]) -> str:
+    return ", ".join(f"{entry['property']}: {entry['type']}" for entry in entries)
+
+  node_lines = [
+    f"{label} {{{props(entries)}}}"
+    for label, entries in structured_schema.get("node_props", {}).items()
+    if label in reachable
+  ]
+  rel_prop_lines = [
+    f"{rel_type} {{{props(entries)}}}"
+    for rel_type, entries in structured_schema.get("rel_props", {}).items()
+    if rel_type in rel_types
+  ]
+  rel_lines = [
+    f"(:{rel['start']})-[:{rel['type']}]->(:{rel['end']})" for rel in relationships
+  ]
+  return "\n".join(
+    [
+      "Node properties:",
+      *node_lines,
+      "Relationship properties:",
+      *rel_prop_lines,
+      "The relationships:",
+      *rel_lines,
+    ]
+  )
+
+
+def build_generation_inputs(
+  question: str, schema: str, structured_schema: dict[str, Any]
+) -> dict[str, str]:
+  """Select few-shot examples and prune the schema for the Cypher generation prompt.
+
+  Falls back to the full schema when the question mentions no known label or entity.
+  Logs the estimated prompt tokens against the full schema and whole example bank.
+  """
+  bank = get_example_bank()
+  examples = bank.select(question, config.QUERY_FEW_SHOT_EXAMPLES)
+
+  pruned = schema
+  if config.QUERY_SCHEMA_PRUNING_ENABLED:
+    labels = mentioned_labels(question)
+    if labels:
+      pruned = prune_schema(structured_schema, labels)
+
+  rendered = "\n\n".join(example.render() for example in examples)
+  full_tokens = estimate_tokens(schema) + estimate_tokens(
+    "\n\n".join(example.render() for example in bank.examples)
+  )
+  logger.info(
+    "Cypher prompt context trimmed from ~%s to ~%s tokens (%s/%s examples)",
+    full_tokens,
+    estimate_tokens(pruned) + estimate_tokens(rendered),
+    len(examples),
+    len(bank.examples),
+  )
+  return {"question": question, "schema": pruned, "examples": rendered}
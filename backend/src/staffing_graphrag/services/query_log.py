@@ -0,0 +1,84 @@
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any
+
+from core.constants import QUERY_LOG_FILE
+
+_COLUMNS = (
+  "question",
+  "intent",
+  "cache_hit",
+  "direct_answer",
+  "cypher",
+  "row_count",
+  "generation_ms",
+  "execution_ms",
+  "qa_ms",
+  "total_ms",
+  "input_tokens",
+  "output_tokens",
+  "success",
+  "error",
+)
+_FLAGS = frozenset({"cache_hit", "direct_answer", "success"})
+
+
+class QueryLog:
+  """Append-only record of answered questions, used to replay real traffic."""
+
+  def __init__(self) -> None:
+    QUERY_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    self._lock = threading.Lock()
+    self._conn = sqlite3.connect(QUERY_LOG_FILE, check_same_thread=False)
+    self._conn.execute("""
+      CREATE TABLE IF NOT EXISTS query_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        created_at REAL NOT NULL,
+        question TEXT NOT NULL,
+        intent TEXT,
+        cache_hit INTEGER NOT NULL DEFAULT 0,
+        direct_answer INTEGER NOT NULL DEFAULT 0,
+        cypher TEXT,
+        row_count INTEGER,
+        generation_ms REAL,
+        execution_ms REAL,
+        qa_ms REAL,
+        total_ms REAL,
+        input_tokens INTEGER,
+        output_tokens INTEGER,
+        success INTEGER NOT NULL,
+        error TEXT
+      )
+    """)
+    self._conn.commit()
+
+  def record(self, entry: dict[str, Any]) -> None:
+    values = [
+      bool(entry.get(column)) if column in _FLAGS else entry.get(column)
+      for column in _COLUMNS
+    ]
+    with self._lock:
+      self._conn.execute(
+        f"INSERT INTO query_log (created_at, {', '.join(_COLUMNS)}) "  # noqa: S608
+        f"VALUES ({', '.join('?' * (len(_COLUMNS) + 1))})",
+        [time.time(), *values],
+      )
+      self._conn.commit()
+
+  def entries(self, limit: int | None = None) -> list[dict[str, Any]]:
+    """Return logged queries, oldest first."""
+    with self._lock:
+      cursor = self._conn.execute(
+        f"SELECT id, created_at, {', '.join(_COLUMNS)} FROM query_log "  # noqa: S608
+        "ORDER BY id LIMIT ?",
+        (-1 if limit is None else limit,),
+      )
+      names = [description[0] for description in cursor.description]
+      return [dict(zip(names, row, strict=True)) for row in cursor.fetchall()]
+
+
+@lru_cache(maxsize=1)
+def get_query_log() -> QueryLog:
+  return QueryLog()
@@ -0,0 +1,275 @@
+import json
+import logging
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from services.cypher_cache import normalize_question
+from services.neo4j_service import get_neo4j_graph
+from services.schema_service import on_graph_write
+
+logger = logging.getLogger(__name__)
+
+_PEOPLE = r"(?:people|persons|programmers|developers|engineers|candidates)"
+_WHO = rf"(?:who|which {_PEOPLE}|(?:find|list|show) {_PEOPLE}(?: who)?|{_PEOPLE})"
+_HAS = r"(?:has|have|knows?|with)"
+_SKILL_SUFFIX = r"(?: skills?| experience)?"
+
+
+def word_tokens(text: str) -> list[str]:
+  """Lowercased word tokens, keeping "c++", "c#" and "node.js" whole."""
+  return [
+    word
+    for word in (
+      token.strip(".") for token in re.findall(r"[a-z0-9+#.]+", text.lower())
+    )
+    if word
+  ]
+
+
+class EntityIndex:
+  """In-memory case-insensitive lookup of known Skill, Location and Company ids."""
+
+  LABELS = ("Skill", "Location", "Company")
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._ids: dict[str, dict[str, str]] | None = None
+
+  def _ensure_loaded(self) -> dict[str, dict[str, str]]:
+    if self._ids is not None:
+      return self._ids
+
+    with self._lock:
+      if self._ids is None:
+        graph = get_neo4j_graph()
+        self._ids = {
+          label: {
+            str(row["id"]).lower(): row["id"]
+            for row in graph.query(f"MATCH (n:{label}) RETURN n.id AS id")
+          }
+          for label in self.LABELS
+        }
+    return self._ids
+
+  def invalidate(self) -> None:
+    with self._lock:
+      self._ids = None
+
+  def resolve(self, label: str, text: str) -> str | None:
+    return self._ensure_loaded()[label].get(text.strip(" \"'").lower())
+
+  def mentioned_labels(self, text: str) -> set[str]:
+    """Labels having at least one node whose id occurs as a phrase in the text."""
+    padded = f" {' '.join(word_tokens(text))} "
+    return {
+      label
+      for label, ids in self._ensure_loaded().items()
+      if any(f" {key} " in padded for key in ids)
+    }
+
+  def mentioned_ids(self, text: str) -> frozenset[str]:
+    """Known ids occurring as whole phrases in the text ("java" not in "javascript")."""
+    tokens = word_tokens(text)
+    phrases = {
+      " ".join(tokens[start:end])
+      for start in range(len(tokens))
+      for end in range(start + 1, len(tokens) + 1)
+    }
+    return frozenset(
+      key for ids in self._ensure_loaded().values() for key in phrases & ids.keys()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_entity_index() -> EntityIndex:
+  return EntityIndex()
+
+
+on_graph_write(get_entity_index().invalidate)
+
+
+def _names(rows: list[dict[str, Any]]) -> str:
+  return ", ".join(str(row["name"]) for row in rows)
+
+
+@dataclass(frozen=True)
+class _Template:
+  intent: str
+  pattern: re.Pattern[str]
+  slots: dict[str, str]  # regex group -> entity label
+  cypher: str
+  answer: Callable[[dict[str, str], list[dict[str, Any]]], str]
+
+
+@dataclass
+class TemplateMatch:
+  intent: str
+  cypher: str
+  params: dict[str, str]
+  answer: Callable[[list[dict[str, Any]]], str]
+
+  def display_cypher(self) -> str:
+    """Return the Cypher with parameters inlined, for display only."""
+    cypher = self.cypher
+    for name, value in self.params.items():
+      cypher = cypher.replace(f"${name}", json.dumps(value))
+    return cypher
+
+
+_TEMPLATES = [
+  _Template(
+    intent="count_people",
+    pattern=re.compile(
+      rf"^how many {_PEOPLE} (?:are )?(?:there )?"
+      r"(?:in (?:the|our) (?:knowledge graph|graph|database)|do we have|are there)$"
+    ),
+    slots={},
+    cypher="MATCH (p:Person) RETURN count(p) AS count",
+    answer=lambda _, rows: (
+      f"There are {rows[0]['count']} people in the knowledge graph."
+    ),
+  ),
+  _Template(
+    intent="count_skill",
+    pattern=re.compile(
+      rf"^how many (?:{_PEOPLE} {_HAS} (?P<skill>.+?){_SKILL_SUFFIX}"
+      rf"|(?P<skill_alt>.+?) {_PEOPLE} (?:do we have|are there))$"
+    ),
+    slots={"skill": "Skill", "skill_alt": "Skill"},
+    cypher="""
+      MATCH (p:Person)-[:HAS_SKILL]->(:Skill {id: $skill})
+      RETURN count(DISTINCT p) AS count
+    """,
+    answer=lambda slots, rows: (
+      f"There are {rows[0]['count']} people with {slots['skill']} skills."
+    ),
+  ),
+  _Template(
+    intent="people_with_skills",
+    pattern=re.compile(
+      rf"^{_WHO} {_HAS} (?:both )?(?P<skill>.+?) and "
+      rf"(?P<other_skill>.+?){_SKILL_SUFFIX}$"
+    ),
+    slots={"skill": "Skill", "other_skill": "Skill"},
+    cypher="""
+      MATCH (p:Person)-[:HAS_SKILL]->(:Skill {id: $skill})
+      MATCH (p)-[:HAS_SKILL]->(:Skill {id: $other_skill})
+      RETURN DISTINCT p.id AS name
+      ORDER BY name
+    """,
+    answer=lambda slots, rows: (
+      f"People with both {slots['skill']} and {slots['other_skill']} skills: "
+      f"{_names(rows)}."
+      if rows
+      else f"No one has both {slots['skill']} and {slots['other_skill']} skills."
+    ),
+  ),
+  _Template(
+    intent="people_with_skill",
+    pattern=re.compile(rf"^{_WHO} {_HAS} (?P<skill>.+?){_SKILL_SUFFIX}$"),
+    slots={"skill": "Skill"},
+    cypher="""
+      MATCH (p:Person)-[:HAS_SKILL]->(:Skill {id: $skill})
+      RETURN p.id AS name
+      ORDER BY name
+    """,
+    answer=lambda slots, rows: (
+      f"People with {slots['skill']} skills: {_names(rows)}."
+      if rows
+      else f"No one in the database has {slots['skill']} skills."
+    ),
+  ),
+  _Template(
+    intent="people_in_location",
+    pattern=re.compile(
+      rf"^(?:{_WHO}|who (?:is|are)|which {_PEOPLE} (?:are|live)) "
+      r"(?:located |based |living )?(?:in|from) (?P<location>.+)$"
+    ),
+    slots={"location": "Location"},
+    cypher="""
+      MATCH (p:Person)-[:LOCATED_IN]->(:Location {id: $location})
+      RETURN p.id AS name
+      ORDER BY name
+    """,
+    answer=lambda slots, rows: (
+      f"People located in {slots['location']}: {_names(rows)}."
+      if rows
+      else f"No one in the database is located in {slots['location']}."
+    ),
+  ),
+  _Template(
+    intent="people_at_company",
+    pattern=re.compile(rf"^{_WHO} (?:has )?worked (?:at|for) (?P<company>.+)$"),
+    slots={"company": "Company"},
+    cypher="""
+      MATCH (p:Person)-[:WORKED_AT]->(:Company {id: $company})
+      RETURN p.id AS name
+      ORDER BY name
+    """,
+    answer=lambda slots, rows: (
+      f"People who worked at {slots['company']}: {_names(rows)}."
+      if rows
+      else f"No one in the database worked at {slots['company']}."
+    ),
+  ),
+  _Template(
+    intent="top_certifications",
+    pattern=re.compile(
+      r"^(?:what|which) (?:are (?:the )?most common certifications"
+      r"|certifications are (?:the )?most common)$"
+    ),
+    slots={},
+    cypher="""
+      MATCH (p:Person)-[:EARNED]->(c:Certification)
+      RETURN c.id AS certification, count(p) AS holders
+      ORDER BY holders DESC, certification
+      LIMIT 10
+    """,
+    answer=lambda _, rows: (
+      "The most common certifications are: "
+      + ", ".join(f"{row['certification']} ({row['holders']})" for row in rows)
+      + "."
+      if rows
+      else "There are no certifications in the database."
+    ),
+  ),
+]
+
+
+def match_question(question: str) -> TemplateMatch | None:
+  """Match a question against the known intents and resolve its slots.
+
+  Returns None when no template fits or a slot does not name a known entity, in
+  which case the caller falls back to LLM Cypher generation.
+  """
+  normalized = normalize_question(question)
+  index = get_entity_index()
+
+  for template in _TEMPLATES:
+    match = template.pattern.match(normalized)
+    if not match:
+      continue
+
+    params: dict[str, str] = {}
+    for group, label in template.slots.items():
+      text = match.group(group)
+      if text is None:
+        continue
+      resolved = index.resolve(label, text)
+      if resolved is None:
+        break
+      params[group.removesuffix("_alt")] = resolved
+    else:
+      logger.info("Routed question to template '%s': %s", template.intent, params)
+      return TemplateMatch(
+        intent=template.intent,
+        cypher=template.cypher,
+        params=params,
+        answer=lambda rows, t=template, p=params: t.answer(p, rows),
+      )
+
+  return None
@@ -1,25 +1,52 @@
+import asyncio
 import logging
+import threading
+import time
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any
 
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import RunnableConfig
 from langchain_neo4j import GraphCypherQAChain
+from langchain_neo4j.chains.graph_qa.cypher import extract_cypher
 
 from core import prompts
 from core.config import config
+from services import query_router
+from services.answer_formatter import format_direct_answer, to_jsonable
+from services.cypher_cache import (
+  get_cypher_cache,
+  normalize_question,
+  schema_fingerprint,
+)
+from services.cypher_guard import run_guarded
 from services.neo4j_service import get_neo4j_graph
-from services.openai_service import get_openai_chat
+from services.openai_service import get_llm_semaphore, get_openai_chat
+from services.prompt_builder import build_generation_inputs
+from services.query_log import get_query_log
+from services.schema_service import is_schema_stale, refresh_schema
+from services.semantic_cache import get_semantic_cache
+from services.token_budget import trim_to_token_budget
 
 logger = logging.getLogger(__name__)
 
 
-def _get_qa_chain() -> GraphCypherQAChain:
+_STAGES = ("generation", "execution", "qa", "total")
+
+
+def _build_qa_chain(llm: BaseChatModel | None = None) -> GraphCypherQAChain:
   graph = get_neo4j_graph()
 
-  openai_chat_resulta = get_openai_chat(config.OPENAI_GRAPH_QUERY_MODEL)
-  if openai_chat_resulta.err():
-    assert False  # TODO: propagate further # noqa: B011, PT015, S101, RUF100
+  if llm is None:
+    openai_chat_resulta = get_openai_chat(config.OPENAI_GRAPH_QUERY_MODEL)
+    if openai_chat_resulta.err():
+      assert False  # TODO: propagate further # noqa: B011, PT015, S101, RUF100
+    llm = openai_chat_resulta.ok()
 
   return GraphCypherQAChain.from_llm(
-    llm=openai_chat_resulta.ok(),
+    llm=llm,
     graph=graph,
     verbose=True,
     cypher_prompt=prompts.cypher_generation_prompt,
@@ -30,34 +57,332 @@ def _get_qa_chain() -> GraphCypherQAChain:
   )
 
 
-async def process_query(question: str) -> dict[str, Any]:
-  """Execute a natural language query against the Knowledge Graph."""
-  try:
-    chain = _get_qa_chain()
+class QAChainHolder:
+  """The current QA chain, rebuilt in the background once the graph schema is stale.
+
+  Queries keep using the previous chain while the schema is re-introspected, so a
+  write never blocks the request path on APOC metadata and chain construction.
+  """
+
+  def __init__(self) -> None:
+    self.chain: GraphCypherQAChain | None = None
+    self._llm: BaseChatModel | None = None
+    self._lock = threading.Lock()
+    self._rebuilding = threading.Lock()
+
+  def rebuild(self, llm: BaseChatModel | None = None) -> None:
+    with self._lock:
+      if llm is not None:
+        self._llm = llm
+      refresh_schema()
+      self.chain = _build_qa_chain(self._llm)
+
+  def schedule_rebuild(self) -> None:
+    """Start a background rebuild unless one is already running."""
+    if self._rebuilding.acquire(blocking=False):
+      threading.Thread(target=self._rebuild_in_background, daemon=True).start()
+
+  def _rebuild_in_background(self) -> None:
+    try:
+      self.rebuild()
+    except Exception:
+      logger.exception("Failed to rebuild the QA chain; serving the previous one.")
+    finally:
+      self._rebuilding.release()
+
+
+@lru_cache(maxsize=1)
+def get_qa_chain_holder() -> QAChainHolder:
+  return QAChainHolder()
+
+
+def init_qa_chain(llm: BaseChatModel | None = None) -> None:
+  """Introspect the graph schema and build the QA chain.
+
+  Called from the application lifespan. The replay benchmark passes a stub ``llm``,
+  which later background rebuilds keep using.
+  """
+  get_qa_chain_holder().rebuild(llm)
+
+
+async def _get_qa_chain() -> GraphCypherQAChain:
+  holder = get_qa_chain_holder()
+  if holder.chain is None:
+    await asyncio.to_thread(holder.rebuild)
+  elif is_schema_stale():
+    holder.schedule_rebuild()
+  assert holder.chain is not None  # noqa: S101
+  return holder.chain
+
+
+async def _generate_cypher(
+  chain: GraphCypherQAChain, question: str, run_config: RunnableConfig | None = None
+) -> str:
+  inputs = build_generation_inputs(
+    question, chain.graph_schema, chain.graph.get_structured_schema
+  )
+  async with get_llm_semaphore():
+    generated = await chain.cypher_generation_chain.ainvoke(inputs, run_config)
+  cypher = extract_cypher(generated)
+  if chain.cypher_query_corrector:
+    cypher = chain.cypher_query_corrector(cypher)
+  return cypher
+
+
+async def _execute_cypher(
+  chain: GraphCypherQAChain, cypher: str
+) -> list[dict[str, Any]]:
+  if not cypher:
+    return []
+  if config.QUERY_GUARD_ENABLED:
+    return await asyncio.to_thread(run_guarded, cypher)
+  return await asyncio.to_thread(chain.graph.query, cypher)
+
+
+async def _resolve_cypher(
+  chain: GraphCypherQAChain, question: str, run_config: RunnableConfig | None = None
+) -> tuple[str, dict[str, Any]]:
+  """Get Cypher for the question from the caches, or generate it with the LLM.
+
+  Returns the Cypher and the cache details of the "cypher" event.
+  """
+  cache = get_cypher_cache()
+  fingerprint = schema_fingerprint(chain.graph_schema)
+
+  cypher_query = (
+    cache.get(question, fingerprint) if config.QUERY_CYPHER_CACHE_ENABLED else None
+  )
+  if cypher_query is not None:
+    return cypher_query, {"cache_hit": True}
+
+  if config.QUERY_SEMANTIC_CACHE_ENABLED:
+    semantic_hit = get_semantic_cache().lookup(question, fingerprint)
+    if semantic_hit:
+      logger.info(
+        "Semantic cache hit (%.2f) for '%s' via '%s'",
+        semantic_hit.similarity,
+        question,
+        semantic_hit.question,
+      )
+      cache.put(question, fingerprint, semantic_hit.cypher, semantic_hit.generation_ms)
+      return semantic_hit.cypher, {
+        "cache_hit": True,
+        "matched_question": semantic_hit.question,
+      }
+
+  start = time.perf_counter()
+  cypher_query = await _generate_cypher(chain, question, run_config)
+  generation_ms = (time.perf_counter() - start) * 1000
+  logger.info("Generated Cypher in %.0f ms: %s", generation_ms, cypher_query)
+
+  return cypher_query, {"cache_hit": False, "_generation_ms": generation_ms}
+
+
+def _lap(trace: dict[str, Any], stage: str, since: float) -> float:
+  """Record the stage duration in the trace and return the current time."""
+  now = time.perf_counter()
+  trace[f"{stage}_ms"] = round((now - since) * 1000, 2)
+  return now
+
+
+async def _template_events(
+  match: query_router.TemplateMatch, trace: dict[str, Any]
+) -> AsyncIterator[dict[str, Any]]:
+  """Answer a question routed to a parametrized template, without any LLM call."""
+  trace.update(intent=match.intent, cypher=match.display_cypher())
+  yield {
+    "event": "cypher",
+    "cypher_query": match.display_cypher(),
+    "intent": match.intent,
+  }
+
+  stage_start = time.perf_counter()
+  rows = await asyncio.to_thread(get_neo4j_graph().query, match.cypher, match.params)
+  _lap(trace, "execution", stage_start)
+  trace.update(row_count=len(rows), direct_answer=True)
+  yield {"event": "row_count", "row_count": len(rows)}
+  yield {"event": "rows", "rows": to_jsonable(rows)}
+  yield {"event": "answer", "answer": match.answer(rows), "direct_answer": True}
+
 
-    result: dict[str, Any] = await chain.ainvoke({"query": question})
+def _remember_cypher(
+  chain: GraphCypherQAChain, question: str, cypher: str, generation_ms: float
+) -> None:
+  """Cache freshly generated Cypher once it has executed successfully."""
+  fingerprint = schema_fingerprint(chain.graph_schema)
+  get_cypher_cache().put(question, fingerprint, cypher, generation_ms)
+  get_semantic_cache().add(question, fingerprint, cypher, generation_ms)
 
-    # Extract intermediate step (the actual Cypher query generated)
-    cypher_query = ""
-    steps = result.get("intermediate_steps", [])
-    if steps and isinstance(steps[0], dict):
-      cypher_query = steps[0].get("query", "")
 
-    return {
-      "question": question,
-      "answer": result.get("result", "No answer generated"),
-      "cypher_query": cypher_query,
-      "success": True,
-    }
+async def _chain_events(
+  question: str, trace: dict[str, Any], run_config: RunnableConfig
+) -> AsyncIterator[dict[str, Any]]:
+  """Answer a question with cached or generated Cypher and the QA model."""
+  chain = await _get_qa_chain()
+  cypher_query, cache_details = await _resolve_cypher(chain, question, run_config)
+  generation_ms = cache_details.pop("_generation_ms", None)
+  trace.update(
+    cypher=cypher_query,
+    cache_hit=cache_details["cache_hit"],
+    generation_ms=generation_ms,
+  )
+  yield {"event": "cypher", "cypher_query": cypher_query, **cache_details}
+
+  stage_start = time.perf_counter()
+  rows = await _execute_cypher(chain, cypher_query)
+  stage_start = _lap(trace, "execution", stage_start)
+  trace["row_count"] = len(rows)
+  context = trim_to_token_budget(rows[: chain.top_k])
+  yield {"event": "row_count", "row_count": len(rows)}
+  yield {"event": "rows", "rows": to_jsonable(rows)}
+
+  if generation_ms is not None and cypher_query:
+    _remember_cypher(chain, question, cypher_query, generation_ms)
+
+  answer = _direct_answer(rows, context)
+  if answer is not None:
+    trace["direct_answer"] = True
+    yield {"event": "answer", "answer": answer, "direct_answer": True}
+    return
+
+  async with get_llm_semaphore():
+    async for token in chain.qa_chain.astream(
+      {"question": question, "context": context}, run_config
+    ):
+      yield {"event": "token", "text": token}
+  _lap(trace, "qa", stage_start)
+
+
+async def stream_query(
+  question: str, run_config: RunnableConfig | None = None
+) -> AsyncIterator[dict[str, Any]]:
+  """Run the query pipeline, yielding an event as soon as each stage completes.
+
+  Events, in order: "cypher", "row_count", "rows", then either a single "answer"
+  (template or direct answer) or a sequence of "token" events streamed from the
+  QA model, and finally "done" carrying stage timings and token usage. Failures
+  yield an "error" event instead. Every run is recorded in the query log.
+  """
+  usage = UsageMetadataCallbackHandler()
+  run_config = {**(run_config or {})}
+  run_config["callbacks"] = [*run_config.get("callbacks", []), usage]
+  trace: dict[str, Any] = {"question": question, "success": True}
+  start = time.perf_counter()
+
+  try:
+    match = (
+      query_router.match_question(question)
+      if config.QUERY_TEMPLATE_ROUTER_ENABLED
+      else None
+    )
+    events = (
+      _template_events(match, trace)
+      if match is not None
+      else _chain_events(question, trace, run_config)
+    )
+    async for event in events:
+      yield event
+
+    _lap(trace, "total", start)
+    yield {"event": "done", "timings": _timings(trace), "usage": _usage(usage)}
 
   except Exception as e:
     logger.exception("Graph QA failed.")
-    return {
-      "question": question,
-      "answer": "I encountered an error processing your query.",
-      "error": str(e),
-      "success": False,
-    }
+    _lap(trace, "total", start)
+    trace.update(success=False, error=str(e))
+    yield {"event": "error", "error": str(e)}
+
+  finally:
+    if config.QUERY_LOG_ENABLED:
+      get_query_log().record({**trace, **_usage(usage)})
+
+
+def _direct_answer(
+  rows: list[dict[str, Any]], context: list[dict[str, Any]]
+) -> str | None:
+  """Phrase the result without the QA model, only when it fits the QA context whole.
+
+  A truncated result would otherwise be reported as if it were complete.
+  """
+  if not config.QUERY_DIRECT_ANSWER_ENABLED or len(context) < len(rows):
+    return None
+  return format_direct_answer(rows)
+
+
+def _timings(trace: dict[str, Any]) -> dict[str, float | None]:
+  return {stage: trace.get(f"{stage}_ms") for stage in _STAGES}
+
+
+def _usage(handler: UsageMetadataCallbackHandler) -> dict[str, int]:
+  """Sum token usage over every model called during the run."""
+  usage = handler.usage_metadata.values()
+  return {
+    "input_tokens": sum(model["input_tokens"] for model in usage),
+    "output_tokens": sum(model["output_tokens"] for model in usage),
+  }
+
+
+async def process_query(
+  question: str, run_config: RunnableConfig | None = None
+) -> dict[str, Any]:
+  """Execute a natural language query against the Knowledge Graph.
+
+  Common question shapes are answered by the deterministic template router.
+  Other questions go through LLM Cypher generation, cached per graph schema, so
+  repeated questions skip the generation LLM call and go straight to execution.
+  Close paraphrases of cached questions reuse their Cypher via the semantic cache;
+  the Cypher is always re-executed, so answers reflect the live graph.
+  """
+  result: dict[str, Any] = {"question": question, "success": True}
+  tokens: list[str] = []
+
+  async for event in stream_query(question, run_config):
+    kind = event.pop("event")
+    if kind == "error":
+      result = {
+        "question": question,
+        "answer": "I encountered an error processing your query.",
+        "error": event["error"],
+        "success": False,
+      }
+    elif kind == "token":
+      tokens.append(event["text"])
+    else:
+      result.update(event)
+
+  if "answer" not in result:
+    result["answer"] = "".join(tokens) or "No answer generated"
+  return result
+
+
+async def process_batch(questions: list[str]) -> list[dict[str, Any]]:
+  """Answer several questions concurrently, returning results in input order.
+
+  Questions that normalize to the same text are answered once. LLM calls share the
+  global concurrency limit, and each Cypher read runs in its own session.
+  """
+  unique: dict[str, str] = {}
+  for question in questions:
+    unique.setdefault(normalize_question(question), question)
+
+  keys = list(unique)
+  results = await asyncio.gather(*[process_query(unique[key]) for key in keys])
+  by_key = dict(zip(keys, results, strict=True))
+
+  logger.info("Answered %s questions (%s unique)", len(questions), len(keys))
+  return [
+    {**by_key[normalize_question(question)], "question": question}
+    for question in questions
+  ]
+
+
+def get_cache_stats() -> dict[str, Any]:
+  return {**get_cypher_cache().stats(), "semantic": get_semantic_cache().stats()}
+
+
+def clear_cache() -> None:
+  get_cypher_cache().clear()
+  get_semantic_cache().clear()
 
 
 def get_example_queries_list() -> dict[str, list[str]]:
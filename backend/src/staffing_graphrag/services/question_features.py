@@ -0,0 +1,54 @@
+import re
+
+# Words that name a node label directly ("Which universities ...", "open RFPs")
+_LABEL_KEYWORDS = {
+  "Person": r"person|people|persons|programmers?|developers?|engineers?|employees?"
+  r"|candidates?|who",
+  "Skill": r"skills?|knows?|technolog(?:y|ies)|languages?|frameworks?",
+  "Company": r"compan(?:y|ies)|employers?|worked\s+at",
+  "University": r"universit(?:y|ies)|schools?|colleges?|studied|alumni|degrees?",
+  "Location": r"locations?|located|cit(?:y|ies)|countr(?:y|ies)|where|based\s+in",
+  "Certification": r"certifi(?:ed|cations?|cates?)",
+  "Project": r"projects?|assigned|assignments?",
+  "RFP": r"rfps?|requests?\s+for\s+proposals?",
+}
+_LABEL_PATTERNS = {
+  label: re.compile(rf"\b(?:{keywords})\b", re.IGNORECASE)
+  for label, keywords in _LABEL_KEYWORDS.items()
+}
+
+_NEGATION = re.compile(
+  r"\b(?:not|no|never|without|none|nobody|nothing|neither|nor|non)\b|n't\b"
+)
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+# Words that flip or bound a query without changing its vocabulary much
+_QUALIFIERS = frozenset([
+  "most", "least", "more", "less", "fewer", "fewest", "top", "bottom", "highest",
+  "lowest", "max", "maximum", "min", "minimum", "best", "worst", "latest",
+  "earliest", "newest", "oldest", "first", "last", "before", "after", "above",
+  "below", "over", "under", "greater", "smaller", "larger", "only", "many",
+  "average", "total", "one", "two", "three", "four", "five", "six", "seven",
+  "eight", "nine", "ten",
+])  # fmt: skip
+
+
+def keyword_labels(question: str) -> set[str]:
+  """Labels named in the question by keyword."""
+  return {
+    label for label, pattern in _LABEL_PATTERNS.items() if pattern.search(question)
+  }
+
+
+def hard_features(question: str) -> frozenset[str]:
+  """Features two questions must share to be answered by the same Cypher.
+
+  Covers the labels named, negation, comparatives and superlatives, and numbers,
+  which lexical similarity weighs too lightly ("most" vs "least" common).
+  """
+  text = question.lower()
+  features = {f"label:{label}" for label in keyword_labels(text)}
+  if _NEGATION.search(text):
+    features.add("not")
+  features.update(f"num:{number}" for number in _NUMBER.findall(text))
+  features.update(word for word in re.findall(r"[a-z]+", text) if word in _QUALIFIERS)
+  return frozenset(features)
@@ -0,0 +1,76 @@
+import logging
+import threading
+from collections.abc import Callable
+
+from services.neo4j_service import get_neo4j_graph
+
+logger = logging.getLogger(__name__)
+
+Signature = tuple[frozenset[str], frozenset[str], frozenset[str]]
+
+
+class _SchemaState:
+  def __init__(self) -> None:
+    self.lock = threading.Lock()
+    self.signature: Signature | None = None
+    self.stale = True
+
+
+_state = _SchemaState()
+_write_listeners: list[Callable[[], object]] = []
+
+
+def on_graph_write(listener: Callable[[], object]) -> None:
+  """Register a callback run after every repository write (e.g. cache invalidation).
+
+  Return values are ignored.
+  """
+  _write_listeners.append(listener)
+
+
+def _current_signature() -> Signature:
+  """Read labels, relationship types and property keys from the token store."""
+  graph = get_neo4j_graph()
+  labels = graph.query("CALL db.labels() YIELD label RETURN label")
+  rel_types = graph.query(
+    "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType"
+  )
+  keys = graph.query("CALL db.propertyKeys() YIELD propertyKey RETURN propertyKey")
+  return (
+    frozenset(row["label"] for row in labels),
+    frozenset(row["relationshipType"] for row in rel_types),
+    frozenset(row["propertyKey"] for row in keys),
+  )
+
+
+def notify_graph_write() -> None:
+  """Mark the cached schema stale if a write introduced new labels, types or keys.
+
+  Called by repository writes; the query path itself never inspects the schema.
+  """
+  for listener in _write_listeners:
+    listener()
+
+  try:
+    signature = _current_signature()
+  except Exception:
+    logger.exception("Failed to read the graph schema signature.")
+    signature = None
+
+  with _state.lock:
+    if signature is None or signature != _state.signature:
+      _state.stale = True
+
+
+def is_schema_stale() -> bool:
+  return _state.stale
+
+
+def refresh_schema() -> None:
+  """Re-introspect the graph schema (APOC metadata) and remember its signature."""
+  with _state.lock:
+    signature = _current_signature()
+    get_neo4j_graph().refresh_schema()
+    _state.signature = signature
+    _state.stale = False
+  logger.info("Refreshed graph schema")
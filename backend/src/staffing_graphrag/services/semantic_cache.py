@@ -0,0 +1,194 @@
+import logging
+import re
+import threading
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import pairwise
+from typing import Any
+
+import numpy as np
+
+from core.config import config
+from services.cypher_cache import get_cypher_cache, normalize_question
+from services.query_router import get_entity_index, word_tokens
+from services.question_features import hard_features
+
+logger = logging.getLogger(__name__)
+
+_STOPWORDS = frozenset([
+  "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does", "for",
+  "from", "have", "has", "how", "i", "in", "is", "it", "me", "of", "on", "or",
+  "our", "show", "tell", "that", "the", "their", "them", "there", "these", "this",
+  "to", "us", "we", "what", "which", "who", "whom", "whose", "with",
+])  # fmt: skip
+# Folds common paraphrases onto one token ("Who knows X" ~ "Which people have X skills")
+_SYNONYMS = {
+  "know": "skill",
+  "knows": "skill",
+  "skills": "skill",
+  "experience": "skill",
+  "experienced": "skill",
+  "people": "person",
+  "persons": "person",
+  "programmers": "person",
+  "developers": "person",
+  "engineers": "person",
+  "employees": "person",
+  "candidates": "person",
+}
+_LITERAL_PATTERN = re.compile(r"""["']([^"']+)["']""")
+
+
+def _mentions(question: str, literal: str) -> bool:
+  """Whether the literal occurs in the question as whole words."""
+  phrase = " ".join(word_tokens(literal))
+  return bool(phrase) and f" {phrase} " in f" {' '.join(word_tokens(question))} "
+
+
+def _tokens(text: str) -> list[str]:
+  return [
+    _SYNONYMS.get(token, token)
+    for token in re.findall(r"[a-z0-9+#.]+", text.lower())
+    if token not in _STOPWORDS
+  ]
+
+
+class HashingVectorizer:
+  """Stateless word + character n-gram hashing vectorizer (no network, no fitting)."""
+
+  def __init__(self, n_features: int = 2**12) -> None:
+    self.n_features = n_features
+
+  def _bucket(self, feature: str) -> int:
+    return zlib.crc32(feature.encode("utf-8")) % self.n_features
+
+  def transform(self, text: str) -> np.ndarray:
+    vector = np.zeros(self.n_features, dtype=np.float32)
+    words = _tokens(text)
+    for word in words:
+      vector[self._bucket(f"w:{word}")] += 1.0
+      padded = f" {word} "
+      for i in range(len(padded) - 2):
+        vector[self._bucket(f"c:{padded[i : i + 3]}")] += 0.3
+    for first, second in pairwise(words):
+      vector[self._bucket(f"b:{first} {second}")] += 0.5
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+@dataclass
+class SemanticHit:
+  question: str
+  cypher: str
+  similarity: float
+  generation_ms: float
+
+
+class SemanticCache:
+  """Brute-force cosine index over past questions whose Cypher executed successfully.
+
+  A hit is only accepted above the similarity threshold, when both questions
+  share the same hard features (labels, negation, comparatives, numbers; see
+  `hard_features`), mention exactly the same known entities, and every string
+  literal of the stored Cypher (e.g. "React") occurs as whole words in the new
+  question. So neither "Who knows Vue?" nor "Who knows React and Vue?" reuses the
+  Cypher generated for React, nor "least common" the one for "most common".
+  """
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._vectorizer = HashingVectorizer()
+    self._fingerprint: str | None = None
+    self._matrix = np.zeros((0, self._vectorizer.n_features), dtype=np.float32)
+    self._entries: list[tuple[str, str, float]] = []
+    self._features: list[frozenset[str]] = []
+
+    self.hits = 0
+    self.misses = 0
+    self.saved_ms = 0.0
+
+  def _load(self, fingerprint: str) -> None:
+    entries = get_cypher_cache().entries(fingerprint)
+    self._entries = entries
+    self._features = [hard_features(question) for question, _, _ in entries]
+    self._matrix = (
+      np.vstack([self._vectorizer.transform(question) for question, _, _ in entries])
+      if entries
+      else np.zeros((0, self._vectorizer.n_features), dtype=np.float32)
+    )
+    self._fingerprint = fingerprint
+    logger.info("Loaded %s questions into the semantic cache", len(entries))
+
+  def lookup(self, question: str, fingerprint: str) -> SemanticHit | None:
+    vector = self._vectorizer.transform(question)
+    normalized = normalize_question(question)
+    features = hard_features(normalized)
+    entity_index = get_entity_index()
+    entities = entity_index.mentioned_ids(normalized)
+
+    with self._lock:
+      if self._fingerprint != fingerprint:
+        self._load(fingerprint)
+
+      if not self._entries:
+        self.misses += 1
+        return None
+
+      similarities = self._matrix @ vector
+      for index in np.argsort(similarities)[::-1][:5]:
+        similarity = float(similarities[index])
+        if similarity < config.QUERY_SEMANTIC_CACHE_THRESHOLD:
+          break
+        cached_question, cypher, generation_ms = self._entries[index]
+        if self._features[index] != features:
+          continue
+        if entity_index.mentioned_ids(cached_question) != entities:
+          continue
+        literals = _LITERAL_PATTERN.findall(cypher)
+        if all(_mentions(normalized, literal) for literal in literals):
+          self.hits += 1
+          self.saved_ms += generation_ms
+          return SemanticHit(cached_question, cypher, similarity, generation_ms)
+
+      self.misses += 1
+      return None
+
+  def add(
+    self, question: str, fingerprint: str, cypher: str, generation_ms: float
+  ) -> None:
+    with self._lock:
+      if self._fingerprint != fingerprint:
+        # Loaded lazily on the next lookup, which will include this entry
+        return
+      normalized = normalize_question(question)
+      self._entries.append((normalized, cypher, generation_ms))
+      self._features.append(hard_features(normalized))
+      self._matrix = np.vstack([self._matrix, self._vectorizer.transform(question)])
+
+  def clear(self) -> None:
+    with self._lock:
+      self._fingerprint = None
+      self._entries = []
+      self._features = []
+      self._matrix = np.zeros((0, self._vectorizer.n_features), dtype=np.float32)
+      self.hits = 0
+      self.misses = 0
+      self.saved_ms = 0.0
+
+  def stats(self) -> dict[str, Any]:
+    lookups = self.hits + self.misses
+    return {
+      "entries": len(self._entries),
+      "threshold": config.QUERY_SEMANTIC_CACHE_THRESHOLD,
+      "hits": self.hits,
+      "misses": self.misses,
+      "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+      "latency_saved_ms": round(self.saved_ms, 1),
+    }
+
+
+@lru_cache(maxsize=1)
+def get_semantic_cache() -> SemanticCache:
+  return SemanticCache()
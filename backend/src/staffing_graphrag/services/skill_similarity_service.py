@@ -0,0 +1,135 @@
+import logging
+import math
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import combinations
+from typing import Any
+
+from core.config import config
+from services.neo4j_service import get_neo4j_graph
+from services.schema_service import notify_graph_write
+
+logger = logging.getLogger(__name__)
+
+_WRITE_BATCH_SIZE = 1000
+
+
+class SkillSimilarityIndex:
+  """In-memory top-N neighbour lookup loaded from SIMILAR_TO relationships."""
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._neighbours: dict[str, dict[str, float]] | None = None
+
+  def _ensure_loaded(self) -> dict[str, dict[str, float]]:
+    if self._neighbours is not None:
+      return self._neighbours
+
+    with self._lock:
+      if self._neighbours is None:
+        rows = get_neo4j_graph().query("""
+          MATCH (a:Skill)-[sim:SIMILAR_TO]->(b:Skill)
+          RETURN a.id AS skill, collect([b.id, sim.score]) AS neighbours
+        """)
+        self._neighbours = {row["skill"]: dict(row["neighbours"]) for row in rows}
+        logger.info("Loaded skill similarity for %s skills", len(self._neighbours))
+    return self._neighbours
+
+  def invalidate(self) -> None:
+    with self._lock:
+      self._neighbours = None
+
+  def neighbours(self, skill_id: str) -> dict[str, float]:
+    return self._ensure_loaded().get(skill_id, {})
+
+  def neighbours_for(self, skill_ids: list[str]) -> dict[str, dict[str, float]]:
+    """Return the neighbour maps of the given skills, omitting skills without any."""
+    loaded = self._ensure_loaded()
+    return {skill: loaded[skill] for skill in skill_ids if skill in loaded}
+
+
+@lru_cache(maxsize=1)
+def get_skill_similarity_index() -> SkillSimilarityIndex:
+  return SkillSimilarityIndex()
+
+
+def similarity_edges(
+  baskets: Iterable[Iterable[str]], top_n: int, min_score: float
+) -> list[dict[str, Any]]:
+  """Top-N cosine neighbours of each skill from per-entity skill baskets.
+
+  Similarity is co(a, b) / sqrt(n(a) * n(b)), where co counts the baskets holding
+  both skills and n the baskets holding each one.
+  """
+  skill_counts: Counter[str] = Counter()
+  pair_counts: Counter[tuple[str, str]] = Counter()
+  for basket in baskets:
+    skills = sorted(set(basket))
+    skill_counts.update(skills)
+    pair_counts.update(combinations(skills, 2))
+
+  candidates: dict[str, list[tuple[float, str]]] = {}
+  for (a, b), co in pair_counts.items():
+    score = co / math.sqrt(skill_counts[a] * skill_counts[b])
+    if score < min_score:
+      continue
+    candidates.setdefault(a, []).append((score, b))
+    candidates.setdefault(b, []).append((score, a))
+
+  return [
+    {"source": source, "target": target, "score": round(score, 4)}
+    for source, scored in candidates.items()
+    for score, target in sorted(scored, reverse=True)[:top_n]
+  ]
+
+
+def rebuild_skill_similarity(
+  top_n: int = config.SKILL_SIMILARITY_TOP_N,
+  min_score: float = config.SKILL_SIMILARITY_MIN_SCORE,
+) -> dict[str, Any]:
+  """Rebuild the sparse skill x skill similarity matrix from graph co-occurrence.
+
+  Every person (HAS_SKILL) and every project or RFP (REQUIRES / NEEDS) is a basket of
+  skills, and similarity is the cosine of their co-occurrence counts (see
+  `similarity_edges`). Only the top-N neighbours of each skill above `min_score`
+  are kept, stored as (Skill)-[:SIMILAR_TO {score}]->(Skill).
+  """
+  graph = get_neo4j_graph()
+
+  # One basket per person, project or RFP
+  baskets = graph.query("""
+    MATCH (p:Person)-[:HAS_SKILL]->(s:Skill)
+    WITH p, collect(DISTINCT s.id) AS skills
+    RETURN skills
+    UNION ALL
+    MATCH (x)-[:REQUIRES|NEEDS]->(s:Skill)
+    WITH x, collect(DISTINCT s.id) AS skills
+    RETURN skills
+  """)
+  edges = similarity_edges((row["skills"] for row in baskets), top_n, min_score)
+  skills = {edge["source"] for edge in edges}
+
+  graph.query("MATCH (:Skill)-[sim:SIMILAR_TO]->(:Skill) DELETE sim")
+  write_cypher = """
+    UNWIND $edges AS edge
+    MATCH (a:Skill {id: edge.source})
+    MATCH (b:Skill {id: edge.target})
+    MERGE (a)-[sim:SIMILAR_TO]->(b)
+    SET sim.score = edge.score
+  """
+  for i in range(0, len(edges), _WRITE_BATCH_SIZE):
+    graph.query(write_cypher, params={"edges": edges[i : i + _WRITE_BATCH_SIZE]})
+
+  get_skill_similarity_index().invalidate()
+  notify_graph_write()
+  logger.info(
+    "Rebuilt skill similarity: %s edges for %s skills", len(edges), len(skills)
+  )
+
+  return {
+    "status": "success",
+    "skills": len(skills),
+    "edges": len(edges),
+  }
@@ -0,0 +1,144 @@
+import json
+import logging
+import threading
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from core.constants import SKILL_TAXONOMY_FILE
+from services.neo4j_service import get_neo4j_graph
+from services.schema_service import notify_graph_write
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(skill: str) -> str:
+  return skill.strip().title()
+
+
+def _load_edges() -> list[dict[str, str]]:
+  with SKILL_TAXONOMY_FILE.open("r", encoding="utf-8") as f:
+    raw: dict[str, list[str]] = json.load(f)
+
+  return [
+    {"source": _normalize(skill), "target": _normalize(implied)}
+    for skill, implied_skills in raw.items()
+    for implied in implied_skills
+  ]
+
+
+def sync_skill_taxonomy() -> dict[str, Any]:
+  """Mirror the local taxonomy file as (Skill)-[:IMPLIES]->(Skill) relationships.
+
+  The file is the source of truth: IMPLIES edges missing from it are removed.
+  Edges are only created between skills already in the graph, and the graph is
+  only reported as written when an edge was actually added or removed.
+  """
+  edges = _load_edges()
+
+  graph = get_neo4j_graph()
+  removed = graph.query(
+    """
+    MATCH (a:Skill)-[rel:IMPLIES]->(b:Skill)
+    WHERE NOT {source: a.id, target: b.id} IN $edges
+    DELETE rel
+    RETURN count(rel) AS count
+    """,
+    params={"edges": edges},
+  )[0]["count"]
+  created = graph.query(
+    """
+    UNWIND $edges AS edge
+    MATCH (a:Skill {id: edge.source})
+    MATCH (b:Skill {id: edge.target})
+    WHERE NOT (a)-[:IMPLIES]->(b)
+    CREATE (a)-[:IMPLIES]->(b)
+    RETURN count(*) AS count
+    """,
+    params={"edges": edges},
+  )[0]["count"]
+
+  get_skill_taxonomy().invalidate()
+  if removed or created:
+    notify_graph_write()
+  logger.info(
+    "Synced the skill taxonomy from %s: %s IMPLIES edges added, %s removed",
+    SKILL_TAXONOMY_FILE,
+    created,
+    removed,
+  )
+  return {
+    "status": "success",
+    "edges": len(edges),
+    "created": created,
+    "removed": removed,
+  }
+
+
+class SkillTaxonomy:
+  """Transitive closure of the taxonomy file, precomputed and kept in memory."""
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._implies: dict[str, frozenset[str]] | None = None
+    self._implied_by: dict[str, frozenset[str]] | None = None
+
+  def _ensure_loaded(
+    self,
+  ) -> tuple[dict[str, frozenset[str]], dict[str, frozenset[str]]]:
+    if self._implies is not None and self._implied_by is not None:
+      return self._implies, self._implied_by
+
+    with self._lock:
+      if self._implies is None or self._implied_by is None:
+        # Read from the file, so chains through skills not in the graph still hold
+        direct: dict[str, set[str]] = {}
+        for edge in _load_edges():
+          direct.setdefault(edge["source"], set()).add(edge["target"])
+
+        implies: dict[str, frozenset[str]] = {}
+        for skill, implied_directly in direct.items():
+          seen: set[str] = set()
+          stack = list(implied_directly)
+          while stack:
+            current = stack.pop()
+            if current in seen or current == skill:
+              continue
+            seen.add(current)
+            stack.extend(direct.get(current, ()))
+          implies[skill] = frozenset(seen)
+
+        implied_by: dict[str, set[str]] = {}
+        for skill, implied in implies.items():
+          for target in implied:
+            implied_by.setdefault(target, set()).add(skill)
+
+        self._implied_by = {k: frozenset(v) for k, v in implied_by.items()}
+        self._implies = implies
+        logger.info("Built skill taxonomy closure for %s skills", len(implies))
+
+    return self._implies, self._implied_by
+
+  def invalidate(self) -> None:
+    with self._lock:
+      self._implies = None
+      self._implied_by = None
+
+  def implied_skills(self, skills: Iterable[str]) -> set[str]:
+    """Return the skills implied by `skills` that are not already among them."""
+    implies, _ = self._ensure_loaded()
+    owned = set(skills)
+    expanded: set[str] = set()
+    for skill in owned:
+      expanded |= implies.get(skill, frozenset())
+    return expanded - owned
+
+  def implied_by_map(self, skills: Iterable[str]) -> dict[str, list[str]]:
+    """Map each given skill to the skills that (transitively) imply it."""
+    _, implied_by = self._ensure_loaded()
+    return {skill: sorted(implied_by[skill]) for skill in skills if skill in implied_by}
+
+
+@lru_cache(maxsize=1)
+def get_skill_taxonomy() -> SkillTaxonomy:
+  return SkillTaxonomy()
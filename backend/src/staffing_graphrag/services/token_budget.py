@@ -0,0 +1,27 @@
+import json
+import logging
+from typing import Any
+
+from core.config import config
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+  """Rough prompt token count (~4 characters per token), without a tokenizer."""
+  return len(text) // 4 + 1
+
+
+def trim_to_token_budget(
+  rows: list[dict[str, Any]], budget: int = config.QUERY_QA_TOKEN_BUDGET
+) -> list[dict[str, Any]]:
+  """Keep the leading rows that fit the QA prompt token budget."""
+  kept: list[dict[str, Any]] = []
+  used = 0
+  for row in rows:
+    used += estimate_tokens(json.dumps(row, default=str))
+    if used > budget:
+      logger.info("Trimmed QA context from %s to %s rows", len(rows), len(kept))
+      break
+    kept.append(row)
+  return kept
@@ -0,0 +1,5 @@
+import os
+
+# Config rejects empty credentials at import time; the tests never connect
+os.environ.setdefault("NEO4J_PASSWORD", "test")
+os.environ.setdefault("OPENAI_API_KEY", "test")
@@ -0,0 +1,48 @@
+from typing import Any
+
+import pytest
+
+from services import certification_index, schema_service
+from services.certification_index import CertificationIndex
+
+
+class FakeGraph:
+  def __init__(self) -> None:
+    self.rows = [{"person_id": "Ada", "certifications": ["AWS", "CKA"]}]
+    self.calls = 0
+
+  def query(self, cypher: str, params: dict[str, Any] | None = None) -> list[dict]:
+    self.calls += 1
+    return self.rows
+
+
+@pytest.fixture
+def graph(monkeypatch: pytest.MonkeyPatch) -> FakeGraph:
+  fake = FakeGraph()
+  monkeypatch.setattr(certification_index, "get_neo4j_graph", lambda: fake)
+  return fake
+
+
+def test_matching_returns_only_earned_certifications(graph: FakeGraph) -> None:
+  snapshot = CertificationIndex().snapshot()
+  mask = snapshot.mask_for(["CKA", "PMP"])
+
+  assert snapshot.matching("Ada", mask) == ["CKA"]
+  assert snapshot.matching("Grace", mask) == []
+
+
+def test_cleared_index_reloads_on_next_read(graph: FakeGraph) -> None:
+  index = CertificationIndex()
+  assert index.snapshot().mask_for(["PMP"]) == 0
+
+  graph.rows = [{"person_id": "Ada", "certifications": ["AWS", "CKA", "PMP"]}]
+  index.clear()
+  snapshot = index.snapshot()
+
+  assert snapshot.matching("Ada", snapshot.mask_for(["PMP"])) == ["PMP"]
+  assert index.snapshot() is snapshot
+
+
+def test_index_is_registered_as_a_write_listener() -> None:
+  index = certification_index.get_certification_index()
+  assert index.clear in schema_service._write_listeners
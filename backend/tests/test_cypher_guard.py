@@ -0,0 +1,58 @@
+from contextlib import nullcontext
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from services import cypher_guard
+from services.cypher_guard import CypherGuardError, check_plan
+
+
+def _operator(operator_type: str, rows: float, *children: dict) -> dict[str, Any]:
+  return {
+    "operatorType": operator_type,
+    "args": {"EstimatedRows": rows},
+    "children": list(children),
+  }
+
+
+class FakeDriver:
+  def __init__(self, plan: dict[str, Any]) -> None:
+    self.summary = SimpleNamespace(query_type="r", plan=plan)
+
+  def session(self, **_: object) -> nullcontext["FakeDriver"]:
+    return nullcontext(self)
+
+  def run(self, query: object) -> SimpleNamespace:
+    return SimpleNamespace(consume=lambda: self.summary)
+
+
+def _explain(monkeypatch: pytest.MonkeyPatch, plan: dict[str, Any]) -> None:
+  monkeypatch.setattr(cypher_guard, "get_neo4j_driver", lambda: FakeDriver(plan))
+
+
+def test_large_scan_below_a_limit_is_allowed(monkeypatch: pytest.MonkeyPatch) -> None:
+  scan = _operator("NodeByLabelScan@neo4j", 2_000_000)
+  _explain(
+    monkeypatch,
+    _operator("ProduceResults@neo4j", 100, _operator("Limit@neo4j", 100, scan)),
+  )
+
+  check_plan("MATCH (p:Person) RETURN p LIMIT 100")
+
+
+def test_large_result_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+  scan = _operator("NodeByLabelScan@neo4j", 2_000_000)
+  _explain(monkeypatch, _operator("ProduceResults@neo4j", 2_000_000, scan))
+
+  with pytest.raises(CypherGuardError, match="estimated"):
+    check_plan("MATCH (p:Person) RETURN p")
+
+
+def test_unlimited_all_nodes_scan_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+  scan = _operator("AllNodesScan@neo4j", 50_000)
+  top = _operator("Top@neo4j", 10, _operator("EagerAggregation@neo4j", 10, scan))
+  _explain(monkeypatch, _operator("ProduceResults@neo4j", 10, top))
+
+  with pytest.raises(CypherGuardError, match="every node"):
+    check_plan("MATCH (n) RETURN labels(n), count(*) AS c ORDER BY c DESC LIMIT 10")
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+
+from services import data_version
+from services.data_version import (
+  bump_data_version,
+  get_data_version,
+  reserve_data_version,
+)
+
+
+@pytest.fixture(autouse=True)
+def version_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+  monkeypatch.setattr(data_version, "DATA_VERSION_FILE", tmp_path / "data_version")
+
+
+def test_concurrent_writes_reserve_distinct_versions() -> None:
+  with reserve_data_version() as first, reserve_data_version() as second:
+    assert first != second
+    # Neither write is published while it is in flight
+    assert get_data_version() == first - 1
+
+  assert get_data_version() == second
+
+
+def test_version_waits_for_the_oldest_write_in_flight() -> None:
+  with reserve_data_version() as first:
+    with reserve_data_version() as second:
+      pass
+    bump_data_version()
+    # The newer write finished, but nodes stamped `first` may still be missing
+    assert get_data_version() == first - 1
+
+  assert get_data_version() == second + 1
@@ -0,0 +1,15 @@
+from services.query_service import _direct_answer
+
+ROWS = [{"name": f"Person {i}"} for i in range(20)]
+
+
+def test_direct_answer_counts_the_whole_result() -> None:
+  answer = _direct_answer(ROWS, ROWS)
+
+  assert answer is not None
+  assert answer.startswith("Name (20):")
+  assert "Person 19" in answer
+
+
+def test_truncated_result_goes_to_the_qa_model() -> None:
+  assert _direct_answer(ROWS, ROWS[:10]) is None
@@ -0,0 +1,64 @@
+import threading
+
+import pytest
+
+from repositories import system_repository
+from repositories.system_repository import GraphStatsCache
+
+
+@pytest.fixture
+def collected(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+  calls: list[int] = []
+
+  def collect() -> dict[str, int]:
+    calls.append(1)
+    return {"call": len(calls)}
+
+  monkeypatch.setattr(system_repository, "_collect_metadata", collect)
+  monkeypatch.setattr(system_repository, "get_data_version", lambda: 1)
+  return calls
+
+
+@pytest.fixture
+def threads(monkeypatch: pytest.MonkeyPatch) -> list[threading.Thread]:
+  started: list[threading.Thread] = []
+  start_thread = threading.Thread.start
+
+  def start(thread: threading.Thread) -> None:
+    started.append(thread)
+    start_thread(thread)
+
+  monkeypatch.setattr(threading.Thread, "start", start)
+  return started
+
+
+def test_metadata_is_cached_per_data_version(
+  monkeypatch: pytest.MonkeyPatch,
+  collected: list[int],
+  threads: list[threading.Thread],
+) -> None:
+  cache = GraphStatsCache()
+
+  assert cache.get() == (1, {"call": 1})
+  assert cache.get() == (1, {"call": 1})
+  assert threads == []
+
+  monkeypatch.setattr(system_repository, "get_data_version", lambda: 2)
+  assert cache.get() == (1, {"call": 1})
+  threads[0].join(timeout=5)
+  assert cache.get() == (2, {"call": 2})
+  assert collected == [1, 1]
+
+
+def test_old_metadata_is_served_while_refreshing(
+  monkeypatch: pytest.MonkeyPatch,
+  collected: list[int],
+  threads: list[threading.Thread],
+) -> None:
+  cache = GraphStatsCache()
+  cache.get()
+  monkeypatch.setattr(system_repository.config, "STATS_CACHE_TTL_SECONDS", 0)
+
+  assert cache.get() == (1, {"call": 1})
+  threads[0].join(timeout=5)
+  assert cache.get() == (1, {"call": 2})
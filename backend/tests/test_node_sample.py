@@ -0,0 +1,86 @@
+import random
+from typing import Any
+
+import pytest
+
+from repositories import system_repository
+from repositories.system_repository import get_node_sample
+
+# Every third node has no properties at all
+NODES = [{"name": f"P{i}"} if i % 3 else {} for i in range(1000)]
+MAX_CANDIDATES = 200
+
+
+class FakeGraph:
+  def __init__(self) -> None:
+    self.queries: list[str] = []
+    self.params: list[dict[str, Any]] = []
+    self.rng = random.Random(0)
+
+  def query(
+    self, query: str, params: dict[str, Any] | None = None
+  ) -> list[dict[str, Any]]:
+    self.queries.append(query)
+    if "count(n)" in query:
+      return [{"count": len(NODES)}]
+    params = params or {}
+    self.params.append(params)
+    stratified = "EXISTS" in query
+    rows = [
+      {"n": node, "stratum": i % 2 == 0 if stratified else None}
+      for i, node in enumerate(NODES)
+      if self.rng.random() < params["rate"]
+    ]
+    return rows[: params["max_candidates"]]
+
+
+@pytest.fixture
+def graph(monkeypatch: pytest.MonkeyPatch) -> FakeGraph:
+  graph = FakeGraph()
+  monkeypatch.setattr(system_repository, "get_neo4j_graph", lambda: graph)
+  monkeypatch.setattr(system_repository.config, "SAMPLE_MAX_CANDIDATES", MAX_CANDIDATES)
+  return graph
+
+
+def test_large_label_is_sampled_in_one_bounded_scan(graph: FakeGraph) -> None:
+  limit = 30
+  samples = get_node_sample("Person", limit=limit, seed=1)
+
+  assert len(samples) == limit
+  assert {} in samples
+  # One count-store lookup, then a single thinned scan
+  assert len(graph.params) == 1
+  assert len(graph.queries) == len(graph.params) + 1
+  assert graph.params[0] == {
+    "rate": MAX_CANDIDATES / (2 * len(NODES)),
+    "max_candidates": MAX_CANDIDATES,
+  }
+  assert all("SKIP" not in query and "id(n)" not in query for query in graph.queries)
+
+
+def test_small_label_is_read_whole(
+  graph: FakeGraph, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  monkeypatch.setattr(system_repository.config, "SAMPLE_MAX_CANDIDATES", len(NODES))
+  get_node_sample("Person", limit=2, seed=1)
+
+  assert graph.params[0]["rate"] == 1
+
+
+def test_sample_projects_the_selected_fields(graph: FakeGraph) -> None:
+  get_node_sample("Person", limit=2, fields=["name"], seed=1)
+
+  assert "n {.`name`}" in graph.queries[-1]
+
+
+def test_stratified_sample_fills_both_strata(graph: FakeGraph) -> None:
+  limit = 5
+  samples = get_node_sample("Person", limit=limit, stratify_by="HAS_SKILL", seed=1)
+
+  strata = [sample["_stratum"] for sample in samples]
+  assert strata.count("with HAS_SKILL") == strata.count("without HAS_SKILL") == limit
+
+
+def test_invalid_field_name_is_rejected(graph: FakeGraph) -> None:
+  assert get_node_sample("Person", fields=["name}) DETACH DELETE n //"]) == []
+  assert graph.queries == []
@@ -0,0 +1,76 @@
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+
+from services import experience_service
+from services.experience_service import recompute_proven_experience
+
+TODAY = date.today()
+
+
+class FakeGraph:
+  def __init__(self, history: list[dict]) -> None:
+    self.history = history
+    self.queries: list[tuple[str, dict]] = []
+
+  def query(self, cypher: str, params: dict[str, Any] | None = None) -> list[dict]:
+    self.queries.append((cypher, params or {}))
+    if "RETURN u.id AS person_id" in cypher:
+      return [{"person_id": "Ada", "history": self.history}]
+    return []
+
+  def written(self) -> dict:
+    return self.queries[-1][1]["updates"][0]
+
+
+def _use(monkeypatch: pytest.MonkeyPatch, graph: FakeGraph) -> None:
+  monkeypatch.setattr(experience_service, "get_neo4j_graph", lambda: graph)
+  monkeypatch.setattr(experience_service, "notify_graph_write", lambda: None)
+
+
+def test_only_completed_or_finished_work_is_proven(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  graph = FakeGraph(
+    [
+      {"skill": "Python", "status": "completed", "end_date": None},
+      {
+        "skill": "Go",
+        "status": "active",
+        "end_date": str(TODAY - timedelta(days=1)),
+      },
+      {
+        "skill": "Rust",
+        "status": "planned",
+        "end_date": str(TODAY + timedelta(days=90)),
+      },
+      {"skill": "Kotlin", "status": "active", "end_date": None},
+    ]
+  )
+  _use(monkeypatch, graph)
+
+  assert recompute_proven_experience(["Ada"]) == 1
+  assert graph.written()["skills"] == ["Go", "Python"]
+
+
+def test_targeted_recompute_starts_from_the_given_ids(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  graph = FakeGraph([])
+  _use(monkeypatch, graph)
+
+  recompute_proven_experience(project_ids=["p-1"])
+  cypher, params = graph.queries[0]
+
+  assert "MATCH (u:Person) RETURN u" not in cypher
+  assert "{id: project_id}" in cypher
+  assert params["project_ids"] == ["p-1"]
+
+
+def test_empty_selection_recomputes_nobody(monkeypatch: pytest.MonkeyPatch) -> None:
+  graph = FakeGraph([])
+  _use(monkeypatch, graph)
+
+  assert recompute_proven_experience(person_keys=[]) == 0
+  assert graph.queries == []
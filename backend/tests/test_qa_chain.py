@@ -0,0 +1,48 @@
+import asyncio
+import threading
+
+import pytest
+
+from services import query_service
+
+
+@pytest.fixture
+def holder(monkeypatch: pytest.MonkeyPatch) -> query_service.QAChainHolder:
+  holder = query_service.QAChainHolder()
+  monkeypatch.setattr(query_service, "get_qa_chain_holder", lambda: holder)
+  monkeypatch.setattr(query_service, "refresh_schema", lambda: None)
+  return holder
+
+
+def test_stale_schema_serves_current_chain_while_rebuilding(
+  monkeypatch: pytest.MonkeyPatch, holder: query_service.QAChainHolder
+) -> None:
+  release = threading.Event()
+  builds: list[object] = []
+
+  def build(llm: object) -> str:
+    builds.append(llm)
+    release.wait(timeout=5)
+    return "new chain"
+
+  holder.chain = "old chain"  # type: ignore[assignment]
+  monkeypatch.setattr(query_service, "is_schema_stale", lambda: True)
+  monkeypatch.setattr(query_service, "_build_qa_chain", build)
+
+  assert asyncio.run(query_service._get_qa_chain()) == "old chain"
+  # A second stale request does not start another rebuild
+  assert asyncio.run(query_service._get_qa_chain()) == "old chain"
+
+  release.set()
+  assert holder._rebuilding.acquire(timeout=5)
+  assert holder.chain == "new chain"
+  assert len(builds) == 1
+
+
+def test_first_query_builds_the_chain(
+  monkeypatch: pytest.MonkeyPatch, holder: query_service.QAChainHolder
+) -> None:
+  monkeypatch.setattr(query_service, "is_schema_stale", lambda: True)
+  monkeypatch.setattr(query_service, "_build_qa_chain", lambda _: "chain")
+
+  assert asyncio.run(query_service._get_qa_chain()) == "chain"
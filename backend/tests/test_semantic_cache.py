@@ -0,0 +1,102 @@
+from typing import Any
+
+import pytest
+
+from services import query_router, semantic_cache
+from services.query_router import EntityIndex
+from services.semantic_cache import SemanticCache, _mentions
+
+FINGERPRINT = "schema"
+ENTITIES = {
+  "Skill": ["React", "Vue", "Python", "Django", "Java", "Javascript"],
+  "Location": ["Berlin", "Munich"],
+  "Company": ["Google", "Meta"],
+}
+
+
+class FakeGraph:
+  def query(self, cypher: str, params: dict[str, Any] | None = None) -> list[dict]:
+    label = cypher.split(":", 2)[1].split(")", 1)[0]
+    return [{"id": entity_id} for entity_id in ENTITIES[label]]
+
+
+class FakeCypherCache:
+  def __init__(self, entries: list[tuple[str, str, float]]) -> None:
+    self._entries = entries
+
+  def entries(self, fingerprint: str) -> list[tuple[str, str, float]]:
+    return list(self._entries) if fingerprint == FINGERPRINT else []
+
+
+def cache_with(
+  monkeypatch: pytest.MonkeyPatch, question: str, cypher: str
+) -> SemanticCache:
+  fake = FakeCypherCache([(question, cypher, 1000.0)])
+  entity_index = EntityIndex()
+  monkeypatch.setattr(semantic_cache, "get_cypher_cache", lambda: fake)
+  monkeypatch.setattr(semantic_cache, "get_entity_index", lambda: entity_index)
+  monkeypatch.setattr(query_router, "get_neo4j_graph", FakeGraph)
+  monkeypatch.setattr(semantic_cache.config, "QUERY_SEMANTIC_CACHE_THRESHOLD", 0.72)
+  return SemanticCache()
+
+
+@pytest.mark.parametrize(
+  ("cached", "question"),
+  [
+    (
+      "who is currently assigned to a project",
+      "Who is not currently assigned to a project?",
+    ),
+    ("most common certifications", "least common certifications"),
+    ("what universities did people attend", "What companies did people attend?"),
+    ("top 5 skills by number of people", "Top 10 skills by number of people"),
+  ],
+)
+def test_lookup_rejects_questions_with_different_meaning(
+  monkeypatch: pytest.MonkeyPatch, cached: str, question: str
+) -> None:
+  cache = cache_with(monkeypatch, cached, "MATCH (n) RETURN n")
+
+  assert cache.lookup(question, FINGERPRINT) is None
+
+
+def test_lookup_accepts_paraphrase(monkeypatch: pytest.MonkeyPatch) -> None:
+  cypher = "MATCH (p:Person)-[:HAS_SKILL]->(:Skill {id: 'React'}) RETURN p"
+  cache = cache_with(monkeypatch, "who knows react", cypher)
+
+  hit = cache.lookup("Which people have React skills?", FINGERPRINT)
+
+  assert hit is not None
+  assert hit.cypher == cypher
+
+
+def test_lookup_rejects_other_literal(monkeypatch: pytest.MonkeyPatch) -> None:
+  cypher = "MATCH (p:Person)-[:HAS_SKILL]->(:Skill {id: 'React'}) RETURN p"
+  cache = cache_with(monkeypatch, "who knows react", cypher)
+
+  assert cache.lookup("Who knows Vue?", FINGERPRINT) is None
+
+
+@pytest.mark.parametrize(
+  ("cached", "literal", "question"),
+  [
+    ("who has react skills", "React", "Who has React and Vue skills?"),
+    ("who knows python", "Python", "Who knows Python and Django?"),
+    ("who is located in berlin", "Berlin", "Who is located in Berlin or Munich?"),
+    ("who worked at google", "Google", "Who worked at Google and Meta?"),
+  ],
+)
+def test_lookup_requires_the_same_entities(
+  monkeypatch: pytest.MonkeyPatch, cached: str, literal: str, question: str
+) -> None:
+  cypher = f"MATCH (p:Person)--(n {{id: '{literal}'}}) RETURN p"
+  cache = cache_with(monkeypatch, cached, cypher)
+
+  assert cache.lookup(question, FINGERPRINT) is None
+  assert cache.lookup(cached, FINGERPRINT) is not None
+
+
+def test_literals_match_whole_words() -> None:
+  assert _mentions("who knows java and sql", "Java")
+  assert not _mentions("who knows javascript", "Java")
+  assert _mentions("who knows node.js", "Node.js")
@@ -0,0 +1,68 @@
+from typing import Any
+
+import pytest
+
+from services import skill_similarity_service
+from services.skill_similarity_service import rebuild_skill_similarity, similarity_edges
+
+BASKETS = [
+  ["Python", "Django"],
+  ["Python", "Django", "Docker"],
+  ["Java", "Spring"],
+  ["Java", "Spring", "Docker"],
+  ["Python"],
+]
+
+
+def scores(edges: list[dict[str, Any]]) -> dict[tuple[str, str], float]:
+  return {(edge["source"], edge["target"]): edge["score"] for edge in edges}
+
+
+def test_similarity_counts_co_occurrence_per_basket() -> None:
+  edges = scores(similarity_edges(BASKETS, top_n=5, min_score=0.0))
+
+  # Django appears in 2 baskets, Python in 3, together in 2
+  assert edges["Django", "Python"] == pytest.approx(2 / (2 * 3) ** 0.5, abs=1e-4)
+  assert edges["Java", "Spring"] == pytest.approx(1.0)
+  # Never in the same basket: no similarity at all
+  assert ("Django", "Spring") not in edges
+  assert ("Python", "Java") not in edges
+
+
+def test_similarity_is_symmetric_and_respects_thresholds() -> None:
+  edges = scores(similarity_edges(BASKETS, top_n=1, min_score=0.6))
+
+  assert edges == {
+    ("Django", "Python"): pytest.approx(0.8165),
+    ("Python", "Django"): pytest.approx(0.8165),
+    ("Java", "Spring"): pytest.approx(1.0),
+    ("Spring", "Java"): pytest.approx(1.0),
+  }
+
+
+class FakeGraph:
+  def __init__(self, baskets: list[list[str]]) -> None:
+    self.baskets = baskets
+    self.written: list[dict[str, Any]] = []
+
+  def query(self, cypher: str, params: dict[str, Any] | None = None) -> list[Any]:
+    if "RETURN skills" in cypher:
+      return [{"skills": basket} for basket in self.baskets]
+    if params and "edges" in params:
+      self.written.extend(params["edges"])
+    return []
+
+
+def test_rebuild_writes_edges_from_each_entity_basket(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  graph = FakeGraph(BASKETS)
+  monkeypatch.setattr(skill_similarity_service, "get_neo4j_graph", lambda: graph)
+  monkeypatch.setattr(skill_similarity_service, "notify_graph_write", lambda: None)
+
+  result = rebuild_skill_similarity(top_n=5, min_score=0.0)
+
+  written = scores(graph.written)
+  assert result["edges"] == len(graph.written)
+  assert ("Django", "Spring") not in written
+  assert written["Docker", "Spring"] == pytest.approx(0.5)
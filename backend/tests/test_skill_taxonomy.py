@@ -0,0 +1,35 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from services import skill_taxonomy_service
+from services.skill_taxonomy_service import SkillTaxonomy
+
+
+@pytest.fixture
+def taxonomy(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> SkillTaxonomy:
+  taxonomy_file = tmp_path / "skill_taxonomy.json"
+  taxonomy_file.write_text(
+    json.dumps(
+      {
+        "next.js": ["React"],
+        "React": ["Javascript"],
+        "Typescript": ["Javascript"],
+      }
+    ),
+    encoding="utf-8",
+  )
+  monkeypatch.setattr(skill_taxonomy_service, "SKILL_TAXONOMY_FILE", taxonomy_file)
+  return SkillTaxonomy()
+
+
+def test_closure_is_transitive_and_normalized(taxonomy: SkillTaxonomy) -> None:
+  assert taxonomy.implied_skills(["Next.Js"]) == {"React", "Javascript"}
+  assert taxonomy.implied_skills(["React", "Javascript"]) == set()
+
+
+def test_implied_by_map_lists_transitive_sources(taxonomy: SkillTaxonomy) -> None:
+  assert taxonomy.implied_by_map(["Javascript", "Python"]) == {
+    "Javascript": ["Next.Js", "React", "Typescript"]
+  }
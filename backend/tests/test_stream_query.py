@@ -0,0 +1,43 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from services import query_service
+from services.query_router import TemplateMatch
+
+ROWS = [{"name": "Ada"}, {"name": "Linus"}]
+
+
+class FakeGraph:
+  def query(self, cypher: str, params: dict[str, str]) -> list[dict[str, Any]]:
+    return ROWS
+
+
+def test_template_route_streams_every_stage(monkeypatch: pytest.MonkeyPatch) -> None:
+  match = TemplateMatch(
+    intent="people_with_skill",
+    cypher="MATCH (p:Person)-[:HAS_SKILL]->(:Skill {id: $skill}) RETURN p.name AS name",
+    params={"skill": "Python"},
+    answer=lambda rows: f"{len(rows)} people",
+  )
+  monkeypatch.setattr(query_service.query_router, "match_question", lambda _: match)
+  monkeypatch.setattr(query_service, "get_neo4j_graph", FakeGraph)
+  monkeypatch.setattr(query_service.config, "QUERY_LOG_ENABLED", False)
+
+  async def collect() -> list[dict[str, Any]]:
+    return [event async for event in query_service.stream_query("Who knows Python?")]
+
+  events = asyncio.run(collect())
+
+  assert [event["event"] for event in events] == [
+    "cypher",
+    "row_count",
+    "rows",
+    "answer",
+    "done",
+  ]
+  assert '"Python"' in events[0]["cypher_query"]
+  assert events[1]["row_count"] == len(ROWS)
+  assert events[3]["answer"] == "2 people"
+  assert events[4]["timings"]["execution"] is not None
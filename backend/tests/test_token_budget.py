@@ -0,0 +1,15 @@
+from services.token_budget import estimate_tokens, trim_to_token_budget
+
+
+def test_estimate_tokens_counts_about_four_characters_per_token() -> None:
+  assert estimate_tokens("") == 1
+  assert estimate_tokens("x" * 400) == 400 // 4 + 1
+
+
+def test_trim_keeps_leading_rows_within_budget() -> None:
+  # Each row serializes to 48 characters, about 13 tokens
+  rows = [{"name": "x" * 36} for _ in range(10)]
+
+  kept = trim_to_token_budget(rows, budget=50)
+
+  assert kept == rows[:3]
@@ -1,30 +1,65 @@
+import json
+from collections.abc import Iterator
+from typing import Any
+
 import httpx
 
 from config import API_BASE_URL
 
 TIMEOUT = 60.0  # PDF processing can take time
+PAGE_SIZE = 500
+
+# (url, params) -> (ETag, body, next cursor); survives Streamlit reruns
+_conditional_cache: dict[str, tuple[str, Any, str | None]] = {}
+
+
+def _conditional_get(
+  client: httpx.Client, path: str, params: dict | None = None
+) -> tuple[Any, str | None]:
+  """GET with If-None-Match, reusing the cached body when the graph is unchanged.
+
+  Returns the JSON body and the X-Next-Cursor header.
+  """
+  key = f"{path}?{sorted((params or {}).items())}"
+  cached = _conditional_cache.get(key)
+  headers = {"If-None-Match": cached[0]} if cached else {}
+
+  response = client.get(f"{API_BASE_URL}{path}", params=params, headers=headers)
+  if response.status_code == 304 and cached:
+    return cached[1], cached[2]
+  response.raise_for_status()
+
+  body = response.json()
+  cursor = response.headers.get("X-Next-Cursor")
+  if etag := response.headers.get("ETag"):
+    _conditional_cache[key] = (etag, body, cursor)
+  return body, cursor
+
+
+def _get_all_pages(path: str, params: dict | None = None) -> list[dict]:
+  """Follow the X-Next-Cursor header of a paginated entity list to its end."""
+  params = {**(params or {}), "limit": PAGE_SIZE}
+  items: list[dict] = []
+  with httpx.Client(timeout=TIMEOUT) as client:
+    while True:
+      page, cursor = _conditional_get(client, path, params)
+      items.extend(page)
+      if not cursor:
+        return items
+      params["cursor"] = cursor
 
 
 def get_programmers(status: str | None = None) -> list[dict]:
   params = {"status": status} if status else {}
-  with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.get(f"{API_BASE_URL}/entities/programmers", params=params)
-    response.raise_for_status()
-    return response.json()
+  return _get_all_pages("/entities/programmers", params)
 
 
 def get_projects() -> list[dict]:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.get(f"{API_BASE_URL}/entities/projects")
-    response.raise_for_status()
-    return response.json()
+  return _get_all_pages("/entities/projects")
 
 
 def get_rfps() -> list[dict]:
-  with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.get(f"{API_BASE_URL}/entities/rfps")
-    response.raise_for_status()
-    return response.json()
+  return _get_all_pages("/entities/rfps")
 
 
 def upload_cv(filename: str, content: bytes) -> dict:
@@ -53,9 +88,7 @@ def upload_projects(filename: str, content: bytes) -> dict:
 
 def get_graph_stats() -> dict:
   with httpx.Client(timeout=TIMEOUT) as client:
-    response = client.get(f"{API_BASE_URL}/info/stats")
-    response.raise_for_status()
-    return response.json()
+    return _conditional_get(client, "/info/stats")[0]
 
 
 def get_node_sample(label: str) -> list[dict]:
@@ -72,6 +105,25 @@ def query_knowledge_graph(question: str) -> dict:
     return response.json()
 
 
+def stream_query_knowledge_graph(question: str) -> Iterator[tuple[str, dict]]:
+  """Yield (event, data) pairs from the server-sent events of the streaming query."""
+  with (
+    httpx.Client(timeout=TIMEOUT) as client,
+    client.stream(
+      "POST", f"{API_BASE_URL}/query/stream", json={"question": question}
+    ) as response,
+  ):
+    if response.is_error:
+      response.read()  # make the error body available to the caller
+    response.raise_for_status()
+    event = "message"
+    for line in response.iter_lines():
+      if line.startswith("event: "):
+        event = line.removeprefix("event: ")
+      elif line.startswith("data: "):
+        yield event, json.loads(line.removeprefix("data: "))
+
+
 def get_example_queries() -> dict[str, list[str]]:
   with httpx.Client(timeout=TIMEOUT) as client:
     response = client.get(f"{API_BASE_URL}/query/examples")
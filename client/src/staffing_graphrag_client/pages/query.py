@@ -1,7 +1,7 @@
 import httpx
 import streamlit as st
 
-from api.client import get_example_queries, query_knowledge_graph
+from api.client import get_example_queries, stream_query_knowledge_graph
 from utils.utils import set_backgroud
 
 if "query_history" not in st.session_state:
@@ -14,17 +14,41 @@ if "pending_query" not in st.session_state:
 def execute_query(question: str):
   st.session_state.query_history.append({"role": "user", "content": question})
 
+  with st.chat_message("user"):
+    st.markdown(question)
+
   try:
-    result = query_knowledge_graph(question)
-    st.session_state.query_history.append(
-      {
-        "role": "assistant",
-        "content": result.get("answer", "No answer returned."),
-        "cypher": result.get("cypher_query", ""),
-        "success": result.get("success", False),
-        "error": result.get("error"),
-      }
-    )
+    message = {"role": "assistant", "content": "", "cypher": "", "rows": []}
+
+    with st.chat_message("assistant"):
+      progress = st.empty()
+      progress.caption("Generating Cypher...")
+
+      def answer_stream():
+        for event, data in stream_query_knowledge_graph(question):
+          if event == "cypher":
+            message["cypher"] = data.get("cypher_query", "")
+            progress.caption("Running query...")
+          elif event == "row_count":
+            progress.caption(f"Found {data['row_count']} rows, answering...")
+          elif event == "rows":
+            message["rows"] = data.get("rows", [])
+          elif event == "answer":
+            yield data["answer"]
+          elif event == "token":
+            yield data["text"]
+          elif event == "error":
+            message["error"] = data.get("error")
+
+      answer = st.write_stream(answer_stream())
+      progress.empty()
+
+    if message.get("error"):
+      message.update(content="I encountered an error processing your query.")
+      message["success"] = False
+    else:
+      message.update(content=answer or "No answer returned.", success=True)
+    st.session_state.query_history.append(message)
   except httpx.HTTPStatusError as e:
     try:
       detail = e.response.json().get("detail", str(e))
@@ -107,6 +131,11 @@ def render_chat_history():
             with st.expander("🔧 Cypher Query"):
               st.code(cypher, language="cypher")
 
+          rows = msg.get("rows", [])
+          if rows:
+            with st.expander(f"📊 Result Rows ({len(rows)})"):
+              st.dataframe(rows, use_container_width=True)
+
 
 def render_quick_examples():
   if st.session_state.query_history:
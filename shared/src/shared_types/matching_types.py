@@ -11,10 +11,14 @@ class CandidateMatch(BaseModel):
   skill_match_percent: float
   missing_mandatory_skills: list[str] = Field(default_factory=list)
   missing_optional_skills: list[str] = Field(default_factory=list)
+  matched_certifications: list[str] = Field(default_factory=list)
+  experience_score: float = 0
   status: Literal["available", "available_soon", "unavailable"]
   days_until_available: int | None = None
   current_project_end_date: str | None = None
   current_project_name: str | None = None
+  location: str | None = None
+  distance_km: float | None = None
 
 
 class MatchResponse(BaseModel):
@@ -16,3 +16,7 @@ class ProgrammerRead(BaseModel):
       "Beginner": [],
     }
   )
+  implied_skills: list[str] = Field(
+    default_factory=list,
+    description="Skills implied by the declared ones through the skill taxonomy",
+  )
@@ -14,4 +14,6 @@ class RFPRead(BaseModel):
   title: str | None = None
   client: str | None = None
   budget: str | None = None
+  location: str | None = None
+  remote_allowed: bool | None = None
   needed_skills: list[_RFPSkillRequirement] = Field(default_factory=list)
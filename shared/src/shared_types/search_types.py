@@ -0,0 +1,23 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+EntityType = Literal["person", "skill", "project", "rfp"]
+
+
+class SearchHit(BaseModel):
+  type: EntityType
+  id: str
+  title: str | None = None
+  snippet: str | None = Field(
+    None, description="Start of the bio or description, when the entity has one"
+  )
+  score: float
+
+
+class SearchResults(BaseModel):
+  query: str
+  hits: list[SearchHit] = Field(default_factory=list)
+  next_offset: int | None = Field(
+    None, description="Offset of the next page; absent on the last page"
+  )